@@ -0,0 +1,138 @@
+"""
+엑셀 로드 벤치마크 - 실행 시작 시 엑셀 데이터 준비 시간
+
+- 넓은 시트 (200컬럼 중 4컬럼 사용): 전체 읽기 후 컬럼 선택 / 읽을 때 컬럼 제외 (CSV usecols, 엑셀 openpyxl 읽기 전용)
+- 긴 시트 (가운데 100행만 사용): 전체 읽기 후 행 선택 / 범위만 읽기 (CSV nrows, 엑셀 min_row/max_row) / 스트리밍
+- 캐시 없음 / 캐시 사용 (pickle) / 메모리 (같은 관리자에서 다시 로드)
+- 행 조회 (get_row_data): 첫 조회 / 이후 조회 (메모리에 유지한 로드 결과)
+
+실행: python benchmarks/bench_excel.py [행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.excel_manager import ExcelManager
+from core.excel_cache import ExcelCache
+
+
+ROWS = 20000
+WIDE_COLUMNS = 200
+TALL_COLUMNS = 12
+USED_COLUMNS = 4
+WINDOW_ROWS = 100  # 사용할 행 범위 크기 (시트 가운데부터)
+ROW_LOOKUPS = 1000
+
+
+def create_fixture(folder, rows, columns, ext='xlsx'):
+    """벤치마크용 엑셀/CSV 파일 생성"""
+    filepath = os.path.join(folder, f"fixture_{rows}x{columns}.{ext}")
+    data = {f"col_{i + 1}": [f"값{row}_{i}" if i % 2 else row for row in range(rows)] for i in range(columns)}
+    df = pd.DataFrame(data)
+    if ext == 'csv':
+        df.to_csv(filepath, index=False)
+    else:
+        df.to_excel(filepath, sheet_name='Sheet1', index=False)
+    return filepath
+
+
+def create_manager(folder, filepath, columns):
+    """임시 폴더를 쓰는 엑셀 관리자"""
+    excel_mgr = ExcelManager()
+    excel_mgr.excel_folder = folder
+    excel_mgr.cache = ExcelCache(os.path.join(folder, '.cache'))
+    excel_mgr.load_from_list([{
+        'id': 1,
+        'name': 'fixture',
+        'filepath': os.path.basename(filepath),
+        'sheet_name': 'Sheet1',
+        'columns': columns,
+        'row_count': 0
+    }])
+    return excel_mgr
+
+
+def timed(func):
+    """실행 시간 (초)"""
+    start_time = time.perf_counter()
+    result = func()
+    assert result is not None
+    return time.perf_counter() - start_time
+
+
+def read_full(filepath, columns, start_row=0, end_row=None):
+    """이전 방식: 전체를 읽은 뒤 컬럼/행 선택"""
+    if filepath.endswith('.csv'):
+        df = pd.read_csv(filepath)
+    else:
+        df = pd.read_excel(filepath, sheet_name='Sheet1')
+    return df[columns].iloc[start_row:end_row]
+
+
+def stream(excel_mgr, start_row, end_row):
+    """스트리밍으로 범위 행 모두 읽기"""
+    return list(excel_mgr.iter_rows(1, start_row, end_row))
+
+
+def report(label, seconds, baseline=None):
+    """결과 한 줄 출력"""
+    ratio = f"{baseline / max(seconds, 1e-9):>9.1f}x" if baseline else ''
+    print(f"{label:<36}{seconds:>10.3f}{ratio}")
+
+
+def bench_file(folder, rows, columns, ext):
+    """파일 하나에 대한 방식별 시간"""
+    filepath = create_fixture(folder, rows, columns, ext)
+    used = [f"col_{i + 1}" for i in range(USED_COLUMNS)]
+    window_range = (rows // 2, rows // 2 + WINDOW_ROWS)
+
+    def fresh():
+        """캐시/메모리에 로드 결과가 없는 관리자 (측정마다 새로 만들어 이전 로드 영향 제외)"""
+        excel_mgr = create_manager(folder, filepath, used)
+        excel_mgr.use_cache = False
+        return excel_mgr
+
+    print(f"\n📊 {os.path.basename(filepath)} ({rows}행 x {columns}컬럼, {USED_COLUMNS}컬럼 사용)")
+    print(f"{'방식':<36}{'시간(초)':>10}{'배율':>10}")
+
+    full = timed(lambda: read_full(filepath, used))
+    report('전체 읽기 후 컬럼 선택', full)
+    excel_mgr = fresh()
+    report('컬럼만 읽기', timed(lambda: excel_mgr.load_excel_data(1)), full)
+
+    window = timed(lambda: read_full(filepath, used, *window_range))
+    report(f'전체 읽기 후 {window_range[0]}~{window_range[1]}행 선택', window)
+    excel_mgr = fresh()
+    report('범위만 읽기', timed(lambda: excel_mgr.load_excel_data(1, *window_range)), window)
+    excel_mgr = fresh()
+    report('스트리밍 (iter_rows)', timed(lambda: stream(excel_mgr, *window_range)), window)
+
+    # 캐시 파일은 새 관리자로 읽어야 메모리(LRU)가 아닌 pickle 로드 시간
+    saving = create_manager(folder, filepath, used)
+    report('첫 실행 (캐시 저장)', timed(lambda: saving.load_excel_data(1)), full)
+    cached = create_manager(folder, filepath, used)
+    report('캐시 사용 (pickle)', timed(lambda: cached.load_excel_data(1)), full)
+    report('메모리 (LRU)', timed(lambda: cached.load_excel_data(1)), full)
+
+    lookup = create_manager(folder, filepath, used)
+    lookup.use_cache = False
+    report('행 조회: 첫 조회 (로드 + 변환)', timed(lambda: lookup.get_row_data(1, 0)))
+    report(f'행 조회: 이후 {ROW_LOOKUPS}회',
+           timed(lambda: [lookup.get_row_data(1, i % rows) for i in range(ROW_LOOKUPS)]))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    with tempfile.TemporaryDirectory() as folder:
+        bench_file(folder, rows // 4, WIDE_COLUMNS, 'xlsx')
+        bench_file(folder, rows, TALL_COLUMNS, 'xlsx')
+        bench_file(folder, rows, WIDE_COLUMNS, 'csv')
+
+
+if __name__ == '__main__':
+    main()
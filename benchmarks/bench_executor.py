@@ -0,0 +1,110 @@
+"""
+실행 엔진 액션당 오버헤드 벤치마크 - 매번 해석(execute_action) vs 컴파일된 실행 계획
+
+입력은 RecordingBackend로 기록만 하고, pyperclip / time.sleep 을 아무것도 하지 않는 함수로 바꿔서
+입력 장치와 대기 시간을 뺀 순수 해석/디스패치 비용만 측정합니다.
+
+실행: python benchmarks/bench_executor.py
+"""
+import os
+import sys
+import time
+import types
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 입력 장치 라이브러리 대체 (실제 마우스/키보드 입력 없음)
+for module_name, functions in [
+    ('pyautogui', ['click', 'rightClick', 'middleClick', 'press', 'hotkey', 'screenshot']),
+    ('pyperclip', ['copy', 'paste'])
+]:
+    stub = types.ModuleType(module_name)
+    for function_name in functions:
+        setattr(stub, function_name, lambda *args, **kwargs: None)
+    sys.modules[module_name] = stub
+
+from core.coordinate_manager import CoordinateManager
+from core.excel_manager import ExcelManager
+from core.image_manager import ImageManager
+from core.flow_manager import FlowManager
+from core.executor import MacroExecutor
+from core.input_backend import RecordingBackend
+
+
+COORD_COUNT = 200
+FLOW_REPEAT = 20      # 기본 액션 묶음 반복 횟수 (플로우 길이 = 묶음 크기 x 반복)
+ROWS = 200
+TRIALS = 5
+
+
+def build_project():
+    """좌표가 많은 프로젝트와 입력 액션 위주의 플로우 생성"""
+    coord_mgr = CoordinateManager()
+    for i in range(COORD_COUNT):
+        coord_mgr.add_coordinate(f"좌표{i}", i, i)
+
+    flow_mgr = FlowManager()
+    for i in range(FLOW_REPEAT):
+        # 뒤쪽 좌표일수록 선형 검색 비용이 큼
+        flow_mgr.add_action('click_coord', {'coord_id': COORD_COUNT - i, 'pre_delay': 0, 'post_delay': 0})
+        flow_mgr.add_action('type_text', {'text': f"입력 텍스트 {i}"})
+        flow_mgr.add_action('type_variable', {'var_type': 'counter', 'var_name': ''})
+        flow_mgr.add_action('key_press', {'key': 'tab'})
+        flow_mgr.add_action('hotkey', {'keys': ['ctrl', 'a']})
+        flow_mgr.add_action('delay', {'seconds': 0})
+        flow_mgr.add_action('memo', {'text': '메모'})
+
+    executor = MacroExecutor({'settings': {}}, coord_mgr, ExcelManager(), ImageManager(), flow_mgr,
+                             input_backend=RecordingBackend())
+    executor.log = lambda message: None
+    executor.timing.sleep_func = lambda seconds: None
+    return executor
+
+
+def run_interpreted(executor):
+    """행마다 모든 액션을 다시 해석"""
+    for _ in range(ROWS):
+        for action in executor.flow_mgr.flow_sequence:
+            executor.execute_action(action)
+
+
+def run_compiled(executor):
+    """실행 계획을 한 번 만들고 재사용"""
+    executor.plan = None
+    for _ in range(ROWS):
+        executor.execute_flow()
+
+
+def measure(func, executor):
+    """TRIALS회 실행 시간 중앙값 (초)"""
+    times = []
+    for _ in range(TRIALS):
+        start_time = time.perf_counter()
+        func(executor)
+        times.append(time.perf_counter() - start_time)
+    return statistics.median(times)
+
+
+def main():
+    executor = build_project()
+    action_count = len(executor.flow_mgr.flow_sequence) * ROWS
+
+    real_sleep = time.sleep
+    time.sleep = lambda seconds: None
+    try:
+        interpreted = measure(run_interpreted, executor)
+        compiled = measure(run_compiled, executor)
+    finally:
+        time.sleep = real_sleep
+
+    print(f"📊 액션 {len(executor.flow_mgr.flow_sequence)}개 x {ROWS}행 = {action_count}회 실행 "
+          f"(좌표 {COORD_COUNT}개, 중앙값 {TRIALS}회)")
+    print(f"{'방식':<12}{'전체 (ms)':>12}{'액션당 (us)':>14}")
+    print(f"{'매번 해석':<12}{interpreted*1000:>12.1f}{interpreted/action_count*1e6:>14.2f}")
+    print(f"{'실행 계획':<12}{compiled*1000:>12.1f}{compiled/action_count*1e6:>14.2f}")
+    print(f"⚡ {interpreted/max(compiled, 1e-9):.1f}배 (컴파일 {executor.compile_time*1000:.2f}ms 1회)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+입력 백엔드 벤치마크 - pyautogui vs XTest (클릭/단축키 위주 행)
+
+실제 마우스/키보드 입력이 발생하므로 빈 X 화면(예: Xvfb)에서 실행하세요.
+실행: DISPLAY=:99 python benchmarks/bench_input.py
+"""
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.input_backend import create_input_backend
+
+
+ROWS = 20
+TRIALS = 3
+
+
+def run_row(backend):
+    """클릭 4회 + 단축키 3회 + 키 3회로 구성된 한 행 (액션마다 flush)"""
+    for i in range(4):
+        backend.click(100 + i * 10, 100)
+        backend.flush()
+    for keys in (('ctrl', 'a'), ('ctrl', 'c'), ('shift', 'tab')):
+        backend.hotkey(*keys)
+        backend.flush()
+    for key in ('tab', 'tab', 'enter'):
+        backend.press(key)
+        backend.flush()
+
+
+def measure(name):
+    """ROWS행 실행 시간 중앙값 (초), 사용할 수 없으면 None"""
+    backend = create_input_backend(name)
+    if backend.name != name:
+        backend.close()
+        return None
+
+    times = []
+    try:
+        for _ in range(TRIALS):
+            start_time = time.perf_counter()
+            for _ in range(ROWS):
+                run_row(backend)
+            times.append(time.perf_counter() - start_time)
+    finally:
+        backend.close()
+    return statistics.median(times)
+
+
+def main():
+    print(f"📊 행 {ROWS}개 (행당 입력 액션 10개), 중앙값 {TRIALS}회")
+    print(f"{'백엔드':<12}{'전체 (ms)':>12}{'행당 (ms)':>12}")
+
+    results = {}
+    for name in ('pyautogui', 'xtest'):
+        elapsed = measure(name)
+        results[name] = elapsed
+        if elapsed is None:
+            print(f"{name:<12}{'사용 불가':>12}")
+        else:
+            print(f"{name:<12}{elapsed*1000:>12.1f}{elapsed/ROWS*1000:>12.2f}")
+
+    if results['pyautogui'] and results['xtest']:
+        print(f"⚡ XTest {results['pyautogui']/results['xtest']:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
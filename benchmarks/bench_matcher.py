@@ -0,0 +1,94 @@
+"""
+템플릿 매칭 벤치마크 - 전체 검색 vs 피라미드 검색 (정확도/속도 비교)
+
+실행: python benchmarks/bench_matcher.py
+"""
+import os
+import sys
+import statistics
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.matcher import TemplateMatcher
+
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440), (3840, 2160)]
+TEMPLATE_SIZES = [(24, 24), (48, 32), (120, 40), (200, 60)]
+SCALES = [None, 0.5, 0.25]
+TRIALS = 5
+
+
+def make_screen(width, height, rng):
+    """UI와 비슷한 합성 화면 생성 (사각형 + 텍스트 + 노이즈)"""
+    screen = np.full((height, width, 3), 240, np.uint8)
+    for _ in range(width * height // 20000):
+        x, y = int(rng.integers(0, width)), int(rng.integers(0, height))
+        w, h = int(rng.integers(20, 300)), int(rng.integers(10, 80))
+        color = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.rectangle(screen, (x, y), (x + w, y + h), color, -1)
+        cv2.putText(screen, f"Btn{x % 97}", (x + 3, y + h // 2), cv2.FONT_HERSHEY_SIMPLEX,
+                    0.5, (0, 0, 0), 1, cv2.LINE_AA)
+    return screen
+
+
+def make_patch(width, height, rng):
+    """화면에 하나뿐인 무늬 패치 (4px 블록 무작위 색 - 축소해도 무늬가 남음)"""
+    blocks = rng.integers(0, 256, (height // 4 + 1, width // 4 + 1, 3)).astype(np.uint8)
+    return cv2.resize(blocks, (width, height), interpolation=cv2.INTER_LINEAR)
+
+
+def add_noise(image, rng):
+    """렌더링 차이를 흉내낸 노이즈"""
+    noise = rng.normal(0, 4, image.shape)
+    return np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def make_template(image):
+    """캐시 형식과 같은 템플릿 dict 생성"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return {'color': image, 'gray': gray, 'size': (gray.shape[1], gray.shape[0])}
+
+
+def main():
+    rng = np.random.default_rng(1234)
+
+    print(f"{'해상도':>10} {'템플릿':>8} {'방식':>8} {'정확도':>8} {'평균(ms)':>9} {'중간(ms)':>9}")
+    for width, height in RESOLUTIONS:
+        screen = make_screen(width, height, rng)
+        noisy_screen = add_noise(screen, rng)
+
+        for tw, th in TEMPLATE_SIZES:
+            # 화면의 단색 영역을 자르면 같은 모양이 여러 곳에 있어 정답이 없으므로
+            # 무늬 패치를 붙여 넣고 그 패치를 템플릿으로 사용
+            cases = []
+            for _ in range(TRIALS):
+                x = int(rng.integers(0, width - tw))
+                y = int(rng.integers(0, height - th))
+                patch = make_patch(tw, th, rng)
+                frame = noisy_screen.copy()
+                frame[y:y + th, x:x + tw] = add_noise(patch, rng)
+                cases.append(((x, y), make_template(patch), cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA)))
+
+            for scale in SCALES:
+                hits = 0
+                times = []
+                for (x, y), template, frame in cases:
+                    result = TemplateMatcher.match_template(frame, template, 0.8, True, (0, 0), scale)
+                    times.append(result['elapsed'] * 1000)
+                    if result['found'] and abs(result['left'] - x) <= 1 and abs(result['top'] - y) <= 1:
+                        hits += 1
+
+                if scale is None:
+                    # 전체 검색은 기준이므로 모두 찾아야 함 (못 찾으면 합성 화면이 잘못된 것)
+                    assert hits == len(cases), f"전체 검색 정확도 {hits}/{len(cases)} ({width}x{height}, {tw}x{th})"
+
+                label = 'full' if scale is None else f"x{scale}"
+                print(f"{width}x{height:<5} {tw}x{th:<5} {label:>8} {hits}/{len(cases):>6} "
+                      f"{statistics.mean(times):>9.1f} {statistics.median(times):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
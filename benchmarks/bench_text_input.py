@@ -0,0 +1,79 @@
+"""
+텍스트 입력 벤치마크 - 필드당 지연 시간 (pyperclip / X11 클립보드 / 직접 타이핑)
+
+실제 키 입력이 발생하므로 빈 X 화면(예: Xvfb)에서 실행하세요.
+실행: DISPLAY=:99 python benchmarks/bench_text_input.py
+"""
+import os
+import sys
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.clipboard import create_clipboard
+from core.input_backend import create_input_backend
+
+
+FIELDS = ['홍길동', 'hong@example.com', '010-1234-5678', '서울시 강남구 테헤란로 123', '2024-01-31', '42']
+REPEAT = 10
+
+
+def measure_clipboard(name, backend):
+    """클립보드 설정 + Ctrl+V 필드당 시간 목록 (초)"""
+    clipboard = create_clipboard(name)
+    if clipboard.name != name:
+        clipboard.close()
+        return None
+
+    times = []
+    try:
+        for _ in range(REPEAT):
+            for text in FIELDS:
+                start_time = time.perf_counter()
+                clipboard.set_text(text)
+                backend.hotkey('ctrl', 'v')
+                backend.flush()
+                times.append(time.perf_counter() - start_time)
+    finally:
+        clipboard.close()
+    return times
+
+
+def measure_direct(backend):
+    """직접 타이핑 필드당 시간 목록 (초)"""
+    times = []
+    for _ in range(REPEAT):
+        for text in FIELDS:
+            if not backend.can_type(text):
+                continue
+            start_time = time.perf_counter()
+            backend.type_text(text)
+            backend.flush()
+            times.append(time.perf_counter() - start_time)
+    return times or None
+
+
+def report(label, times):
+    """결과 한 줄 출력"""
+    if times is None:
+        print(f"{label:<24}{'사용 불가':>10}")
+        return
+    times_ms = [t * 1000 for t in times]
+    print(f"{label:<24}{statistics.median(times_ms):>10.2f}{max(times_ms):>10.2f}{len(times_ms):>8}")
+
+
+def main():
+    backend = create_input_backend('xtest')
+    print(f"📊 필드 {len(FIELDS)}개 x {REPEAT}회 (입력 백엔드: {backend.name})")
+    print(f"{'방식':<24}{'중앙값(ms)':>10}{'최대(ms)':>10}{'필드':>8}")
+    try:
+        report('clipboard:pyperclip', measure_clipboard('pyperclip', backend))
+        report('clipboard:x11', measure_clipboard('x11', backend))
+        report(f'direct:{backend.name}', measure_direct(backend))
+    finally:
+        backend.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+엑셀 반복 실행 체크포인트 (중단/오류 후 이어서 실행)
+"""
+import json
+import os
+import tempfile
+from datetime import datetime
+
+
+# 기본 저장 간격 (완료한 행 수)
+CHECKPOINT_INTERVAL = 5
+
+
+class RunCheckpoint:
+    """프로젝트 옆 <프로젝트>.checkpoint.json에 진행 상황을 저장하는 클래스"""
+
+    def __init__(self, filepath, source, interval=CHECKPOINT_INTERVAL):
+        self.filepath = filepath
+        self.interval = max(1, int(interval))
+        self.data = {
+            'source': source,            # 엑셀 소스 (파일/시트) - 다른 데이터로 이어서 실행 방지
+            'last_completed_row': None,  # 마지막으로 처리한 행 (1부터)
+            'loop_count': 1,
+            'failed_rows': [],
+            'updated_at': None
+        }
+        self._pending = 0
+
+    @staticmethod
+    def get_path(project_filepath):
+        """프로젝트 파일에 대응하는 체크포인트 경로"""
+        return os.path.splitext(project_filepath)[0] + '.checkpoint.json'
+
+    @staticmethod
+    def get_source(excel_source):
+        """체크포인트에 기록할 엑셀 소스 식별 정보"""
+        return {'filepath': excel_source['filepath'], 'sheet_name': excel_source['sheet_name']}
+
+    @staticmethod
+    def load(filepath):
+        """체크포인트 읽기 (없거나 손상되었으면 None)"""
+        if not filepath or not os.path.exists(filepath):
+            return None
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 체크포인트 로드 오류: {e}")
+            return None
+
+    @staticmethod
+    def clear(filepath):
+        """체크포인트 삭제"""
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
+
+    def restore(self, data):
+        """이전 체크포인트 상태에서 이어가기"""
+        self.data['last_completed_row'] = data.get('last_completed_row')
+        self.data['loop_count'] = data.get('loop_count', 1)
+        self.data['failed_rows'] = list(data.get('failed_rows', []))
+
+    def row_done(self, row, loop_count, failed=False):
+        """행 처리 완료 기록 (interval 행마다 저장)"""
+        self.data['last_completed_row'] = row
+        self.data['loop_count'] = loop_count
+        if failed and row not in self.data['failed_rows']:
+            self.data['failed_rows'].append(row)
+
+        self._pending += 1
+        if self._pending >= self.interval:
+            self.save()
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 이전 체크포인트 유지)"""
+        if self.data['last_completed_row'] is None:
+            return
+
+        self.data['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.filepath)
+            self._pending = 0
+        except Exception as e:
+            print(f"⚠️ 체크포인트 저장 오류: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,134 @@
+"""
+클립보드 채널 (pyperclip / 상주 X11 선택 소유자)
+"""
+import select
+import threading
+import pyperclip
+
+try:
+    from Xlib import X, Xatom, display as xdisplay
+    from Xlib.protocol import event as xevent
+except ImportError:
+    xdisplay = None
+
+
+CLIPBOARD_CHANNELS = ('auto', 'x11', 'pyperclip')
+
+# X11 선택 한 번에 보낼 수 있는 최대 크기 (INCR 전송은 지원하지 않음 - 넘으면 pyperclip 사용)
+X11_MAX_TEXT_BYTES = 256 * 1024
+
+
+class PyperclipClipboard:
+    """pyperclip 클립보드 (Linux에서는 복사할 때마다 xclip/xsel 프로세스 실행)"""
+
+    name = 'pyperclip'
+    synchronous = False  # 복사 직후 붙여넣기 전에 안정화 대기가 필요
+
+    def set_text(self, text):
+        """클립보드에 텍스트 설정"""
+        pyperclip.copy(text)
+
+    def close(self):
+        """리소스 정리"""
+
+
+class X11SelectionClipboard:
+    """상주 스레드가 CLIPBOARD 선택을 소유하고 붙여넣기 요청에 직접 응답하는 클립보드
+
+    프로세스를 띄우지 않고, set_text()가 반환되면 바로 붙여넣을 수 있습니다.
+    """
+
+    name = 'x11'
+    synchronous = True
+
+    def __init__(self):
+        if xdisplay is None:
+            raise Exception("python-xlib가 설치되어 있지 않습니다.")
+
+        self._display = xdisplay.Display()
+        self._window = self._display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self._atoms = {
+            name: self._display.intern_atom(name)
+            for name in ('CLIPBOARD', 'TARGETS', 'UTF8_STRING', 'TEXT')
+        }
+        self._text = b''
+        self._lock = threading.Lock()
+        self._running = True
+
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def set_text(self, text):
+        """클립보드 소유권을 가져오고 텍스트 보관"""
+        data = text.encode('utf-8')
+        if len(data) > X11_MAX_TEXT_BYTES:
+            pyperclip.copy(text)
+            return
+
+        with self._lock:
+            self._text = data
+            self._window.set_selection_owner(self._atoms['CLIPBOARD'], X.CurrentTime)
+            self._display.flush()
+
+    def _serve(self):
+        """선택 요청 처리 루프 (상주 스레드)"""
+        while self._running:
+            readable, _, _ = select.select([self._display], [], [], 0.2)
+            if not readable:
+                continue
+
+            with self._lock:
+                while self._running and self._display.pending_events():
+                    event = self._display.next_event()
+                    if event.type == X.SelectionRequest:
+                        self._answer(event)
+
+    def _answer(self, request):
+        """붙여넣기 요청에 텍스트 전달"""
+        prop = request.property or request.target
+        targets = [self._atoms['TARGETS'], self._atoms['UTF8_STRING'], self._atoms['TEXT'], Xatom.STRING]
+
+        if request.target == self._atoms['TARGETS']:
+            request.requestor.change_property(prop, Xatom.ATOM, 32, targets)
+        elif request.target in targets:
+            data = self._text
+            if request.target == Xatom.STRING:
+                data = data.decode('utf-8').encode('latin-1', 'replace')
+            request.requestor.change_property(prop, request.target, 8, data)
+        else:
+            prop = X.NONE
+
+        notify = xevent.SelectionNotify(
+            time=request.time,
+            requestor=request.requestor,
+            selection=request.selection,
+            target=request.target,
+            property=prop
+        )
+        request.requestor.send_event(notify)
+        self._display.flush()
+
+    def close(self):
+        """상주 스레드 종료 (클립보드 내용은 프로세스와 함께 사라짐)"""
+        self._running = False
+        self._thread.join(timeout=1)
+        with self._lock:
+            self._window.destroy()
+            self._display.close()
+
+
+def create_clipboard(name='auto'):
+    """설정 이름으로 클립보드 채널 생성 (auto: pyperclip - x11은 설정으로 지정할 때만)
+
+    X11 선택은 실행 중인 프로세스가 소유하므로 실행이 끝나면 복사한 내용이 사라집니다.
+    """
+    if name == 'x11':
+        try:
+            return X11SelectionClipboard()
+        except Exception as e:
+            print(f"⚠️ X11 클립보드를 사용할 수 없습니다: {e} - pyperclip 사용")
+            return PyperclipClipboard()
+
+    if name not in ('auto', 'pyperclip'):
+        print(f"⚠️ 알 수 없는 클립보드 방식: {name} - pyperclip 사용")
+    return PyperclipClipboard()
@@ -0,0 +1,131 @@
+"""
+엑셀 파싱 결과 캐시 (projects/excel/.cache에 DataFrame pickle 저장)
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+
+# 캐시 형식이 바뀌면 올려서 이전 캐시 무시
+CACHE_VERSION = 4
+
+# 내용 해시 계산 시 읽는 단위 (바이트)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ExcelCache:
+    """엑셀 파일/시트/컬럼별로 읽은 DataFrame을 저장해 두고, 원본이 바뀌었을 때만 다시 읽게 하는 클래스
+
+    파일 크기와 수정 시각이 그대로면 해시 계산 없이 캐시를 사용하고,
+    수정 시각만 바뀌었으면 내용 해시(sha1)를 비교해서 같으면 그대로 사용합니다.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def file_hash(filepath):
+        """파일 내용 sha1"""
+        digest = hashlib.sha1()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _get_paths(self, filepath, sheet_name, columns):
+        """캐시 (데이터, 메타) 파일 경로 - 파일명.시트/컬럼 해시"""
+        key = json.dumps([sheet_name, list(columns or [])], ensure_ascii=False)
+        name = f"{os.path.basename(filepath)}.{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}"
+        base = os.path.join(self.cache_dir, name)
+        return base + '.pkl', base + '.meta.json'
+
+    def is_fresh(self, filepath, sheet_name, columns):
+        """원본과 일치하는 캐시가 있는지"""
+        data_path, meta_path = self._get_paths(filepath, sheet_name, columns)
+        if not os.path.exists(data_path) or not os.path.exists(meta_path):
+            return False
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+
+            stat = os.stat(filepath)
+            if (meta.get('version') != CACHE_VERSION or meta.get('size') != stat.st_size
+                    or meta.get('sheet_name') != sheet_name or meta.get('columns') != list(columns or [])):
+                return False
+
+            if meta.get('mtime_ns') != stat.st_mtime_ns:
+                # 수정 시각만 바뀐 경우 (복사/백업 등) 내용이 같으면 메타만 갱신
+                if meta.get('sha1') != self.file_hash(filepath):
+                    return False
+                meta['mtime_ns'] = stat.st_mtime_ns
+                self._write_json(meta_path, meta)
+            return True
+
+        except Exception as e:
+            print(f"⚠️ 엑셀 캐시 확인 오류: {e}")
+            return False
+
+    def load(self, filepath, sheet_name, columns):
+        """캐시된 DataFrame (없거나 원본이 바뀌었으면 None)"""
+        if not self.is_fresh(filepath, sheet_name, columns):
+            return None
+
+        try:
+            return pd.read_pickle(self._get_paths(filepath, sheet_name, columns)[0])
+
+        except Exception as e:
+            print(f"⚠️ 엑셀 캐시 로드 오류: {e}")
+            return None
+
+    def save(self, filepath, sheet_name, columns, df):
+        """DataFrame 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        data_path, meta_path = self._get_paths(filepath, sheet_name, columns)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            stat = os.stat(filepath)
+            meta = {
+                'version': CACHE_VERSION,
+                'source': os.path.basename(filepath),
+                'sheet_name': sheet_name,
+                'columns': list(columns or []),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha1': self.file_hash(filepath),
+                'rows': len(df)
+            }
+
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.excel_', suffix='.tmp')
+            os.close(fd)
+            try:
+                df.to_pickle(temp_path)
+                os.replace(temp_path, data_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+            # 메타는 데이터 뒤에 기록 (메타가 있으면 데이터도 완성된 상태)
+            self._write_json(meta_path, meta)
+
+        except Exception as e:
+            print(f"⚠️ 엑셀 캐시 저장 오류: {e}")
+
+    def remove(self, filepath):
+        """원본 파일의 캐시 모두 삭제 (시트/컬럼 구분 없이)"""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        prefix = os.path.basename(filepath) + '.'
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and (name.endswith('.pkl') or name.endswith('.meta.json')):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def _write_json(self, path, data):
+        """JSON 파일을 임시 파일에 쓴 뒤 교체"""
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.excel_', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
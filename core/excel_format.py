@@ -0,0 +1,122 @@
+"""
+엑셀 값 -> 입력용 문자열 변환 (정수/날짜 형식, 빈 칸 처리)
+"""
+import math
+from datetime import date, datetime, time as dt_time
+
+import numpy as np
+import pandas as pd
+
+
+# 컬럼 형식 (엑셀 소스의 column_formats: {컬럼: 형식})
+#   auto       값에 맞게 (정수로 떨어지는 실수는 정수, 날짜는 DATE_FORMAT)
+#   text       읽은 값 그대로
+#   int        반올림한 정수
+#   decimal:N  소수점 N자리
+#   date:형식  strftime 형식 (예: date:%Y.%m.%d, 생략 시 DATE_FORMAT)
+COLUMN_FORMATS = ('auto', 'text', 'int', 'decimal', 'date')
+
+DATE_FORMAT = '%Y-%m-%d'
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def parse_format(fmt):
+    """형식 문자열 -> (종류, 인자)"""
+    kind, _, arg = (fmt or 'auto').partition(':')
+    if kind not in COLUMN_FORMATS:
+        print(f"⚠️ 알 수 없는 컬럼 형식: {fmt} - auto 사용")
+        return 'auto', ''
+    return kind, arg
+
+
+def is_empty(value):
+    """빈 칸인지 (None, NaN, NaT, 빈 문자열)"""
+    if value is None or value is pd.NaT:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    return isinstance(value, str) and value == ''
+
+
+def format_value(value, fmt=None):
+    """값 하나를 문자열로 (스트리밍 읽기용)"""
+    if is_empty(value):
+        return ''
+
+    kind, arg = parse_format(fmt)
+    try:
+        if kind == 'text':
+            return str(value)
+        if kind == 'int':
+            return str(int(round(float(value))))
+        if kind == 'decimal':
+            return f"{float(value):.{int(arg or 0)}f}"
+        if kind == 'date' and isinstance(value, (date, datetime)):
+            return value.strftime(arg or DATE_FORMAT)
+    except (TypeError, ValueError):
+        return str(value)  # 형식에 맞지 않는 값은 그대로
+
+    # auto
+    if isinstance(value, (bool, np.bool_)):
+        return str(bool(value))
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        return str(int(value)) if value.is_integer() and abs(value) < 2 ** 53 else str(value)
+    if isinstance(value, datetime):
+        return value.strftime(DATE_FORMAT if value.time() == dt_time() else DATETIME_FORMAT)
+    if isinstance(value, date):
+        return value.strftime(DATE_FORMAT)
+    return str(value)
+
+
+def format_series(series, fmt=None):
+    """컬럼 하나를 문자열 배열로 (숫자/날짜 컬럼은 컬럼 단위로 한 번에 변환)"""
+    kind, arg = parse_format(fmt)
+
+    if series.dtype == object and kind in ('auto', 'int', 'decimal'):
+        # 셀 값 그대로 읽은 컬럼 - 숫자만 있으면 숫자 컬럼으로 한 번에 변환 (format_value와 같은 결과)
+        if pd.api.types.infer_dtype(series, skipna=True) in ('integer', 'floating', 'mixed-integer-float'):
+            numeric = pd.to_numeric(series, errors='coerce')
+            if numeric.dtype.kind in 'iuf' and not (numeric.abs() >= 2 ** 53).any():
+                series = numeric
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        if kind in ('auto', 'date'):
+            if arg:
+                return series.dt.strftime(arg).fillna('').to_numpy(dtype=object)
+            # 값마다 0시면 날짜만, 아니면 날짜와 시각 (format_value와 같은 규칙)
+            result = series.dt.strftime(DATETIME_FORMAT).fillna('').to_numpy(dtype=object)
+            midnight = (series == series.dt.normalize()).to_numpy()
+            result[midnight] = series[midnight].dt.strftime(DATE_FORMAT).to_numpy(dtype=object)
+            return result
+
+    elif pd.api.types.is_bool_dtype(series):
+        pass  # 값마다 변환
+
+    elif pd.api.types.is_integer_dtype(series) and kind in ('auto', 'int'):
+        return series.astype(str).to_numpy(dtype=object)
+
+    elif pd.api.types.is_numeric_dtype(series) and kind in ('auto', 'int', 'decimal'):
+        values = series.to_numpy(dtype=float)
+        empty = np.isnan(values)
+        if kind == 'decimal':
+            result = np.char.mod(f"%.{int(arg or 0)}f", values).astype(object)
+        else:
+            if kind == 'int':
+                values = np.round(values)
+            result = values.astype(str).astype(object)
+            integral = ~empty & (values == np.floor(values)) & (np.abs(values) < 2 ** 53)
+            result[integral] = values[integral].astype(np.int64).astype(str)
+        result[empty] = ''
+        return result
+
+    # 문자/혼합 컬럼
+    return np.array([format_value(value, fmt) for value in series.to_numpy(dtype=object)], dtype=object)
+
+
+def format_records(df, column_formats=None):
+    """선택 범위 DataFrame을 행마다 {컬럼: 문자열} 목록으로 한 번에 변환"""
+    column_formats = column_formats or {}
+    columns = list(df.columns)
+    values = [format_series(df[col], column_formats.get(col)) for col in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
@@ -2,9 +2,26 @@
 엑셀 데이터 소스 관리
 """
 import pandas as pd
+import openpyxl
 import traceback
 import os
+import csv
 import shutil
+import time
+from collections import OrderedDict
+from itertools import islice
+from core.excel_cache import ExcelCache
+from core.excel_format import format_value, format_records
+
+
+# 엑셀 읽기 방식 (auto: 캐시가 없는 큰 파일만 스트리밍)
+EXCEL_READ_MODES = ('auto', 'frame', 'stream')
+
+# auto 모드에서 스트리밍으로 읽는 최소 파일 크기 (바이트)
+STREAM_MIN_BYTES = 5 * 1024 * 1024
+
+# 메모리에 유지하는 전체 로드 결과 수 (오래 안 쓴 소스부터 제거)
+LOADED_CACHE_SIZE = 4
 
 
 class ExcelManager:
@@ -14,6 +31,14 @@ class ExcelManager:
         self.excel_sources = []
         self.next_id = 1
         self.excel_folder = 'projects/excel'  # 엑셀 저장 폴더
+        
+        # 읽은 데이터 캐시 (원본이 바뀌었을 때만 다시 파싱)
+        self.cache = ExcelCache(os.path.join(self.excel_folder, '.cache'))
+        self.use_cache = True
+        self.last_load = None  # 마지막 로드 정보 {'source_id', 'loaded_from', 'elapsed', 'rows'}
+        
+        # 메모리에 유지 중인 전체 로드 결과 (소스 ID -> {'stat', 'sheet_name', 'columns', 'df', 'records'})
+        self._loaded = OrderedDict()
     
     def copy_excel_to_project(self, source_filepath):
         """엑셀 파일을 프로젝트 폴더로 복사"""
@@ -59,7 +84,7 @@ class ExcelManager:
             print(f"   시트: {sheet_name}")
             print(f"   선택 컬럼: {columns}")
             
-            df = pd.read_excel(copied_filepath, sheet_name=sheet_name)
+            df = self._read_frame(copied_filepath, sheet_name)
             print(f"   ✅ 전체 {len(df)}행, {len(df.columns)}컬럼 읽기 완료")
             print(f"   전체 컬럼: {list(df.columns)}")
             
@@ -77,6 +102,10 @@ class ExcelManager:
             # 4. 파일명만 저장 (projects/excel/ 기준)
             filename = os.path.basename(copied_filepath)
             
+            # 실행 시 다시 파싱하지 않도록 캐시 저장
+            if self.use_cache:
+                self.cache.save(copied_filepath, sheet_name, columns if columns else list(df.columns), df)
+            
             source = {
                 'id': self.next_id,
                 'name': name,
@@ -84,11 +113,12 @@ class ExcelManager:
                 'sheet_name': sheet_name,
                 'columns': columns if columns else list(df.columns),
                 'row_count': row_count,
-                'preview': df.head(5).to_dict('records')
+                'preview': format_records(df.head(5))
             }
             
             self.excel_sources.append(source)
             self.next_id += 1
+            self._remember_loaded(source, copied_filepath, df)
             
             print(f"✅ 엑셀 소스 '{name}' 추가 완료! (파일: {filename})")
             return source
@@ -108,9 +138,12 @@ class ExcelManager:
                 if os.path.exists(filepath):
                     os.remove(filepath)
                     print(f"🗑️ 엑셀 파일 삭제: {filepath}")
+                self.cache.remove(filepath)
             except Exception as e:
                 print(f"⚠️ 파일 삭제 실패: {e}")
         
+        self._loaded.pop(source_id, None)
+        
         self.excel_sources = [s for s in self.excel_sources if s['id'] != source_id]
         print(f"🗑️ 엑셀 소스 ID {source_id} 삭제됨")
     
@@ -121,8 +154,15 @@ class ExcelManager:
                 return source
         return None
     
-    def load_excel_data(self, source_id):
-        """엑셀 데이터 전체 로드"""
+    def load_excel_data(self, source_id, start_row=0, end_row=None):
+        """엑셀 데이터 로드 (선택 컬럼, start_row~end_row 데이터 행만)
+        
+        Args:
+            start_row, end_row: 데이터 행 인덱스 (0부터, end 미포함 - None이면 끝까지)
+        
+        Returns:
+            DataFrame - 인덱스는 원래 행 인덱스 (start_row부터)
+        """
         source = self.get_excel_source(source_id)
         if not source:
             print(f"❌ 엑셀 소스 ID {source_id}를 찾을 수 없습니다.")
@@ -139,12 +179,35 @@ class ExcelManager:
             if not os.path.exists(filepath):
                 raise FileNotFoundError(f"엑셀 파일을 찾을 수 없습니다: {filepath}")
             
-            df = pd.read_excel(filepath, sheet_name=source['sheet_name'])
+            start_row = max(start_row or 0, 0)
+            partial = start_row > 0 or end_row is not None
             
-            if source['columns']:
-                df = df[source['columns']]
+            start_time = time.perf_counter()
+            entry = self._get_loaded(source)
+            if entry is not None:
+                df, loaded_from = entry['df'], '메모리'
+            else:
+                df = self.cache.load(filepath, source['sheet_name'], source['columns']) if self.use_cache else None
+                loaded_from = '캐시'
+                if df is not None:
+                    self._remember_loaded(source, filepath, df)
             
-            print(f"✅ {len(df)}행 로드 완료")
+            if df is not None:
+                if partial:
+                    df = df.iloc[start_row:end_row]
+            else:
+                df = self._read_selected(filepath, source['sheet_name'], source['columns'], start_row, end_row)
+                loaded_from = '엑셀 파싱'
+                
+                # 캐시는 전체 행을 읽었을 때만 저장
+                if not partial:
+                    self._remember_loaded(source, filepath, df)
+                    if self.use_cache:
+                        self.cache.save(filepath, source['sheet_name'], source['columns'], df)
+            
+            elapsed = time.perf_counter() - start_time
+            self.last_load = {'source_id': source_id, 'loaded_from': loaded_from, 'elapsed': elapsed, 'rows': len(df)}
+            print(f"✅ {len(df)}행 로드 완료 ({loaded_from}, {elapsed:.2f}초)")
             return df
             
         except Exception as e:
@@ -152,18 +215,299 @@ class ExcelManager:
             traceback.print_exc()
             return None
     
+    @classmethod
+    def _read_selected(cls, filepath, sheet_name, columns, start_row=0, end_row=None):
+        """선택 컬럼과 행 범위만 읽기 (CSV는 usecols/nrows, 엑셀은 openpyxl 읽기 전용 모드)
+        
+        skiprows는 파일의 물리적인 줄 기준이라 (따옴표 안 줄바꿈 등) 전체 읽기와 행 번호가 달라질 수 있으므로,
+        끝 행까지만 읽고 앞부분은 읽은 뒤에 잘라냅니다.
+        """
+        if not cls.is_csv(filepath):
+            return cls._read_sheet_selected(filepath, sheet_name, columns, start_row, end_row)
+        
+        kwargs = {}
+        names = None
+        if columns:
+            # 머리글만 먼저 읽어서 컬럼 이름 -> 위치
+            header = cls._read_frame(filepath, sheet_name, nrows=0).columns.tolist()
+            missing = [col for col in columns if col not in header]
+            if missing:
+                raise ValueError(f"존재하지 않는 컬럼: {missing}")
+            positions = sorted(header.index(col) for col in columns)
+            names = [header[position] for position in positions]
+            kwargs['usecols'] = positions
+        
+        if end_row is not None:
+            kwargs['nrows'] = max(end_row, 0)
+        
+        df = cls._read_frame(filepath, sheet_name, **kwargs).iloc[start_row:]
+        if names is not None:
+            # 일부 컬럼만 읽으면 빈 머리글 번호가 달라지므로 원래 이름으로
+            df.columns = names
+            df = df[columns]
+        
+        df.index = range(start_row, start_row + len(df))
+        return df
+    
+    @classmethod
+    def _read_sheet_selected(cls, filepath, sheet_name, columns, start_row=0, end_row=None):
+        """엑셀 시트에서 선택 컬럼의 start_row~end_row 셀 값만 읽기 (셀 값 그대로, object 컬럼)
+        
+        pandas read_excel은 사용하지 않는 컬럼과 앞쪽 행까지 모든 셀을 변환하므로,
+        읽기 전용 모드로 필요한 행/컬럼 범위만 순서대로 읽습니다.
+        """
+        workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name]
+            header = cls._normalize_columns(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+            columns = list(columns or header)
+            missing = [col for col in columns if col not in header]
+            if missing:
+                raise ValueError(f"존재하지 않는 컬럼: {missing}")
+            
+            positions = [header.index(col) for col in columns]
+            rows = []
+            trailing = 0  # 끝에 이어진 빈 행 수 (시트 끝까지 빈 행이면 제외 - 서식만 남은 행)
+            if positions and (end_row is None or end_row > start_row):
+                # 데이터는 엑셀 2행부터, 선택 컬럼을 포함하는 범위만
+                first_col = min(positions)
+                offsets = [position - first_col for position in positions]
+                cells = sheet.iter_rows(min_row=start_row + 2, min_col=first_col + 1, max_col=max(positions) + 1,
+                                        values_only=True)
+                for values in cells:
+                    in_range = end_row is None or start_row + len(rows) < end_row
+                    if not in_range and not trailing:
+                        break
+                    row = [values[offset] if offset < len(values) else None for offset in offsets]
+                    empty = all(value is None or value == '' for value in row)
+                    if in_range:
+                        rows.append(row)
+                        trailing = trailing + 1 if empty else 0
+                    elif not empty:
+                        # 범위 뒤에 데이터가 있으면 범위 끝의 빈 행은 그대로
+                        trailing = 0
+                        break
+        finally:
+            workbook.close()
+        
+        if trailing:
+            del rows[-trailing:]
+        
+        return pd.DataFrame(rows, columns=columns, index=range(start_row, start_row + len(rows)), dtype=object)
+    
+    def load_records(self, source_id, start_row=0, end_row=None):
+        """선택 범위를 입력용 문자열 행 목록으로 로드 (컬럼 단위로 한 번에 변환)
+        
+        Returns:
+            (첫 행 인덱스, [{컬럼: 문자열}, ...]) - 로드 실패 시 None
+        """
+        df = self.load_excel_data(source_id, start_row, end_row)
+        if df is None:
+            return None
+        
+        first_row = df.index[0] if len(df) else max(start_row or 0, 0)
+        entry = self._loaded.get(source_id)
+        if entry is not None and (entry['records'] is not None or len(df) == len(entry['df'])):
+            # 전체 로드 결과가 메모리에 있으면 변환한 행 목록도 함께 유지
+            records = self._get_records(entry, self.get_excel_source(source_id))
+            if len(df) != len(records):
+                records = records[first_row:first_row + len(df)]
+            return first_row, records
+        
+        start_time = time.perf_counter()
+        records = format_records(df, self.get_excel_source(source_id).get('column_formats'))
+        print(f"   ✅ {len(records)}행 문자열 변환 ({time.perf_counter() - start_time:.3f}초)")
+        return first_row, records
+    
+    def _get_loaded(self, source):
+        """메모리에 있는 전체 로드 결과 (없거나 파일/설정이 바뀌었으면 None)"""
+        entry = self._loaded.get(source['id'])
+        if entry is None:
+            return None
+        
+        try:
+            stat = os.stat(os.path.join(self.excel_folder, source['filepath']))
+            fresh = (entry['stat'] == (stat.st_size, stat.st_mtime_ns)
+                     and entry['sheet_name'] == source['sheet_name']
+                     and entry['columns'] == list(source['columns'] or []))
+        except OSError:
+            fresh = False
+        
+        if not fresh:
+            del self._loaded[source['id']]
+            return None
+        
+        self._loaded.move_to_end(source['id'])
+        return entry
+    
+    def _remember_loaded(self, source, filepath, df):
+        """전체 로드 결과를 메모리에 유지 (개수를 넘으면 가장 오래 안 쓴 것 제거)"""
+        stat = os.stat(filepath)
+        self._loaded[source['id']] = {
+            'stat': (stat.st_size, stat.st_mtime_ns),
+            'sheet_name': source['sheet_name'],
+            'columns': list(source['columns'] or []),
+            'df': df,
+            'records': None  # 처음 요청할 때 변환
+        }
+        self._loaded.move_to_end(source['id'])
+        while len(self._loaded) > LOADED_CACHE_SIZE:
+            self._loaded.popitem(last=False)
+    
+    @staticmethod
+    def _get_records(entry, source):
+        """로드 결과 전체를 입력용 문자열 행 목록으로 (한 번만 변환)"""
+        if entry['records'] is None:
+            entry['records'] = format_records(entry['df'], source.get('column_formats'))
+        return entry['records']
+    
+    def get_filepath(self, source_id):
+        """엑셀 소스의 실제 파일 경로 (projects/excel/ 기준)"""
+        source = self.get_excel_source(source_id)
+        return os.path.join(self.excel_folder, source['filepath']) if source else None
+    
+    def should_stream(self, source_id):
+        """auto 모드에서 스트리밍으로 읽을지 (캐시가 없고 파일이 클 때)"""
+        source = self.get_excel_source(source_id)
+        filepath = self.get_filepath(source_id)
+        if not source or not source.get('row_count') or not os.path.exists(filepath):
+            return False
+        if self.use_cache and self.cache.is_fresh(filepath, source['sheet_name'], source['columns']):
+            return False
+        return os.path.getsize(filepath) >= STREAM_MIN_BYTES
+    
+    def iter_rows(self, source_id, start=0, end=None):
+        """선택한 컬럼만 한 행씩 읽기 (시트 전체를 메모리에 올리지 않음)
+        
+        Args:
+            start, end: 데이터 행 인덱스 (0부터, end 미포함 - None이면 끝까지)
+        
+        Yields:
+            (행 인덱스, {컬럼: 문자열}) - 소스의 column_formats로 변환, 빈 칸은 ''
+        """
+        source = self.get_excel_source(source_id)
+        if not source:
+            raise Exception(f"엑셀 소스 ID {source_id}를 찾을 수 없습니다.")
+        
+        filepath = self.get_filepath(source_id)
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"엑셀 파일을 찾을 수 없습니다: {filepath}")
+        
+        if self.is_csv(filepath):
+            rows = self._iter_csv_rows(filepath, start, end)
+        else:
+            rows = self._iter_sheet_rows(filepath, source['sheet_name'], start, end)
+        
+        header = next(rows, None)
+        if header is None:
+            return
+        
+        # 선택 컬럼의 위치 (get_columns와 같은 이름 규칙)
+        names = self._normalize_columns(header)
+        columns = source['columns'] or names
+        missing = [col for col in columns if col not in names]
+        if missing:
+            raise ValueError(f"존재하지 않는 컬럼: {missing}")
+        formats = source.get('column_formats') or {}
+        positions = [(col, names.index(col), formats.get(col)) for col in columns]
+        
+        for index, values in enumerate(rows, start):
+            row = {}
+            for col, position, fmt in positions:
+                row[col] = format_value(values[position] if position < len(values) else None, fmt)
+            yield index, row
+    
+    @staticmethod
+    def _iter_sheet_rows(filepath, sheet_name, start, end):
+        """openpyxl 읽기 전용 모드로 머리글 행, 이어서 start~end 데이터 행 값 튜플"""
+        workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name]
+            yield next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            
+            # 데이터는 엑셀 2행부터
+            max_row = end + 1 if end is not None else None
+            yield from sheet.iter_rows(min_row=start + 2, max_row=max_row, values_only=True)
+        finally:
+            workbook.close()
+    
+    @classmethod
+    def _iter_csv_rows(cls, filepath, start, end):
+        """CSV 머리글 행, 이어서 start~end 데이터 행 (빈 줄은 빈 행)"""
+        with open(filepath, 'r', encoding=cls.get_csv_encoding(filepath), newline='') as f:
+            reader = csv.reader(f)
+            yield next(reader, [])
+            yield from islice(reader, start, end)
+    
+    @staticmethod
+    def is_csv(filepath):
+        """CSV 파일인지 (확장자 기준)"""
+        return filepath.lower().endswith('.csv')
+    
+    @staticmethod
+    def get_csv_encoding(filepath):
+        """CSV 인코딩 (UTF-8이 아니면 한글 윈도우 기본값 cp949)"""
+        with open(filepath, 'rb') as f:
+            sample = f.read(64 * 1024)
+        try:
+            sample.decode('utf-8')
+            return 'utf-8-sig'
+        except UnicodeDecodeError as e:
+            # 샘플 끝에서 글자가 잘린 경우는 UTF-8로 판단
+            return 'utf-8-sig' if e.start >= len(sample) - 3 else 'cp949'
+    
+    @staticmethod
+    def _normalize_columns(columns):
+        """머리글을 컬럼 이름으로 변환 (공백 제거, 빈 머리글은 컬럼_번호)"""
+        names = []
+        counts = {}
+        for i, col in enumerate(columns):
+            col_str = '' if col is None else str(col).strip()
+            if not col_str or col_str.startswith('Unnamed'):
+                col_str = f"컬럼_{i+1}"
+            # 같은 머리글은 pandas와 같이 이름.1, 이름.2
+            count = counts.get(col_str, 0)
+            counts[col_str] = count + 1
+            names.append(f"{col_str}.{count}" if count else col_str)
+        return names
+    
+    @classmethod
+    def _read_frame(cls, filepath, sheet_name, **kwargs):
+        """엑셀/CSV 파일을 DataFrame으로 읽기 (컬럼 이름은 get_columns와 같은 규칙)"""
+        if cls.is_csv(filepath):
+            # 빈 줄도 빈 행으로 유지 (엑셀/스트리밍 읽기와 같은 행 번호)
+            # 값은 파일에 적힌 문자열 그대로 (스트리밍 읽기와 같은 값 - 01234, 1.50 유지)
+            df = pd.read_csv(filepath, encoding=cls.get_csv_encoding(filepath), skip_blank_lines=False,
+                             dtype=str, keep_default_na=False, **kwargs)
+        else:
+            # 셀 값 그대로 (엑셀 선택 읽기/스트리밍 읽기와 같은 값)
+            df = pd.read_excel(filepath, sheet_name=sheet_name, dtype=object, **kwargs)
+        df.columns = cls._normalize_columns(df.columns)
+        return df
+    
     def get_row_data(self, source_id, row_index):
-        """특정 행 데이터 가져오기"""
-        df = self.load_excel_data(source_id)
-        if df is not None and row_index < len(df):
-            return df.iloc[row_index].to_dict()
-        return None
+        """특정 행 데이터 가져오기 (메모리에 있는 로드 결과에서 바로, 없으면 한 번 로드)"""
+        source = self.get_excel_source(source_id)
+        if not source or row_index < 0:
+            return None
+        
+        entry = self._get_loaded(source)
+        if entry is None:
+            if self.load_excel_data(source_id) is None:
+                return None
+            entry = self._loaded.get(source_id)
+        
+        records = self._get_records(entry, source)
+        return records[row_index] if row_index < len(records) else None
     
     @staticmethod
     def get_sheet_names(filepath):
         """엑셀 파일의 시트 이름 목록"""
         try:
             print(f"📄 시트 목록 읽기: {filepath}")
+            if ExcelManager.is_csv(filepath):
+                return [os.path.splitext(os.path.basename(filepath))[0]]  # CSV는 시트 하나
+            
             xl_file = pd.ExcelFile(filepath)
             sheets = xl_file.sheet_names
             print(f"✅ 시트 목록: {sheets}")
@@ -180,17 +524,7 @@ class ExcelManager:
         try:
             print(f"📋 컬럼 목록 읽기: {filepath} - 시트: {sheet_name}")
             
-            df = pd.read_excel(filepath, sheet_name=sheet_name, nrows=0)
-            columns = df.columns.tolist()
-            
-            processed_columns = []
-            for i, col in enumerate(columns):
-                col_str = str(col).strip()
-                
-                if not col_str or col_str.startswith('Unnamed'):
-                    processed_columns.append(f"컬럼_{i+1}")
-                else:
-                    processed_columns.append(col_str)
+            processed_columns = ExcelManager._read_frame(filepath, sheet_name, nrows=0).columns.tolist()
             
             print(f"✅ 컬럼 목록 ({len(processed_columns)}개): {processed_columns}")
             return processed_columns
@@ -210,6 +544,7 @@ class ExcelManager:
     def load_from_list(self, source_list):
         """리스트에서 엑셀 소스 로드"""
         self.excel_sources = source_list
+        self._loaded.clear()
         if source_list:
             self.next_id = max(s['id'] for s in source_list) + 1
         else:
@@ -3,19 +3,58 @@
 """
 import pyautogui
 import time
-import pyperclip
 from datetime import datetime
 import os
-import base64
-import tempfile
-import cv2
-import numpy as np
-from PIL import ImageGrab
+import csv
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from core.matcher import TemplateMatcher, DEFAULT_CONFIDENCE
+from core.screen_capture import screen_capture
+from core.project_manager import ProjectManager
+from core.polling import PollSchedule
+from core.timing import TimingProfile, RETRY_BACKOFF_FACTOR
+from core.input_backend import create_input_backend, PyAutoGUIBackend
+from core.clipboard import create_clipboard, PyperclipClipboard
+from core.checkpoint import RunCheckpoint, CHECKPOINT_INTERVAL
+from core.failure_journal import FailureJournal
+from core.excel_manager import EXCEL_READ_MODES
+
+
+# 마지막 발견 위치 주변 검색 여백 (px)
+HINT_MARGIN = 40
+
+# 화면 캡처/매칭 결과 재사용 유효 시간 (초)
+SCREEN_CACHE_TTL = 1.0
+
+# 실행 후 화면 캐시를 무효화하는 입력 액션
+INPUT_ACTIONS = ('click_coord', 'click_image', 'type_text', 'type_variable', 'key_press', 'hotkey', 'paste')
+
+# 행 재시도 시작 위치 (처음 액션 / 실패한 액션 / 실패 전 마지막 재시도 지점)
+RETRY_FROM = ('row', 'action', 'checkpoint')
+
+
+class MacroStopped(Exception):
+    """사용자 중지 요청으로 대기가 중단됨"""
+
+    def __init__(self):
+        super().__init__("사용자가 중지했습니다.")
+
+
+class ActionError(Exception):
+    """액션 실행 오류 (실패한 액션 위치 포함)"""
+
+    def __init__(self, action_index, action_type, message):
+        super().__init__(f"액션 {action_index} 실행 오류: {message}")
+        self.action_index = action_index  # 1부터
+        self.action_type = action_type
+        self.message = message
+
 
 class MacroExecutor:
     """매크로 실행 엔진"""
 
-    def __init__(self, project_data, coord_mgr, excel_mgr, image_mgr, flow_mgr, project_filepath=None):
+    def __init__(self, project_data, coord_mgr, excel_mgr, image_mgr, flow_mgr, project_filepath=None,
+                 input_backend=None):
         self.project_data = project_data
         self.coord_mgr = coord_mgr
         self.excel_mgr = excel_mgr
@@ -24,22 +63,100 @@ class MacroExecutor:
         self.project_filepath = project_filepath
 
         self.is_running = False
-        self.is_paused = False
-        self.should_stop = False
+
+        # 일시정지/중지 상태 (대기 중인 실행 스레드를 바로 깨우기 위해 Event 사용)
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()   # set = 실행 중, clear = 일시정지
+        self._interrupt_event = threading.Event()  # 중지 또는 일시정지 요청 시 set
+        self._resume_event.set()
+        self._pause_requested = None
+        self._stop_requested = None
 
         self.current_row = 0
         self.current_action = 0
+        self.error_count = 0
+        self.row_results = []  # 엑셀 행별 처리 결과
+
+        # 프로젝트 파일에 저장하지 않는 실행 설정 덮어쓰기 (명령줄 실행 등)
+        self.execution_overrides = {}
+        # 실행 후 학습 정보(위치 힌트, 대기 기록) 저장 여부 (병렬 워커는 끔)
+        self.save_state = True
+
+        # 엑셀 반복 체크포인트 (resume_checkpoint를 지정하면 이어서 실행)
+        self.checkpoint_enabled = True
+        self.checkpoint = None
+        self.resume_checkpoint = None
+        self.current_loop = 0
+
+        # 실패 행 기록 (excel_failed 모드에서 이 행들만 다시 실행)
+        self.journal = None
+        self.failure_screenshots = True
+        self._succeeded_rows = set()
+
+        # 마우스/키보드 입력 (settings.execution.input_backend, 직접 지정하면 그 백엔드 사용)
+        self._input_override = input_backend
+        self.input = input_backend or PyAutoGUIBackend()
+
+        # 텍스트 입력 방식 (settings.execution.text_input: clipboard / direct)
+        self.text_input = 'clipboard'
+        self.clipboard = PyperclipClipboard()
+
+        # 기본 대기 시간 (settings.execution.speed)
+        self.timing = TimingProfile()
+        self.run_started = None
+
+        # 실행 계획 (compile_flow()로 생성)
+        self.plan = None
+        self.compile_time = 0.0
+
+        # 실행 통계
+        self.stats = {}
+        self.wait_records = []  # 이미지 대기 지연 시간 기록
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        self._hints_changed = False
+
+        # 최근 캡처 프레임 / 매칭 결과 캐시 (입력 액션 실행 시 무효화)
+        self.screen_cache_ttl = SCREEN_CACHE_TTL
+        self._frame_cache = None
+        self._match_cache = {}
+
+        # 여러 이미지 동시 매칭용 스레드 풀 (필요할 때 생성)
+        self._match_pool = None
+        self.last_wait_match = None
 
         # 로그
         self.log_callback = None
         self.progress_callback = None
         self.error_callback = None
+        self.row_callback = None
     
-    def set_callbacks(self, log_cb=None, progress_cb=None, error_cb=None):
+    @property
+    def is_paused(self):
+        """일시정지 상태"""
+        return not self._resume_event.is_set()
+
+    @property
+    def should_stop(self):
+        """중지 요청 여부"""
+        return self._stop_event.is_set()
+
+    @should_stop.setter
+    def should_stop(self, value):
+        if value:
+            self._stop_event.set()
+            self._interrupt_event.set()
+        else:
+            self._stop_event.clear()
+            if not self.is_paused:
+                self._interrupt_event.clear()
+
+    def set_callbacks(self, log_cb=None, progress_cb=None, error_cb=None, row_cb=None):
         """콜백 함수 설정"""
         self.log_callback = log_cb
         self.progress_callback = progress_cb
         self.error_callback = error_cb
+        self.row_callback = row_cb
     
     def log(self, message):
         """로그 출력"""
@@ -56,20 +173,219 @@ class MacroExecutor:
     
     def report_error(self, error_msg, screenshot=None):
         """에러 보고"""
+        self.error_count += 1
         self.log(f"❌ 에러: {error_msg}")
         if self.error_callback:
             self.error_callback(error_msg, screenshot)
     
+    def record_row(self, row, status, start_time, error=None, completed=True):
+        """엑셀 행 처리 결과 기록 (status: ok / error / stopped, error: 발생한 예외)
+        
+        completed=False면 체크포인트를 진행하지 않음 (이어서 실행 시 이 행부터 다시)
+        """
+        result = {
+            'row': row,
+            'status': status,
+            'error': str(error) if error else None,
+            'elapsed': round(time.perf_counter() - start_time, 3)
+        }
+        if isinstance(error, ActionError):
+            result['action_index'] = error.action_index
+        self.row_results.append(result)
+        
+        if status == 'error':
+            self._record_failure(row, error)
+        elif status == 'ok':
+            self._succeeded_rows.add(row)
+        
+        if self.checkpoint and status != 'stopped' and completed:
+            self.checkpoint.row_done(row, self.current_loop, failed=(status == 'error'))
+        if self.row_callback:
+            self.row_callback(result)
+    
+    def _record_failure(self, row, error):
+        """실패 행을 실패 기록에 추가 (설정 시 화면 캡처 포함)"""
+        if not self.journal:
+            return
+        
+        screenshot = None
+        if self.failure_screenshots:
+            try:
+                failure_dir = os.path.join(self.get_logs_dir(), 'failures')
+                os.makedirs(failure_dir, exist_ok=True)
+                screenshot = os.path.join(failure_dir, f"row_{row}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
+                pyautogui.screenshot().save(screenshot)
+            except Exception as e:
+                self.log(f"⚠️ 실패 화면 캡처 오류: {e}")
+                screenshot = None
+        
+        if isinstance(error, ActionError):
+            self.journal.add(row, error.message, error.action_index, error.action_type, screenshot, self.current_loop)
+        else:
+            self.journal.add(row, str(error), screenshot=screenshot, loop=self.current_loop)
+    
+    def reset_stats(self):
+        """실행 통계 초기화"""
+        self.wait_records = []
+        self.stats = {
+            'hint_hits': 0,          # 위치 힌트 영역에서 발견
+            'hint_misses': 0,        # 힌트 영역에서 실패 후 전체 검색에서 발견
+            'hint_time': 0.0,        # 힌트 검색에 쓴 총 시간
+            'full_search_count': 0,  # 일반(영역/전체) 검색 횟수
+            'full_search_time': 0.0,  # 일반 검색에 쓴 총 시간
+            'wait_frames_matched': 0,  # 대기 중 매칭한 프레임 수
+            'wait_frames_skipped': 0,  # 화면 변화가 없어 매칭을 생략한 프레임 수
+            'match_cache_hits': 0,     # 직전 대기 결과를 재사용한 클릭 수
+            'frame_cache_hits': 0,     # 직전 캡처 프레임에서 찾은 클릭 수
+            'text_fields': {},         # 텍스트 입력 방식별 [필드 수, 총 시간, 최대 시간]
+            'retries': {}              # 실패한 액션 번호(1부터) -> 재시도 횟수
+        }
+    
+    def _add_stat(self, key, value):
+        """통계 값 누적 (매칭 스레드에서도 호출됨)"""
+        with self._stats_lock:
+            self.stats[key] += value
+    
+    def log_stats(self):
+        """실행 통계 로그 출력"""
+        stats = self.stats
+        hint_total = stats['hint_hits'] + stats['hint_misses']
+        if hint_total:
+            hit_rate = stats['hint_hits'] / hint_total * 100
+            avg_full = stats['full_search_time'] / max(stats['full_search_count'], 1)
+            saved = stats['hint_hits'] * avg_full - stats['hint_time']
+            self.log(f"📈 위치 힌트 적중률: {hit_rate:.1f}% ({stats['hint_hits']}/{hint_total}), "
+                     f"절약 시간 약 {saved:.2f}초")
+        
+        wait_frames = stats['wait_frames_matched'] + stats['wait_frames_skipped']
+        if wait_frames:
+            skip_rate = stats['wait_frames_skipped'] / wait_frames * 100
+            self.log(f"📈 이미지 대기: {wait_frames}프레임 중 {stats['wait_frames_skipped']}프레임 "
+                     f"변화 없음으로 매칭 생략 ({skip_rate:.1f}%)")
+        
+        if stats['match_cache_hits'] or stats['frame_cache_hits']:
+            self.log(f"📈 화면 캐시 재사용: 매칭 결과 {stats['match_cache_hits']}회, "
+                     f"캡처 프레임 {stats['frame_cache_hits']}회")
+        
+        if self.run_started is not None:
+            wall_time = time.perf_counter() - self.run_started
+            slept = self.timing.slept
+            if wall_time > 0 and slept:
+                self.log(f"📈 기본 대기 ({self.timing.describe()}): {slept:.2f}초 / 전체 {wall_time:.2f}초 "
+                         f"({slept / wall_time * 100:.1f}%), 실제 작업 {wall_time - slept:.2f}초")
+                top = sorted(self.timing.slept_by_name.items(), key=lambda item: -item[1])[:3]
+                self.log("   " + ', '.join(f"{name} {seconds:.2f}초" for name, seconds in top))
+        
+        if stats['retries']:
+            top = sorted(stats['retries'].items(), key=lambda item: -item[1])[:5]
+            self.log(f"📈 재시도: 총 {sum(stats['retries'].values())}회 - "
+                     + ', '.join(f"액션 {index} {count}회" for index, count in top))
+        
+        for method, (count, total, worst) in stats['text_fields'].items():
+            self.log(f"📈 텍스트 입력 ({method}): {count}필드, 필드당 평균 {total / count * 1000:.1f}ms, "
+                     f"최대 {worst * 1000:.1f}ms (기본 대기 제외)")
+        
+        if self.wait_records:
+            # 폴링 방식별 감지 지연 요약
+            by_strategy = {}
+            for record in self.wait_records:
+                by_strategy.setdefault(record['strategy'], []).append(record)
+            for strategy, records in by_strategy.items():
+                avg_est = sum(r['latency_est'] for r in records) / len(records)
+                worst = max(r['latency_max'] for r in records)
+                self.log(f"📈 감지 지연 ({strategy}): 평균 약 {avg_est*1000:.0f}ms, "
+                         f"최대 {worst*1000:.0f}ms ({len(records)}회)")
+    
+    def get_logs_dir(self):
+        """프로젝트 logs 폴더 경로"""
+        if self.project_filepath:
+            return os.path.join(os.path.dirname(self.project_filepath), 'logs')
+        return 'logs'
+    
+    def save_wait_records(self):
+        """이미지 대기 지연 기록을 CSV로 추가 저장 (폴링 방식 튜닝용)"""
+        if not self.wait_records:
+            return
+        
+        try:
+            logs_dir = self.get_logs_dir()
+            os.makedirs(logs_dir, exist_ok=True)
+            filepath = os.path.join(logs_dir, 'wait_timing.csv')
+            
+            fields = list(self.wait_records[0].keys())
+            write_header = not os.path.exists(filepath)
+            with open(filepath, 'a', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(self.wait_records)
+        except Exception as e:
+            self.log(f"⚠️ 대기 기록 저장 실패: {e}")
+    
+    def save_run_state(self):
+        """실행 중 학습한 정보(이미지 위치 힌트, 대기 기록) 저장"""
+        if not self.save_state:
+            return
+        
+        # 이번 실행에서 성공한 행은 실패 기록에서 제거
+        if self.journal and self._succeeded_rows:
+            resolved = self.journal.resolve(self._succeeded_rows)
+            if resolved:
+                self.log(f"🧾 실패 기록 정리: 성공한 행 {resolved}개 제거")
+        
+        self.save_wait_records()
+        
+        if not self._hints_changed or not self.project_filepath:
+            return
+        
+        self.project_data['images'] = self.image_mgr.to_list()
+        if ProjectManager.save_project(self.project_filepath, self.project_data):
+            self._hints_changed = False
+    
+    def get_execution_settings(self):
+        """프로젝트 실행 설정 + 실행 설정 덮어쓰기"""
+        settings = dict(self.project_data.get('settings', {}).get('execution', {}))
+        settings.update(self.execution_overrides)
+        return settings
+    
     def start(self):
         """매크로 실행 시작"""
         self.is_running = True
         self.should_stop = False
+        self._resume_event.set()
+        self._interrupt_event.clear()
+        self._stop_requested = None
+        self.error_count = 0
+        self.row_results = []
+        self._succeeded_rows = set()
+        self.journal = None
+        self.reset_stats()
+        self.invalidate_screen_cache()
+        self.run_started = time.perf_counter()
         self.log("🚀 매크로 실행 시작")
         
-        settings = self.project_data.get('settings', {}).get('execution', {})
+        settings = self.get_execution_settings()
+        self.timing = TimingProfile.from_settings(settings)
+        self.timing.sleep_func = self.sleep
+        
+        # 실행 전에 플로우를 한 번만 해석 (참조 오류는 여기서 모두 보고)
+        errors = self.compile_flow()
+        if errors:
+            self.is_running = False
+            self.report_error("해결되지 않은 참조가 있어 실행할 수 없습니다.\n" + '\n'.join(errors))
+            return
+        
+        self.input = self._input_override or create_input_backend(settings.get('input_backend', 'pyautogui'))
+        self.text_input = settings.get('text_input', 'clipboard')
+        self.clipboard = create_clipboard(settings.get('clipboard', 'auto'))
+        self.log(f"🧩 실행 계획 준비: 액션 {len(self.plan)}개 ({self.compile_time*1000:.1f}ms), "
+                 f"실행 속도 {self.timing.describe()}, 입력 {self.input.name}, "
+                 f"텍스트 {self.text_input} (클립보드 {self.clipboard.name})")
+        
+        self.screen_cache_ttl = settings.get('screen_cache_ttl', SCREEN_CACHE_TTL)
         mode = settings.get('mode', 'excel_loop')
 
-        if mode == 'excel_loop' and not self.excel_mgr.excel_sources:
+        if mode in ('excel_loop', 'excel_failed') and not self.excel_mgr.excel_sources:
             self.log("⚠️ 엑셀 데이터가 없어 단순 플로우 반복 모드로 전환합니다.")
             mode = 'flow_repeat'
             if 'repeat_count' not in settings:
@@ -78,6 +394,8 @@ class MacroExecutor:
         try:
             if mode == 'excel_loop':
                 self.execute_excel_loop(settings)
+            elif mode == 'excel_failed':
+                self.execute_failed_rows(settings)
             elif mode == 'flow_repeat':
                 self.execute_flow_repeat(settings)
             elif mode == 'infinite':
@@ -85,69 +403,212 @@ class MacroExecutor:
             
             self.log("✅ 매크로 실행 완료")
         
+        except MacroStopped:
+            pass  # 반복 사이 대기 중 중지됨
+        
         except Exception as e:
             self.report_error(f"실행 중 오류 발생: {str(e)}")
         
         finally:
             self.is_running = False
+            if self.checkpoint:
+                # 중지/오류로 끝난 경우 현재 위치 저장
+                self.checkpoint.save()
+                last_row = self.checkpoint.data['last_completed_row']
+                if last_row is not None:
+                    self.log(f"💾 체크포인트 저장: {last_row}행까지 완료")
+                self.checkpoint = None
+            if self._stop_requested is not None:
+                self.log(f"⏹️ 중지됨 (요청 후 {(time.perf_counter() - self._stop_requested)*1000:.1f}ms)")
+                self._stop_requested = None
+            self.log_stats()
+            self.save_run_state()
+            # 실행 스레드의 캡처 세션 정리
+            screen_capture.close()
+            self.input.close()
+            self.clipboard.close()
+            if self._match_pool:
+                self._match_pool.shutdown(wait=False)
+                self._match_pool = None
     
     def pause(self):
-        """일시정지"""
-        self.is_paused = True
+        """일시정지 (실행 스레드는 진행 중인 대기를 멈추고 다음 확인 지점에서 정지)"""
+        self._pause_requested = time.perf_counter()
+        self._resume_event.clear()
+        self._interrupt_event.set()
         self.log("⏸️ 일시정지")
     
     def resume(self):
         """재개"""
-        self.is_paused = False
+        if not self._stop_event.is_set():
+            self._interrupt_event.clear()
+        self._resume_event.set()
         self.log("▶️ 재개")
     
     def stop(self):
-        """중지"""
+        """중지 (일시정지 중이어도 바로 깨워서 종료)"""
+        self._stop_requested = time.perf_counter()
         self.should_stop = True
+        self._resume_event.set()
         self.log("⏹️ 중지 요청")
     
-    def execute_excel_loop(self, settings):
-        """엑셀 행 반복 모드 (무한반복 지원)"""
-        # 엑셀 소스 가져오기
+    def _wait_if_paused(self):
+        """일시정지 상태면 재개/중지될 때까지 대기
+        
+        Returns:
+            일시정지로 멈춰 있던 시간 (초)
+        """
+        if self._resume_event.is_set():
+            return 0.0
+        
+        start_time = time.perf_counter()
+        if self._pause_requested is not None:
+            self.log(f"⏸️ 일시정지됨 (요청 후 {(start_time - self._pause_requested)*1000:.1f}ms)")
+            self._pause_requested = None
+        
+        self._resume_event.wait()
+        return time.perf_counter() - start_time
+    
+    def sleep(self, seconds):
+        """중지/일시정지에 바로 반응하는 대기
+        
+        일시정지된 동안은 남은 대기 시간이 줄지 않고, 중지 요청 시 MacroStopped를 발생시킵니다.
+        
+        Returns:
+            일시정지로 멈춰 있던 시간 (초)
+        """
+        # 대기 전에 모아둔 입력 전송 (클릭 후 대기 순서 유지)
+        self.input.flush()
+        
+        paused = 0.0
+        deadline = time.perf_counter() + seconds
+        
+        while True:
+            if self._stop_event.is_set():
+                raise MacroStopped()
+            
+            if not self._resume_event.is_set():
+                waited = self._wait_if_paused()
+                paused += waited
+                deadline += waited
+                continue
+            
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return paused
+            self._interrupt_event.wait(remaining)
+    
+    def execute_failed_rows(self, settings):
+        """실패 기록에 있는 행만 다시 실행"""
+        if not self.project_filepath:
+            self.report_error("프로젝트 파일이 없어 실패 기록을 찾을 수 없습니다.")
+            return
+        
         if not self.excel_mgr.excel_sources:
             self.report_error("엑셀 데이터 소스가 없습니다.")
             return
         
-        excel_source = self.excel_mgr.excel_sources[0]
-        df = self.excel_mgr.load_excel_data(excel_source['id'])
+        # 현재 엑셀 소스(파일/시트)의 기록만 - 다른 소스의 행 번호로 실행하지 않음
+        journal = FailureJournal(FailureJournal.get_path(self.project_filepath),
+                                 RunCheckpoint.get_source(self.excel_mgr.excel_sources[0]))
+        other = journal.count_other_sources()
+        if other:
+            self.log(f"⚠️ 다른 엑셀 파일/시트의 실패 기록 {other}개는 건너뜁니다.")
         
-        if df is None:
-            self.report_error("엑셀 데이터를 로드할 수 없습니다.")
+        rows = journal.get_rows()
+        if not rows:
+            self.log("✅ 실패 기록에 남은 행이 없습니다.")
             return
         
+        self.log(f"🧾 실패한 행 {len(rows)}개 다시 실행: {', '.join(map(str, rows[:20]))}"
+                 f"{' ...' if len(rows) > 20 else ''}")
+        self.execute_excel_loop(settings, rows)
+    
+    def execute_excel_loop(self, settings, rows=None):
+        """엑셀 행 반복 모드 (무한반복 지원)
+        
+        rows: 처리할 행 번호 목록 (1부터) - 지정하면 해당 행만 한 번씩 실행 (체크포인트/무한반복 없음)
+        """
+        # 엑셀 소스 가져오기
+        if not self.excel_mgr.excel_sources:
+            self.report_error("엑셀 데이터 소스가 없습니다.")
+            return
+        
+        excel_source = self.excel_mgr.excel_sources[0]
+        
         start_row = settings.get('excel_start_row', 1) - 1  # 0-based index
         end_row = settings.get('excel_end_row', None)
+        
+        # 읽을 행 범위 (실패 행만 실행할 때는 첫~마지막 실패 행)
+        window = (min(rows) - 1, max(rows)) if rows else (start_row, end_row)
+        
+        if self._get_excel_read_mode(excel_source, settings) == 'stream':
+            # 필요한 행만 파일에서 순서대로 읽기 (행 수는 소스 추가 시 기록한 값)
+            loaded = None
+            row_total = excel_source['row_count']
+            self.log(f"📂 엑셀 스트리밍 읽기: {excel_source['name']} ({row_total}행, 필요한 행만 순서대로)")
+        else:
+            loaded = self.excel_mgr.load_records(excel_source['id'], *window)
+            if loaded is None:
+                self.report_error("엑셀 데이터를 로드할 수 없습니다.")
+                return
+            # 범위 뒤의 행은 읽지 않았으므로 마지막으로 읽은 행까지
+            first_row, records = loaded
+            row_total = first_row + len(records)
+            
+            load = self.excel_mgr.last_load
+            if load:
+                self.log(f"📂 엑셀 데이터 준비: {load['rows']}행, {load['elapsed']:.2f}초 "
+                         f"({load['loaded_from']}), 입력용 문자열로 변환 완료")
+        
         if end_row is None:
-            end_row = len(df)
+            end_row = row_total
+        end_row = min(end_row, row_total)
         
         total_rows = end_row - start_row
         infinite_loop = settings.get('excel_infinite_loop', False)  # 무한반복 옵션
         
-        if infinite_loop:
+        # 실패 행 기록
+        if self.project_filepath:
+            self.journal = FailureJournal(FailureJournal.get_path(self.project_filepath),
+                                          RunCheckpoint.get_source(excel_source))
+        self.failure_screenshots = settings.get('failure_screenshot', True)
+        
+        if rows is not None:
+            # 지정한 행만 한 번씩 (엑셀 범위를 벗어난 행은 제외)
+            row_indices = [row - 1 for row in rows if 0 < row <= row_total]
+            total_rows = len(row_indices)
+            infinite_loop = False
+        elif infinite_loop:
             self.log(f"📊 엑셀 무한반복 모드: {start_row+1}행 ~ {end_row}행 (중지할 때까지 반복)")
         else:
             self.log(f"📊 엑셀 행 반복 모드: {start_row+1}행 ~ {end_row}행 (총 {total_rows}행)")
         
         loop_count = 0  # 반복 횟수
+        resume_row = start_row
+        
+        # 체크포인트 (중단 후 이어서 실행)
+        self.checkpoint = self._create_checkpoint(excel_source, settings) if rows is None else None
+        if self.checkpoint and self.resume_checkpoint:
+            resume_row, loop_count = self._resume_position(excel_source, start_row, end_row, infinite_loop)
+        self.resume_checkpoint = None
         
         while True:  # 무한 루프
             loop_count += 1
+            self.current_loop = loop_count
             
             if infinite_loop:
                 self.log(f"\n🔄 === 반복 {loop_count}회차 시작 ===")
             
-            for row_idx in range(start_row, end_row):
+            if rows is None:
+                row_indices = range(resume_row, end_row)
+            
+            for position, (row_idx, row_data) in enumerate(self._iter_excel_rows(excel_source, loaded, row_indices)):
                 if self.should_stop:
                     self.log(f"⏹️ 중지됨 (반복 {loop_count}회차, 행 {row_idx + 1})")
                     return
                 
                 self.current_row = row_idx + 1
-                row_data = df.iloc[row_idx].to_dict()
                 
                 self.log(f"\n--- 행 {self.current_row} 처리 시작 ---")
                 
@@ -156,29 +617,37 @@ class MacroExecutor:
                 else:
                     status = f"행 {self.current_row} 처리 중"
                 
-                self.update_progress(row_idx - start_row + 1, total_rows, status)
+                done = position + 1 if rows is not None else row_idx - start_row + 1
+                self.update_progress(done, total_rows, status)
                 
                 # 플로우 실행
+                row_start = time.perf_counter()
                 try:
                     self.execute_flow(row_data)
+                    self.record_row(self.current_row, 'stopped' if self.should_stop else 'ok', row_start)
                 except Exception as e:
                     on_error = settings.get('on_error', 'skip')
                     if on_error == 'stop':
                         self.report_error(f"행 {self.current_row}에서 오류 발생. 중지합니다.")
+                        # 실행을 멈춘 행은 완료로 보지 않음 - 이어서 실행하면 이 행부터
+                        self.record_row(self.current_row, 'error', row_start, e, completed=False)
                         return
                     elif on_error == 'skip':
                         self.report_error(f"행 {self.current_row}에서 오류 발생. 건너뜁니다: {str(e)}")
+                        self.record_row(self.current_row, 'error', row_start, e)
                         continue
                     elif on_error == 'retry':
-                        retry_count = settings.get('retry_count', 3)
-                        for attempt in range(retry_count):
-                            self.log(f"재시도 {attempt+1}/{retry_count}")
-                            try:
-                                self.execute_flow(row_data)
-                                break
-                            except:
-                                if attempt == retry_count - 1:
-                                    self.report_error(f"행 {self.current_row} 재시도 실패. 건너뜁니다.")
+                        last_error = self._retry_row(row_data, e, settings)
+                        if self.should_stop:
+                            self.record_row(self.current_row, 'stopped', row_start)
+                        elif last_error is None:
+                            self.record_row(self.current_row, 'ok', row_start)
+                        else:
+                            self.report_error(f"행 {self.current_row} 재시도 실패. 건너뜁니다.")
+                            self.record_row(self.current_row, 'error', row_start, last_error)
+            
+            # 다음 회차는 처음 행부터
+            resume_row = start_row
             
             # 무한반복이 아니면 한 번만 실행하고 종료
             if not infinite_loop:
@@ -187,8 +656,124 @@ class MacroExecutor:
             # 무한반복일 경우 다시 처음부터
             if infinite_loop:
                 self.log(f"✅ 반복 {loop_count}회차 완료. 처음부터 다시 시작합니다...")
-                time.sleep(0.5)  # 약간의 딜레이
-
+                self.timing.wait('loop', 'restart_delay')  # 약간의 딜레이
+        
+        # 모든 행을 끝까지 처리했으면 체크포인트 삭제
+        if self.checkpoint and not self.should_stop:
+            RunCheckpoint.clear(self.checkpoint.filepath)
+            self.checkpoint = None
+            self.log("🧹 모든 행 완료 - 체크포인트 삭제")
+    
+    def _get_excel_read_mode(self, excel_source, settings):
+        """엑셀 읽기 방식 (frame: 전체 로드, stream: 필요한 행만 순서대로 읽기)"""
+        mode = settings.get('excel_read_mode', 'auto')
+        if mode not in EXCEL_READ_MODES:
+            self.log(f"⚠️ 알 수 없는 엑셀 읽기 방식: {mode} - auto 사용")
+            mode = 'auto'
+        
+        if mode == 'auto':
+            return 'stream' if self.excel_mgr.should_stream(excel_source['id']) else 'frame'
+        
+        if mode == 'stream' and not excel_source.get('row_count'):
+            self.log("⚠️ 엑셀 행 수 정보가 없어 전체를 로드합니다.")
+            return 'frame'
+        return mode
+    
+    def _iter_excel_rows(self, excel_source, loaded, row_indices):
+        """처리할 (행 인덱스, 행 데이터)를 순서대로 (loaded가 None이면 파일에서 스트리밍)
+        
+        loaded: (첫 행 인덱스, 미리 문자열로 변환한 행 목록)
+        """
+        if loaded is not None:
+            first_row, records = loaded
+            for row_idx in row_indices:
+                yield row_idx, records[row_idx - first_row]
+            return
+        
+        if not row_indices:
+            return
+        
+        # 행 목록(오름차순)이면 처음~마지막 행을 읽으면서 목록에 있는 행만
+        wanted = set(row_indices) if isinstance(row_indices, list) else None
+        for row_idx, row_data in self.excel_mgr.iter_rows(excel_source['id'], row_indices[0], row_indices[-1] + 1):
+            if wanted is None or row_idx in wanted:
+                yield row_idx, row_data
+    
+    def _retry_row(self, row_data, error, settings):
+        """실패한 행 재시도 (retry_from 설정에 따라 처음/실패한 액션/직전 재시도 지점부터)
+        
+        Returns:
+            마지막 오류 (성공하거나 중지되면 None)
+        """
+        retry_count = settings.get('retry_count', 3)
+        retry_from = settings.get('retry_from', 'row')
+        factor = settings.get('retry_backoff_factor', RETRY_BACKOFF_FACTOR)
+        
+        for attempt in range(retry_count):
+            start_index = self._get_retry_index(error, retry_from)
+            if isinstance(error, ActionError):
+                retries = self.stats['retries']
+                retries[error.action_index] = retries.get(error.action_index, 0) + 1
+            
+            try:
+                self.timing.wait_backoff(attempt, factor)
+            except MacroStopped:
+                return None
+            
+            self.log(f"재시도 {attempt+1}/{retry_count} (액션 {start_index + 1}부터)")
+            try:
+                self.execute_flow(row_data, start_index)
+                return None
+            except Exception as retry_error:
+                error = retry_error
+        return error
+    
+    def _get_retry_index(self, error, retry_from):
+        """재시도를 시작할 실행 계획 인덱스 (0부터)"""
+        if retry_from == 'row' or not isinstance(error, ActionError):
+            return 0
+        
+        failed_index = error.action_index - 1
+        if retry_from == 'action':
+            return failed_index
+        
+        # checkpoint: 실패한 액션 앞의 가장 가까운 재시도 지점 (없으면 처음부터)
+        for index in range(failed_index, -1, -1):
+            if self.plan[index]['type'] == 'retry_point':
+                return index
+        return 0
+    
+    def _create_checkpoint(self, excel_source, settings):
+        """체크포인트 생성 (프로젝트 파일이 없거나 꺼져 있으면 None)"""
+        interval = settings.get('checkpoint_interval', CHECKPOINT_INTERVAL)
+        if not self.checkpoint_enabled or not self.project_filepath or not interval:
+            return None
+        return RunCheckpoint(RunCheckpoint.get_path(self.project_filepath),
+                             RunCheckpoint.get_source(excel_source), interval)
+    
+    def _resume_position(self, excel_source, start_row, end_row, infinite_loop):
+        """체크포인트에서 이어서 시작할 (행 인덱스, 완료한 반복 횟수)"""
+        data = self.resume_checkpoint
+        last_row = data.get('last_completed_row')
+        if data.get('source') != RunCheckpoint.get_source(excel_source) or last_row is None:
+            self.log("⚠️ 체크포인트가 현재 엑셀 데이터와 맞지 않아 처음부터 실행합니다.")
+            return start_row, 0
+        
+        self.checkpoint.restore(data)
+        loop_count = data.get('loop_count', 1)
+        
+        # 마지막 완료 행(1부터)이 곧 다음 행의 0-based 인덱스
+        next_row = max(last_row, start_row)
+        if next_row >= end_row:
+            if infinite_loop:
+                next_row, loop_count = start_row, loop_count + 1
+            else:
+                self.log("⏩ 체크포인트 기준으로 남은 행이 없습니다.")
+                return end_row, loop_count - 1
+        
+        self.log(f"⏩ 체크포인트에서 이어서 실행: {next_row + 1}행부터 "
+                 f"(반복 {loop_count}회차, 실패 행 {len(self.checkpoint.data['failed_rows'])}개)")
+        return next_row, loop_count - 1
     
     def execute_flow_repeat(self, settings):
         """플로우 반복 모드"""
@@ -222,153 +807,359 @@ class MacroExecutor:
             except Exception as e:
                 self.report_error(f"반복 {iteration}에서 오류: {str(e)}")
     
-    def execute_flow(self, row_data=None):
-        """플로우 시퀀스 실행"""
-        for idx, action in enumerate(self.flow_mgr.flow_sequence):
+    def execute_flow(self, row_data=None, start_index=0):
+        """플로우 실행 (컴파일된 실행 계획 순서대로, start_index번째 액션부터)"""
+        if self.plan is None:
+            errors = self.compile_flow()
+            if errors:
+                raise Exception("해결되지 않은 참조: " + ', '.join(errors))
+        
+        for step in self.plan[start_index:]:
             # 일시정지 체크
-            while self.is_paused and not self.should_stop:
-                time.sleep(0.1)
+            self._wait_if_paused()
             
             if self.should_stop:
                 break
             
-            self.current_action = idx + 1
+            self.current_action = step['index'] + 1
             
             try:
-                self.execute_action(action, row_data)
+                self._run_step(step, row_data)
             except Exception as e:
-                raise Exception(f"액션 {idx+1} 실행 오류: {str(e)}")
+                # 중지 요청으로 중단된 경우는 오류가 아님
+                if self.should_stop:
+                    break
+                raise ActionError(step['index'] + 1, step['type'], str(e))
     
     def execute_action(self, action, row_data=None):
-        """개별 액션 실행"""
-        action_type = action['type']
-        params = action['params']
+        """개별 액션 실행 (계획 없이 바로 해석해서 실행)"""
+        self._run_step(self._compile_action(action), row_data)
+    
+    def _run_step(self, step, row_data=None):
+        """실행 계획의 한 단계 실행"""
+        self.log(step['log'])
+        try:
+            step['run'](row_data)
+        finally:
+            # 액션에서 모아둔 입력을 한 번에 전송
+            self.input.flush()
         
-        # 액션 로그
+        # 입력으로 화면이 바뀌었을 수 있으므로 캐시 무효화
+        if step['invalidates']:
+            self.invalidate_screen_cache()
+    
+    # ===== 실행 계획 =====
+    
+    def compile_flow(self):
+        """플로우를 실행 계획으로 변환 (실행 전 1회)
+        
+        좌표/이미지 참조 확인, 템플릿 디코딩, 로그 문자열 생성을 미리 해두고
+        각 액션을 행 데이터만 받는 함수로 묶습니다.
+        
+        Returns:
+            해결되지 않은 참조 오류 메시지 목록 (없으면 빈 리스트)
+        """
+        start_time = time.perf_counter()
+        plan = []
+        errors = []
+        
+        for idx, action in enumerate(self.flow_mgr.flow_sequence):
+            try:
+                plan.append(self._compile_action(action, idx))
+            except Exception as e:
+                errors.append(f"액션 {idx+1}: {str(e)}")
+        
+        self.plan = None if errors else plan
+        self.compile_time = time.perf_counter() - start_time
+        return errors
+    
+    def _compile_action(self, action, idx=0):
+        """액션 하나를 실행 단계로 변환
+        
+        Returns:
+            {'index', 'type', 'log', 'run', 'invalidates'} - run은 row_data를 받는 함수
+        """
+        action_type = action['type']
         display_text = self.flow_mgr.get_action_display_text(
             action, self.coord_mgr, self.excel_mgr, self.image_mgr
         )
-        self.log(f"  ▶ {display_text}")
         
+        return {
+            'index': idx,
+            'type': action_type,
+            'log': f"  ▶ {display_text}",
+            'run': self._bind_action(action_type, action['params']),
+            'invalidates': action_type in INPUT_ACTIONS
+        }
+    
+    def _bind_action(self, action_type, params):
+        """액션 파라미터를 미리 해석해서 실행 함수로 묶기 (참조 오류 시 예외)"""
         if action_type == 'click_coord':
-            self.action_click_coord(params)
+            coord_id = params.get('coord_id')
+            coord = self.coord_mgr.get_coordinate(coord_id)
+            if not coord:
+                raise Exception(f"좌표 ID {coord_id}를 찾을 수 없습니다.")
+            
+            x, y = coord['x'], coord['y']
+            click_type = params.get('click_type', 'left')
+            click_count = params.get('click_count', 1)
+            return lambda row_data: self._click_at(x, y, click_type, click_count, params)
         
         elif action_type == 'click_image':
-            self.action_click_image(params)
+            image, template = self._get_image_template(params.get('image_id'))
+            return lambda row_data: self._click_image(image, template, params)
         
         elif action_type == 'type_text':
-            self.action_type_text(params)
+            text = params.get('text', '')
+            return lambda row_data: self._type_text(text, params)
         
         elif action_type == 'type_variable':
-            self.action_type_variable(params, row_data)
+            if params.get('var_type') == 'excel' and self.excel_mgr.excel_sources:
+                var_name = params.get('var_name', '')
+                columns = self.excel_mgr.excel_sources[0].get('columns') or []
+                if columns and var_name not in columns:
+                    raise Exception(f"엑셀 컬럼 '{var_name}'을(를) 찾을 수 없습니다.")
+            return lambda row_data: self.action_type_variable(params, row_data)
         
         elif action_type == 'key_press':
-            self.action_key_press(params)
+            key = params.get('key', '')
+            return lambda row_data: self._press_key(key, params)
         
         elif action_type == 'hotkey':
-            self.action_hotkey(params)
+            keys = params.get('keys', [])
+            return lambda row_data: self._press_hotkey(keys, params)
         
         elif action_type == 'paste':
-            self.action_paste()
+            return lambda row_data: self.action_paste(params)
         
         elif action_type == 'delay':
-            self.action_delay(params)
+            seconds = params.get('seconds', 1)
+            return lambda row_data: self.sleep(seconds)
         
         elif action_type == 'wait_image':
-            self.action_wait_image(params)
+            image, template = self._get_image_template(params.get('image_id'))
+            return lambda row_data: self._wait_image(image, template, params)
+        
+        elif action_type == 'wait_images':
+            targets = self._get_wait_targets(params)
+            return lambda row_data: self._wait_images(targets, params)
         
         elif action_type == 'screenshot':
-            self.action_screenshot(params)
+            return lambda row_data: self.action_screenshot(params)
         
         elif action_type == 'memo':
-            pass  # 메모는 실행하지 않음
-
+            return lambda row_data: None  # 메모는 실행하지 않음
+        
+        elif action_type == 'retry_point':
+            # 실행 시에는 아무것도 하지 않음 (retry_from='checkpoint' 재시도 시작 위치 표시)
+            return lambda row_data: None
         
         else:
-            self.log(f"    ⚠️ 알 수 없는 액션 타입: {action_type}")
+            return lambda row_data: self.log(f"    ⚠️ 알 수 없는 액션 타입: {action_type}")
+    
+    # ===== 화면 캐시 =====
+    
+    def invalidate_screen_cache(self):
+        """캡처 프레임 / 매칭 결과 캐시 무효화"""
+        self._frame_cache = None
+        self._match_cache = {}
+    
+    def _is_fresh(self, entry):
+        """캐시 항목이 유효 시간 안에 있는지"""
+        return entry is not None and time.time() - entry['time'] <= self.screen_cache_ttl
+    
+    def _cache_frame(self, frame, region):
+        """마지막 캡처 프레임 저장"""
+        self._frame_cache = {'frame': frame, 'region': region, 'time': time.time()}
+    
+    def _cache_match(self, image_id, result):
+        """매칭 결과 저장"""
+        self._match_cache[image_id] = {'result': result, 'time': time.time()}
+    
+    def _get_cached_match(self, image_id):
+        """유효한 매칭 결과 (없으면 None)"""
+        entry = self._match_cache.get(image_id)
+        return entry['result'] if self._is_fresh(entry) else None
+    
+    def _get_cached_frame(self):
+        """유효한 전체 화면 프레임 (없으면 None)"""
+        entry = self._frame_cache
+        if self._is_fresh(entry) and entry['region'] is None:
+            return entry['frame']
+        return None
     
     def action_click_coord(self, params):
         """좌표 클릭"""
-        coord_id = params.get('coord_id')
-        coord = self.coord_mgr.get_coordinate(coord_id)
+        self._bind_action('click_coord', params)(None)
+    
+    def _click_at(self, x, y, click_type='left', click_count=1, params=None):
+        """지정 좌표 클릭"""
+        self.timing.wait('click_coord', 'pre_delay', params)
         
-        if not coord:
-            raise Exception(f"좌표 ID {coord_id}를 찾을 수 없습니다.")
+        self.input.click(x, y, click_type, click_count)
         
-        x, y = coord['x'], coord['y']
-        click_type = params.get('click_type', 'left')
-        click_count = params.get('click_count', 1)
+        self.timing.wait('click_coord', 'post_delay', params)
+    
+    def _get_image_template(self, image_id):
+        """이미지와 캐시된 템플릿 가져오기"""
+        image = self.image_mgr.get_image(image_id)
+        if not image:
+            raise Exception(f"이미지 ID {image_id}를 찾을 수 없습니다.")
         
-        pre_delay = params.get('pre_delay', 0.2)
-        post_delay = params.get('post_delay', 0.2)
+        template = self.image_mgr.get_template(image_id)
+        if template is None:
+            raise Exception(f"이미지 '{image['name']}'의 데이터가 없습니다.")
+        return image, template
+    
+    @staticmethod
+    def _match(template, options, region=None, frame=None):
+        """템플릿 매칭 (frame이 있으면 캡처 없이 해당 프레임에서 검색)"""
+        if frame is None:
+            return TemplateMatcher.locate_on_screen(template, region=region, **options)
+        return TemplateMatcher.locate_in_frame(frame[0], frame[1], template, region=region, **options)
+    
+    def _locate_image(self, image, template, params, frame=None):
+        """화면에서 이미지 찾기 (클릭/대기 공통)
         
-        time.sleep(pre_delay)
+        마지막으로 발견한 위치 주변을 먼저 검색하고, 없으면 일반 검색으로 넘어갑니다.
+        frame: 이미 캡처한 (프레임, origin) - 없으면 필요한 영역만 새로 캡처
+        """
+        options = {
+            'confidence': image.get('confidence', DEFAULT_CONFIDENCE),
+            'grayscale': image.get('grayscale', True),
+            'pyramid_scale': image.get('pyramid_scale')
+        }
         
-        if click_type == 'left':
-            pyautogui.click(x, y, clicks=click_count)
-        elif click_type == 'right':
-            pyautogui.rightClick(x, y)
-        elif click_type == 'middle':
-            pyautogui.middleClick(x, y)
+        hint = image.get('last_hit')
+        hint_time = 0.0
+        if hint and params.get('use_hint', True):
+            margin = image.get('hint_margin', HINT_MARGIN)
+            w, h = template['size']
+            hint_region = (hint[0] - margin, hint[1] - margin, w + margin * 2, h + margin * 2)
+            
+            start_time = time.perf_counter()
+            try:
+                result = self._match(template, options, hint_region, frame)
+            except ValueError:
+                result = None
+            hint_time = time.perf_counter() - start_time
+            self._add_stat('hint_time', hint_time)
+            
+            if result and result['found']:
+                self._add_stat('hint_hits', 1)
+                self._remember_hit(image, result)
+                return result
         
-        time.sleep(post_delay)
+        start_time = time.perf_counter()
+        result = self._search_image(image, template, params, options, frame)
+        self._add_stat('full_search_count', 1)
+        self._add_stat('full_search_time', time.perf_counter() - start_time)
+        
+        if result['found']:
+            # 힌트 영역에 없었지만 화면에는 있었던 경우만 실패로 집계
+            if hint_time:
+                self._add_stat('hint_misses', 1)
+            self._remember_hit(image, result)
+        return result
     
-    def action_click_image(self, params):
-        """이미지 클릭 (수정됨)"""
-        image_id = params.get('image_id')
-        image = self.image_mgr.get_image(image_id)
+    def _search_image(self, image, template, params, options, frame=None):
+        """검색 영역(또는 전체 화면)에서 이미지 찾기
         
-        if not image:
-            raise Exception(f"이미지 ID {image_id}를 찾을 수 없습니다.")
+        검색 영역은 액션 설정이 이미지 설정보다 우선하며,
+        영역에서 못 찾고 region_fallback이 켜져 있으면 전체 화면을 검색합니다.
+        """
+        region = params.get('search_region') or image.get('search_region')
+        fallback = params.get('region_fallback', image.get('region_fallback', False))
+        
+        if region:
+            try:
+                result = self._match(template, options, tuple(region), frame)
+                if result['found'] or not fallback:
+                    return result
+            except ValueError:
+                # 영역이 화면 밖 (해상도 변경 등)
+                if not fallback:
+                    raise
+        
+        return self._match(template, options, frame=frame)
+    
+    def _poll_schedule(self, params):
+        """액션/프로젝트 설정으로 폴링 스케줄 생성"""
+        return PollSchedule.from_settings(params, self.get_execution_settings())
+    
+    @staticmethod
+    def _watch_region(image, params):
+        """대기 중 캡처할 영역 (전체 화면 대체 검색이 필요하면 None)"""
+        region = params.get('search_region') or image.get('search_region')
+        fallback = params.get('region_fallback', image.get('region_fallback', False))
+        if region and not fallback:
+            return tuple(region)
+        return None
+    
+    def _remember_hit(self, image, result):
+        """이미지 발견 위치 기록 (다음 검색 힌트, 프로젝트에 저장됨)"""
+        hit = [result['left'], result['top']]
+        if image.get('last_hit') != hit:
+            image['last_hit'] = hit
+            self._hints_changed = True
+    
+    def _find_for_click(self, image, template, params):
+        """클릭할 이미지 찾기 (직전 대기 결과 → 직전 캡처 프레임 → 새 캡처 순)"""
+        result = self._get_cached_match(image['id'])
+        if result is not None:
+            self._add_stat('match_cache_hits', 1)
+            self.log("    ♻️ 직전 대기 결과 재사용")
+            return result
+        
+        frame = self._get_cached_frame()
+        if frame is not None:
+            result = self._locate_image(image, template, params, frame)
+            if result['found']:
+                self._add_stat('frame_cache_hits', 1)
+                return result
         
+        return self._locate_image(image, template, params)
+    
+    def action_click_image(self, params):
+        """이미지 클릭"""
+        image, template = self._get_image_template(params.get('image_id'))
+        self._click_image(image, template, params)
+    
+    def _click_image(self, image, template, params):
+        """캐시된 템플릿으로 이미지 찾아서 클릭"""
         self.log(f"    🔍 이미지 '{image['name']}' 찾는 중...")
         
         try:
-            # base64 이미지를 임시 파일로 저장
-            img_data = base64.b64decode(image['data'])
-            
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                tmp_file.write(img_data)
-                tmp_path = tmp_file.name
+            result = self._find_for_click(image, template, params)
             
-            # PyAutoGUI로 이미지 찾기
-            confidence = image.get('confidence', 0.8)
-            location = pyautogui.locateOnScreen(tmp_path, confidence=confidence)
-            
-            # 임시 파일 삭제
-            os.unlink(tmp_path)
-            
-            if location:
+            if result['found']:
                 # 중심점 클릭
-                center = pyautogui.center(location)
-                self.log(f"    ✅ 이미지 발견: ({center.x}, {center.y})")
+                self.log(f"    ✅ 이미지 발견: ({result['x']}, {result['y']}) "
+                         f"- 유사도 {result['score']:.2f}, 매칭 {result['elapsed']*1000:.0f}ms")
                 
-                time.sleep(0.2)
-                pyautogui.click(center.x, center.y)
-                time.sleep(0.2)
+                self.timing.wait('click_image', 'pre_delay', params)
+                self.input.click(result['x'], result['y'])
+                self.timing.wait('click_image', 'post_delay', params)
             else:
-                raise Exception(f"이미지 '{image['name']}'을(를) 찾을 수 없습니다.")
+                raise Exception(f"이미지 '{image['name']}'을(를) 찾을 수 없습니다. (최고 유사도 {result['score']:.2f})")
         
         except Exception as e:
             raise Exception(f"이미지 클릭 오류: {str(e)}")
     
     def action_type_text(self, params):
-        """텍스트 타이핑 (한글/영문 모두 지원 - pyperclip 사용)"""
-        text = params.get('text', '')
-        
+        """텍스트 타이핑 (한글/영문 모두 지원 - 클립보드 또는 직접 입력)"""
+        self._type_text(params.get('text', ''), params)
+    
+    def _type_text(self, text, params=None):
+        """텍스트 입력"""
         try:
-            # 클립보드로 복사 후 붙여넣기 (모든 언어 지원)
-            pyperclip.copy(text)
-            time.sleep(0.1)
-            pyautogui.hotkey('ctrl', 'v')
-            time.sleep(0.2)
+            self._enter_text(text, 'type_text', params)
         except Exception as e:
             self.log(f"    ⚠️ 타이핑 오류: {e}")
             raise Exception(f"텍스트 타이핑 실패: {str(e)}")
     
     def action_type_variable(self, params, row_data):
-        """변수 타이핑 (한글/영문 모두 지원 - pyperclip 사용)"""
+        """변수 타이핑 (한글/영문 모두 지원 - 클립보드 또는 직접 입력)"""
         var_type = params.get('var_type')
         var_name = params.get('var_name', '')
         
@@ -382,86 +1173,255 @@ class MacroExecutor:
             text = ''
         
         try:
-            # 클립보드로 복사 후 붙여넣기 (모든 언어 지원)
-            pyperclip.copy(text)
-            time.sleep(0.1)
-            pyautogui.hotkey('ctrl', 'v')
-            time.sleep(0.2)
+            self._enter_text(text, 'type_variable', params)
         except Exception as e:
             self.log(f"    ⚠️ 변수 타이핑 오류: {e}")
             raise Exception(f"변수 타이핑 실패: {str(e)}")
     
+    def _enter_text(self, text, action_type, params=None):
+        """텍스트 입력 (직접 타이핑 또는 클립보드 붙여넣기)
+        
+        direct 설정이어도 입력 백엔드가 타이핑할 수 없는 텍스트(예: pyautogui의 한글)는 클립보드를 사용합니다.
+        """
+        if self.text_input == 'direct' and self.input.can_type(text):
+            start_time = time.perf_counter()
+            self.input.type_text(text)
+            self.input.flush()
+            self._record_text_field('direct', time.perf_counter() - start_time)
+        else:
+            # 클립보드로 복사 후 붙여넣기 (모든 언어 지원)
+            start_time = time.perf_counter()
+            self.clipboard.set_text(text)
+            elapsed = time.perf_counter() - start_time
+            
+            # 소유권을 바로 가져오는 클립보드는 안정화 대기 불필요
+            if not self.clipboard.synchronous:
+                self.timing.wait(action_type, 'clipboard_delay', params)
+            
+            start_time = time.perf_counter()
+            self.input.hotkey('ctrl', 'v')
+            self.input.flush()
+            elapsed += time.perf_counter() - start_time
+            self._record_text_field(f"clipboard:{self.clipboard.name}", elapsed)
+        
+        self.timing.wait(action_type, 'post_delay', params)
+    
+    def _record_text_field(self, method, elapsed):
+        """텍스트 입력 방식별 필드당 지연 시간 집계"""
+        with self._stats_lock:
+            record = self.stats['text_fields'].setdefault(method, [0, 0.0, 0.0])
+            record[0] += 1
+            record[1] += elapsed
+            record[2] = max(record[2], elapsed)
+    
     def action_key_press(self, params):
         """키 입력"""
-        key = params.get('key', '')
-        pyautogui.press(key)
-        time.sleep(0.2)
+        self._press_key(params.get('key', ''), params)
+    
+    def _press_key(self, key, params=None):
+        """키 한 번 누르기"""
+        self.input.press(key)
+        self.timing.wait('key_press', 'post_delay', params)
     
     def action_hotkey(self, params):
         """단축키"""
-        keys = params.get('keys', [])
-        pyautogui.hotkey(*keys)
-        time.sleep(0.2)
+        self._press_hotkey(params.get('keys', []), params)
+    
+    def _press_hotkey(self, keys, params=None):
+        """단축키 누르기"""
+        self.input.hotkey(*keys)
+        self.timing.wait('hotkey', 'post_delay', params)
     
-    def action_paste(self):
+    def action_paste(self, params=None):
         """붙여넣기"""
-        pyautogui.hotkey('ctrl', 'v')
-        time.sleep(0.2)
+        self.input.hotkey('ctrl', 'v')
+        self.timing.wait('paste', 'post_delay', params)
     
     def action_delay(self, params):
         """대기"""
         seconds = params.get('seconds', 1)
-        time.sleep(seconds)
+        self.sleep(seconds)
+        
+    def _wait_for(self, evaluate, timeout, watch_region, schedule, label):
+        """화면 대기 공통 폴링 루프
+        
+        매 폴링마다 화면을 한 번 캡처하고, 변화가 없으면 매칭을 건너뜁니다.
+        변화가 감지되면 다음 폴링 간격을 최소 간격으로 줄입니다.
+        
+        Args:
+            evaluate: frame을 받아 결과(없으면 None)를 반환하는 함수
+            label: 지연 시간 기록용 이름
+        
+        Returns:
+            evaluate 결과 또는 시간 초과 시 None
+        """
+        start_time = time.time()
+        prev_signature = None
+        prev_capture = None  # 이미지가 없었던 마지막 캡처 시각
+        polls = 0
         
+        while time.time() - start_time < timeout:
+            if self.should_stop:
+                raise MacroStopped()
+            
+            capture_time = time.time()
+            frame = screen_capture.grab(watch_region)
+            self._cache_frame(frame, watch_region)
+            signature = TemplateMatcher.frame_signature(frame[0])
+            polls += 1
+            
+            if signature == prev_signature:
+                # 화면 변화가 없으면 매칭 생략
+                self._add_stat('wait_frames_skipped', 1)
+                interval = schedule.next_interval(capture_time - start_time)
+            else:
+                prev_signature = signature
+                self._add_stat('wait_frames_matched', 1)
+                outcome = evaluate(frame)
+                if outcome is not None:
+                    self._record_wait_latency(label, schedule, start_time, prev_capture, capture_time, polls)
+                    return outcome
+                # 화면이 바뀌는 중이므로 짧은 간격으로 재확인
+                interval = schedule.on_change()
+            
+            prev_capture = capture_time
+            remaining = timeout - (time.time() - start_time)
+            if remaining > 0:
+                # 일시정지된 시간은 대기 제한 시간에서 빼지 않음
+                paused = self.sleep(min(interval, remaining))
+                start_time += paused
+                if prev_capture is not None:
+                    prev_capture += paused
+        
+        return None
+    
+    def _record_wait_latency(self, label, schedule, start_time, prev_capture, capture_time, polls):
+        """이미지가 나타난 뒤 감지하기까지의 지연 시간 기록
+        
+        이미지는 마지막 실패 캡처와 발견 캡처 사이에 나타났으므로
+        최대 지연 = 두 캡처 간격 + 매칭 시간, 추정 지연 = 간격의 절반 + 매칭 시간
+        (첫 캡처에서 바로 발견하면 대기 전부터 있던 것이므로 기록하지 않음)
+        """
+        if prev_capture is None:
+            return
+        
+        processing = time.time() - capture_time
+        gap = capture_time - prev_capture
+        self.wait_records.append({
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'row': self.current_row,
+            'action': self.current_action,
+            'target': label,
+            'strategy': schedule.strategy,
+            'waited': round(time.time() - start_time, 3),
+            'polls': polls,
+            'latency_max': round(gap + processing, 3),
+            'latency_est': round(gap / 2 + processing, 3)
+        })
+    
     def action_wait_image(self, params):
-        """이미지가 나타날 때까지 대기 (OpenCV 기반 수정)"""
-        image_id = params.get('image_id')
+        """이미지가 나타날 때까지 대기"""
+        image, template = self._get_image_template(params.get('image_id'))
+        self._wait_image(image, template, params)
+    
+    def _wait_image(self, image, template, params):
+        """캐시된 템플릿이 화면에 나타날 때까지 대기"""
         timeout = params.get('timeout', 10)
+        schedule = self._poll_schedule(params)
 
-        image = self.image_mgr.get_image(image_id)
-        if not image:
-            raise Exception(f"이미지 ID {image_id}를 찾을 수 없습니다.")
-
-        self.log(f"   ⏳ 이미지 '{image['name']}' 대기 중... (최대 {timeout}초)")
+        self.log(f"   ⏳ 이미지 '{image['name']}' 대기 중... (최대 {timeout}초, {schedule.describe()})")
 
         try:
-            # base64 디코딩 후 numpy 배열로 변환
-            img_data = base64.b64decode(image['data'])
-            nparr = np.frombuffer(img_data, np.uint8)
-            template = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
-            w, h = template_gray.shape[::-1]
-
             start_time = time.time()
-            confidence_threshold = image.get('confidence', 0.6)
 
-            while time.time() - start_time < timeout:
-                if self.should_stop:
-                    raise Exception("사용자가 중지했습니다.")
-
-                # 화면 캡처 후 그레이스케일 변환
-                screen = np.array(ImageGrab.grab())
-                screen_gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
-
-                # 템플릿 매칭
-                res = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-                _, max_val, _, max_loc = cv2.minMaxLoc(res)
-
-                # 매칭 신뢰도가 기준 이상이면 위치 반환
-                if max_val >= confidence_threshold:
-                    center_x = max_loc[0] + w // 2
-                    center_y = max_loc[1] + h // 2
-                    elapsed = time.time() - start_time
-                    self.log(f"   ✅ 이미지 발견! ({center_x}, {center_y}) - {elapsed:.1f}초 소요")
-                    return
+            def evaluate(frame):
+                result = self._locate_image(image, template, params, frame)
+                return result if result['found'] else None
 
-                time.sleep(0.5)
+            result = self._wait_for(evaluate, timeout, self._watch_region(image, params), schedule, image['name'])
+            if result is None:
+                raise Exception(f"이미지 '{image['name']}'을(를) {timeout}초 내에 찾을 수 없습니다.")
 
-            raise Exception(f"이미지 '{image['name']}'을(를) {timeout}초 내에 찾을 수 없습니다.")
+            self._cache_match(image['id'], result)
+            elapsed = time.time() - start_time
+            self.log(f"   ✅ 이미지 발견! ({result['x']}, {result['y']}) - {elapsed:.1f}초 소요")
 
         except Exception as e:
             raise Exception(f"이미지 대기 오류: {str(e)}")
     
+    def action_wait_images(self, params):
+        """여러 이미지 중 하나(any) 또는 모두(all)가 나타날 때까지 대기
+        
+        폴링마다 화면을 한 번만 캡처하고, 모든 템플릿을 스레드 풀에서 동시에 매칭합니다.
+        (OpenCV는 매칭 중 GIL을 해제)
+        """
+        self._wait_images(self._get_wait_targets(params), params)
+    
+    def _get_wait_targets(self, params):
+        """여러 이미지 대기 대상 [(이미지, 템플릿), ...]"""
+        image_ids = params.get('image_ids', [])
+        if not image_ids:
+            raise Exception("대기할 이미지가 없습니다.")
+        return [self._get_image_template(image_id) for image_id in image_ids]
+    
+    def _wait_images(self, targets, params):
+        """캐시된 템플릿 여러 개 대기 (any / all)"""
+        mode = params.get('mode', 'any')
+        timeout = params.get('timeout', 10)
+        names = ', '.join(image['name'] for image, _ in targets)
+        mode_text = '모두' if mode == 'all' else '하나라도'
+        schedule = self._poll_schedule(params)
+        self.log(f"   ⏳ 이미지 [{names}] {mode_text} 나타날 때까지 대기 중... "
+                 f"(최대 {timeout}초, {schedule.describe()})")
+        
+        if self._match_pool is None:
+            self._match_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        
+        self.last_wait_match = None
+        
+        try:
+            start_time = time.time()
+            first_seen = {}  # image_id -> 처음 발견된 시각 (초)
+            
+            def evaluate(frame):
+                futures = [
+                    self._match_pool.submit(self._locate_image, image, template, params, frame)
+                    for image, template in targets
+                ]
+                results = [future.result() for future in futures]
+                found = [(image, result) for (image, _), result in zip(targets, results) if result['found']]
+                
+                elapsed = time.time() - start_time
+                for image, _ in found:
+                    first_seen.setdefault(image['id'], elapsed)
+                
+                if found and (mode != 'all' or len(found) == len(targets)):
+                    return found
+                return None
+            
+            found = self._wait_for(evaluate, timeout, None, schedule, names)
+            if found is None:
+                raise Exception(f"이미지 [{names}]을(를) {timeout}초 내에 찾을 수 없습니다.")
+            
+            for found_image, found_result in found:
+                self._cache_match(found_image['id'], found_result)
+            
+            # 가장 먼저 나타난 이미지를 보고 (같은 프레임이면 유사도가 높은 쪽)
+            image, result = min(found, key=lambda item: (first_seen[item[0]['id']], -item[1]['score']))
+            self.last_wait_match = {
+                'image_id': image['id'],
+                'name': image['name'],
+                'x': result['x'],
+                'y': result['y']
+            }
+            elapsed = time.time() - start_time
+            found_names = ', '.join(img['name'] for img, _ in found)
+            self.log(f"   ✅ 이미지 '{image['name']}' 발견! ({result['x']}, {result['y']}) "
+                     f"- {elapsed:.1f}초 소요 (발견: {found_names})")
+        
+        except Exception as e:
+            raise Exception(f"여러 이미지 대기 오류: {str(e)}")
+    
     def action_screenshot(self, params):
         """스크린샷 저장"""
         base_filename = params.get('filename', 'screenshot')
@@ -0,0 +1,103 @@
+"""
+엑셀 실패 행 기록 (실패한 행만 다시 실행하기 위한 구조화된 기록)
+"""
+import json
+import os
+import tempfile
+from datetime import datetime
+
+
+class FailureJournal:
+    """프로젝트 옆 <프로젝트>.failures.jsonl에 실패한 행을 한 줄씩 추가하는 클래스
+
+    기록마다 엑셀 소스(파일/시트)를 함께 저장하고, 현재 소스의 기록만 사용합니다.
+    행마다 가장 최근 기록이 유효하며, 나중에 성공한 행은 resolve()로 제거합니다.
+    """
+
+    def __init__(self, filepath, source):
+        self.filepath = filepath
+        self.source = source  # 현재 엑셀 소스 식별 정보 (RunCheckpoint.get_source)
+
+    @staticmethod
+    def get_path(project_filepath):
+        """프로젝트 파일에 대응하는 실패 기록 경로"""
+        return os.path.splitext(project_filepath)[0] + '.failures.jsonl'
+
+    def _read(self):
+        """(엑셀 소스, 행 번호) -> 가장 최근 실패 기록 (모든 소스)"""
+        entries = {}
+        if not os.path.exists(self.filepath):
+            return entries
+
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 중단된 마지막 줄
+                source = entry.get('source') or {}
+                entries[(source.get('filepath'), source.get('sheet_name'), entry['row'])] = entry
+        return entries
+
+    def load(self):
+        """행 번호 -> 가장 최근 실패 기록 (현재 엑셀 소스의 기록만)"""
+        return {entry['row']: entry for entry in self._read().values() if entry.get('source') == self.source}
+
+    def get_rows(self):
+        """실패한 행 번호 목록 (1부터, 오름차순)"""
+        return sorted(self.load())
+
+    def count_other_sources(self):
+        """다른 엑셀 소스(또는 소스 정보가 없는 이전 기록)의 실패 행 수"""
+        return sum(1 for entry in self._read().values() if entry.get('source') != self.source)
+
+    def add(self, row, error, action_index=None, action_type=None, screenshot=None, loop=None):
+        """실패 기록 추가 (파일 끝에 한 줄 추가)"""
+        entry = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'source': self.source,
+            'row': row,
+            'loop': loop,
+            'action_index': action_index,
+            'action_type': action_type,
+            'error': error,
+            'screenshot': screenshot
+        }
+        try:
+            with open(self.filepath, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except Exception as e:
+            print(f"⚠️ 실패 기록 저장 오류: {e}")
+        return entry
+
+    def resolve(self, rows):
+        """성공한 행의 실패 기록 제거 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            제거한 행 수
+        """
+        entries = self._read()
+        rows = set(rows)
+        resolved = [key for key, entry in entries.items()
+                    if entry.get('source') == self.source and entry['row'] in rows]
+        if not resolved:
+            return 0
+
+        for key in resolved:
+            del entries[key]
+
+        if not entries:
+            os.remove(self.filepath)
+            return len(resolved)
+
+        # 다른 엑셀 소스의 기록은 그대로 유지
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.failures_', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for entry in entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.filepath)
+        return len(resolved)
@@ -109,7 +109,8 @@ class FlowManager:
                 img = image_mgr.get_image(image_id)
                 if img:
                     image_name = img['name']
-            return f"[이미지:{image_name}] 클릭"
+            region_text = " (영역)" if params.get('search_region') else ""
+            return f"[이미지:{image_name}] 클릭{region_text}"
         
         elif action_type == 'type_text':
             text = params.get('text', '')
@@ -143,7 +144,21 @@ class FlowManager:
                 img = image_mgr.get_image(image_id)
                 if img:
                     image_name = img['name']
-            return f"[이미지 대기] {image_name} (최대 {timeout}초)"
+            region_text = " (영역)" if params.get('search_region') else ""
+            return f"[이미지 대기] {image_name} (최대 {timeout}초){region_text}"
+        
+        elif action_type == 'wait_images':
+            image_ids = params.get('image_ids', [])
+            timeout = params.get('timeout', 10)
+            mode_text = "모두" if params.get('mode', 'any') == 'all' else "하나라도"
+            image_names = []
+            for image_id in image_ids:
+                img = image_mgr.get_image(image_id) if image_mgr else None
+                image_names.append(img['name'] if img else "알 수 없음")
+            return f"[이미지 대기:{mode_text}] {', '.join(image_names)} (최대 {timeout}초)"
+        
+        elif action_type == 'retry_point':
+            return "[재시도 지점] 오류 시 여기부터 다시 실행"
         
         elif action_type == 'screenshot':
             filename = params.get('filename', 'screenshot.png')
@@ -1,11 +1,14 @@
 """
 이미지 템플릿 관리 (화면 인식용)
 """
-import pyautogui
 from PIL import Image, ImageGrab
 import io
 import base64
+import hashlib
 import os
+import cv2
+import numpy as np
+from core.matcher import TemplateMatcher, DEFAULT_CONFIDENCE
 
 
 class ImageManager:
@@ -14,6 +17,9 @@ class ImageManager:
     def __init__(self):
         self.images = []
         self.next_id = 1
+
+        # 디코딩된 템플릿 캐시 {image_id: {'hash', 'color', 'gray', 'size', ...}}
+        self._template_cache = {}
         
         # images 폴더 생성
         self.ensure_images_folder()
@@ -23,7 +29,7 @@ class ImageManager:
         images_dir = os.path.join('projects', 'images')
         os.makedirs(images_dir, exist_ok=True)
     
-    def add_image(self, name, image_data, confidence=0.8, description=""):
+    def add_image(self, name, image_data, confidence=DEFAULT_CONFIDENCE, description="", grayscale=True):
         """이미지 추가
         
         Args:
@@ -31,6 +37,7 @@ class ImageManager:
             image_data: base64 encoded image string
             confidence: 매칭 정확도 (0.0 ~ 1.0)
             description: 설명
+            grayscale: True면 그레이스케일 매칭, False면 컬러 매칭
         """
         # 안전한 파일명 생성
         safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
@@ -67,6 +74,10 @@ class ImageManager:
             'path': image_path,
             'data': image_data,  # base64 데이터 저장 (executor에서 사용)
             'confidence': confidence,
+            'grayscale': grayscale,
+            'search_region': None,  # (x, y, w, h) - None이면 전체 화면
+            'region_fallback': False,  # 영역에서 못 찾으면 전체 화면 검색
+            'pyramid_scale': None,  # 피라미드 매칭 축소 비율 (예: 0.5), None이면 전체 검색
             'description': description
         }
         
@@ -87,6 +98,8 @@ class ImageManager:
                 print(f"⚠️ 이미지 파일 삭제 실패: {e}")
             
             self.images = [img for img in self.images if img['id'] != image_id]
+        
+        self.invalidate_template(image_id)
     
     def get_image(self, image_id):
         """ID로 이미지 찾기"""
@@ -101,11 +114,89 @@ class ImageManager:
         if image:
             # confidence 등의 속성 업데이트
             for key, value in kwargs.items():
-                if key in ['name', 'confidence', 'description']:
+                if key in ['name', 'confidence', 'grayscale', 'description',
+                           'search_region', 'region_fallback', 'hint_margin', 'pyramid_scale']:
                     image[key] = value
+            self.invalidate_template(image_id)
             return True
         return False
     
+    # ===== 템플릿 캐시 =====
+    
+    @staticmethod
+    def _hash_data(image_data):
+        """이미지 데이터 내용 해시"""
+        return hashlib.md5(image_data.encode('ascii')).hexdigest()
+    
+    @staticmethod
+    def decode_template(image_data):
+        """base64 이미지를 템플릿 배열로 디코딩
+        
+        Returns:
+            {'color': BGR 배열, 'gray': 그레이스케일 배열, 'size': (w, h)}
+        """
+        # data URI 형식인 경우 처리
+        if image_data.startswith('data:image'):
+            image_data = image_data.split(',')[1]
+        
+        return ImageManager.template_from_bytes(base64.b64decode(image_data))
+    
+    @staticmethod
+    def template_from_bytes(img_bytes):
+        """이미지 파일 바이트를 템플릿 배열로 디코딩"""
+        color = cv2.imdecode(np.frombuffer(img_bytes, np.uint8), cv2.IMREAD_COLOR)
+        if color is None:
+            raise ValueError("이미지 데이터를 디코딩할 수 없습니다.")
+        
+        gray = cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+        h, w = gray.shape
+        return {'color': color, 'gray': gray, 'size': (w, h)}
+    
+    def get_template(self, image_id):
+        """디코딩된 템플릿 가져오기 (캐시 사용, 첫 사용 시 디코딩)"""
+        image = self.get_image(image_id)
+        if not image or not image.get('data'):
+            return None
+        
+        data = image['data']
+        entry = self._template_cache.get(image_id)
+        if entry is not None:
+            # 같은 문자열 객체면 해시 계산 생략
+            if entry['data'] is data:
+                return entry
+            if entry['hash'] == self._hash_data(data):
+                entry['data'] = data
+                return entry
+        
+        entry = self.decode_template(data)
+        entry['hash'] = self._hash_data(data)
+        entry['data'] = data
+        
+        # 피라미드 매칭용 축소 템플릿 미리 생성
+        if image.get('pyramid_scale'):
+            TemplateMatcher.build_pyramid(entry, image['pyramid_scale'])
+        
+        self._template_cache[image_id] = entry
+        return entry
+    
+    def invalidate_template(self, image_id=None):
+        """템플릿 캐시 무효화 (image_id가 없으면 전체)"""
+        if image_id is None:
+            self._template_cache.clear()
+        else:
+            self._template_cache.pop(image_id, None)
+    
+    def preload_templates(self):
+        """모든 이미지 템플릿 미리 디코딩 (프로젝트 로드 시)"""
+        loaded = 0
+        for img in self.images:
+            try:
+                if self.get_template(img['id']) is not None:
+                    loaded += 1
+            except Exception as e:
+                print(f"⚠️ 템플릿 디코딩 실패: {img.get('name')} - {e}")
+        return loaded
+    
     @staticmethod
     def capture_region(x1, y1, x2, y2):
         """화면 영역 캡처"""
@@ -121,40 +212,29 @@ class ImageManager:
             return None
     
     @staticmethod
-    def find_image_on_screen(image_path, confidence=0.8):
+    def find_image_on_screen(image_path, confidence=DEFAULT_CONFIDENCE, grayscale=True):
         """화면에서 이미지 찾기 (파일 경로 사용)"""
         try:
-            location = pyautogui.locateOnScreen(image_path, confidence=confidence)
-            if location:
-                center = pyautogui.center(location)
-                return center.x, center.y
+            with open(image_path, 'rb') as f:
+                template = ImageManager.template_from_bytes(f.read())
+            
+            result = TemplateMatcher.locate_on_screen(template, confidence, grayscale)
+            if result['found']:
+                return result['x'], result['y']
             return None
         except Exception as e:
             print(f"❌ 이미지 찾기 오류: {e}")
             return None
     
     @staticmethod
-    def find_image_from_data(image_data_b64, confidence=0.8):
+    def find_image_from_data(image_data_b64, confidence=DEFAULT_CONFIDENCE, grayscale=True):
         """화면에서 이미지 찾기 (base64 데이터 사용)"""
-        import tempfile
-        
         try:
-            # base64를 임시 파일로 저장
-            img_bytes = base64.b64decode(image_data_b64)
-            
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                tmp_file.write(img_bytes)
-                tmp_path = tmp_file.name
-            
-            # 이미지 찾기
-            location = pyautogui.locateOnScreen(tmp_path, confidence=confidence)
-            
-            # 임시 파일 삭제
-            os.unlink(tmp_path)
+            template = ImageManager.decode_template(image_data_b64)
             
-            if location:
-                center = pyautogui.center(location)
-                return center.x, center.y
+            result = TemplateMatcher.locate_on_screen(template, confidence, grayscale)
+            if result['found']:
+                return result['x'], result['y']
             return None
             
         except Exception as e:
@@ -164,6 +244,7 @@ class ImageManager:
     def load_from_list(self, image_list):
         """리스트에서 이미지 로드"""
         self.images = []
+        self.invalidate_template()
         
         for img_data in image_list:
             # 파일 경로 확인 (하위 호환성)
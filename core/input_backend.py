@@ -0,0 +1,311 @@
+"""
+마우스/키보드 입력 백엔드 (pyautogui / X11 XTest / 기록용)
+"""
+import pyautogui
+
+try:
+    from Xlib import X, XK, display as xdisplay
+    from Xlib.ext import xtest
+    # 한글/멀티미디어 키 keysym (기본으로 불러오지 않는 그룹)
+    XK.load_keysym_group('korean')
+    XK.load_keysym_group('xf86')
+except ImportError:
+    xtest = None
+
+
+INPUT_BACKENDS = ('pyautogui', 'xtest', 'recording')
+
+# pyautogui 키 이름 -> X11 keysym 이름 (F1~F24와 문자 하나는 그대로 변환)
+XTEST_KEY_NAMES = {
+    'enter': 'Return', 'return': 'Return', '\n': 'Return', '\r': 'Return', 'tab': 'Tab', '\t': 'Tab',
+    'space': 'space', 'esc': 'Escape', 'escape': 'Escape', 'backspace': 'BackSpace',
+    'delete': 'Delete', 'del': 'Delete', 'insert': 'Insert', 'home': 'Home', 'end': 'End',
+    'pageup': 'Prior', 'pgup': 'Prior', 'pagedown': 'Next', 'pgdn': 'Next',
+    'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
+    'ctrl': 'Control_L', 'ctrlleft': 'Control_L', 'ctrlright': 'Control_R',
+    'shift': 'Shift_L', 'shiftleft': 'Shift_L', 'shiftright': 'Shift_R',
+    'alt': 'Alt_L', 'altleft': 'Alt_L', 'altright': 'Alt_R',
+    'option': 'Alt_L', 'optionleft': 'Alt_L', 'optionright': 'Alt_R',
+    'win': 'Super_L', 'winleft': 'Super_L', 'winright': 'Super_R', 'command': 'Super_L',
+    'capslock': 'Caps_Lock', 'numlock': 'Num_Lock', 'scrolllock': 'Scroll_Lock',
+    'print': 'Print', 'printscreen': 'Print', 'prntscrn': 'Print', 'prtsc': 'Print', 'prtscr': 'Print',
+    'pause': 'Pause', 'menu': 'Menu', 'apps': 'Menu', 'help': 'Help', 'select': 'Select',
+    'execute': 'Execute', 'clear': 'Clear', 'yen': 'yen',
+    # 숫자 키패드
+    **{f'num{i}': f'KP_{i}' for i in range(10)},
+    'add': 'KP_Add', 'subtract': 'KP_Subtract', 'multiply': 'KP_Multiply', 'divide': 'KP_Divide',
+    'decimal': 'KP_Decimal', 'separator': 'KP_Separator',
+    # 한글/일본어 입력
+    'hangul': 'Hangul', 'hanguel': 'Hangul', 'hanja': 'Hangul_Hanja', 'junja': 'Hangul_Jeonja',
+    'kana': 'Katakana', 'kanji': 'Kanji', 'convert': 'Henkan', 'nonconvert': 'Muhenkan',
+    'modechange': 'Mode_switch',
+    # 브라우저/미디어 키
+    'browserback': 'XF86_Back', 'browserforward': 'XF86_Forward', 'browserrefresh': 'XF86_Refresh',
+    'browserstop': 'XF86_Stop', 'browsersearch': 'XF86_Search', 'browserfavorites': 'XF86_Favorites',
+    'browserhome': 'XF86_HomePage', 'volumemute': 'XF86_AudioMute', 'volumedown': 'XF86_AudioLowerVolume',
+    'volumeup': 'XF86_AudioRaiseVolume', 'playpause': 'XF86_AudioPlay', 'stop': 'XF86_AudioStop',
+    'nexttrack': 'XF86_AudioNext', 'prevtrack': 'XF86_AudioPrev', 'launchmail': 'XF86_Mail',
+    'launchmediaselect': 'XF86_AudioMedia', 'launchapp1': 'XF86_MyComputer', 'launchapp2': 'XF86_Calculator',
+    'sleep': 'XF86_Sleep'
+}
+
+# X11에 해당 keysym이 없는 pyautogui 키 (Windows IME/하드웨어 키)
+XTEST_UNSUPPORTED_KEYS = ('accept', 'final', 'fn')
+
+# 직접 타이핑 시 키 입력으로 보내는 제어 문자
+TYPE_CONTROL_KEYS = {'\n': 'enter', '\t': 'tab'}
+
+
+class InputBackend:
+    """입력 백엔드 기본 클래스
+
+    입력은 모아두었다가 flush()에서 한 번에 보낼 수 있습니다.
+    실행 엔진은 대기 직전과 액션이 끝날 때 flush()를 호출합니다.
+    """
+
+    name = 'base'
+
+    def click(self, x, y, button='left', clicks=1):
+        """(x, y)로 이동 후 클릭"""
+        raise NotImplementedError
+
+    def press(self, key):
+        """키 한 번 누르기"""
+        raise NotImplementedError
+
+    def hotkey(self, *keys):
+        """단축키 (순서대로 누르고 역순으로 떼기)"""
+        raise NotImplementedError
+
+    def can_type(self, text):
+        """클립보드 없이 직접 타이핑할 수 있는 텍스트인지"""
+        return False
+
+    def type_text(self, text):
+        """텍스트 직접 타이핑"""
+        raise NotImplementedError
+
+    def flush(self):
+        """모아둔 입력 전송"""
+
+    def close(self):
+        """리소스 정리"""
+
+
+class PyAutoGUIBackend(InputBackend):
+    """pyautogui 입력 (기존 방식, 호출마다 pyautogui.PAUSE 대기 포함)"""
+
+    name = 'pyautogui'
+
+    def click(self, x, y, button='left', clicks=1):
+        if button == 'left':
+            pyautogui.click(x, y, clicks=clicks)
+        elif button == 'right':
+            pyautogui.rightClick(x, y)
+        elif button == 'middle':
+            pyautogui.middleClick(x, y)
+
+    def press(self, key):
+        pyautogui.press(key)
+
+    def hotkey(self, *keys):
+        pyautogui.hotkey(*keys)
+
+    def can_type(self, text):
+        # pyautogui.write는 키보드 배열에 있는 ASCII 문자만 입력 가능
+        return text.isascii()
+
+    def type_text(self, text):
+        pyautogui.write(text)
+
+
+class XTestBackend(InputBackend):
+    """X11 XTest 확장으로 직접 입력 (Linux 전용, 이벤트를 모아서 flush 시 한 번에 전송)"""
+
+    name = 'xtest'
+
+    BUTTONS = {'left': 1, 'middle': 2, 'right': 3}
+
+    def __init__(self):
+        if xtest is None:
+            raise Exception("python-xlib가 설치되어 있지 않습니다.")
+
+        self._display = xdisplay.Display()
+        if not self._display.has_extension('XTEST'):
+            self._display.close()
+            raise Exception("X 서버가 XTEST 확장을 지원하지 않습니다.")
+
+        self._keycodes = {}  # 키 이름 -> (keycode, shift 필요 여부)
+        self._chars = {}     # 문자 -> (keycode, shift 필요 여부) 또는 None (키보드 배열에 없음)
+        self._pending = False
+
+    def _key(self, key):
+        """키 이름을 (keycode, shift 필요 여부)로 변환 (캐시)"""
+        if key in self._keycodes:
+            return self._keycodes[key]
+
+        if key.lower() in XTEST_UNSUPPORTED_KEYS:
+            raise Exception(f"xtest 입력에서 지원하지 않는 키: {key}")
+
+        keysym = self.key_keysym(key)
+        keycode = self._display.keysym_to_keycode(keysym) if keysym else 0
+        if not keycode:
+            raise Exception(f"알 수 없는 키: {key}")
+
+        # 기본 입력(shift 없음)으로 나오지 않는 문자는 shift 필요
+        needs_shift = self._display.keycode_to_keysym(keycode, 0) != keysym
+        self._keycodes[key] = (keycode, needs_shift)
+        return self._keycodes[key]
+
+    @staticmethod
+    def key_keysym(key):
+        """pyautogui 키 이름의 X11 keysym (없으면 0)"""
+        name = XTEST_KEY_NAMES.get(key.lower(), key)
+        if len(name) > 1 and name[0] in 'fF' and name[1:].isdigit():
+            name = name.upper()
+
+        keysym = XK.string_to_keysym(name)
+        if not keysym and len(key) == 1:
+            # 문자 하나는 Latin-1이면 코드값, 그 외는 유니코드 keysym
+            keysym = ord(key) if ord(key) < 0x100 else 0x01000000 | ord(key)
+        return keysym
+
+    def _fake(self, event_type, detail=0, **kwargs):
+        """XTest 이벤트 추가 (flush 전까지 전송되지 않음)"""
+        xtest.fake_input(self._display, event_type, detail, **kwargs)
+        self._pending = True
+
+    def click(self, x, y, button='left', clicks=1):
+        if button not in self.BUTTONS:
+            raise Exception(f"알 수 없는 마우스 버튼: {button}")
+
+        self._fake(X.MotionNotify, x=int(x), y=int(y))
+        for _ in range(clicks if button == 'left' else 1):
+            self._fake(X.ButtonPress, self.BUTTONS[button])
+            self._fake(X.ButtonRelease, self.BUTTONS[button])
+
+    def press(self, key):
+        keycode, needs_shift = self._key(key)
+        shift = self._key('shift')[0] if needs_shift else None
+
+        if shift:
+            self._fake(X.KeyPress, shift)
+        self._fake(X.KeyPress, keycode)
+        self._fake(X.KeyRelease, keycode)
+        if shift:
+            self._fake(X.KeyRelease, shift)
+
+    def hotkey(self, *keys):
+        keycodes = [self._key(key)[0] for key in keys]
+        for keycode in keycodes:
+            self._fake(X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            self._fake(X.KeyRelease, keycode)
+
+    def can_type(self, text):
+        """현재 키보드 배열로 입력할 수 있는 문자만 있는지 (없는 문자는 클립보드 사용)
+
+        keycode를 임시로 다시 매핑하면서 연달아 입력하면 MappingNotify를 늦게 처리한
+        프로그램이 앞 글자를 다음 글자로 읽을 수 있어 매핑 변경은 하지 않습니다.
+        """
+        return all(char in TYPE_CONTROL_KEYS or ord(char) < 0x20 or self._char_key(char) is not None
+                   for char in text)
+
+    def type_text(self, text):
+        """keysym 매핑으로 문자 입력 (키보드 배열에 없는 문자는 오류 - can_type으로 먼저 확인)"""
+        for char in text:
+            if char in TYPE_CONTROL_KEYS:
+                self.press(TYPE_CONTROL_KEYS[char])
+                continue
+            if ord(char) < 0x20:
+                continue
+
+            key = self._char_key(char)
+            if key is None:
+                raise Exception(f"키보드 배열에 없는 문자입니다: {char}")
+
+            keycode, needs_shift = key
+            shift = self._key('shift')[0] if needs_shift else None
+            if shift:
+                self._fake(X.KeyPress, shift)
+            self._fake(X.KeyPress, keycode)
+            self._fake(X.KeyRelease, keycode)
+            if shift:
+                self._fake(X.KeyRelease, shift)
+
+    @staticmethod
+    def _char_keysym(char):
+        """문자의 keysym (Latin-1은 코드값, 그 외는 유니코드 keysym)"""
+        code = ord(char)
+        return code if code < 0x100 else 0x01000000 | code
+
+    def _char_key(self, char):
+        """문자를 (keycode, shift 필요 여부)로 변환 - 기본/shift 입력으로 안 나오면 None (캐시)"""
+        if char in self._chars:
+            return self._chars[char]
+
+        keysym = self._char_keysym(char)
+        keycode = self._display.keysym_to_keycode(keysym)
+        key = None
+        if keycode:
+            if self._display.keycode_to_keysym(keycode, 0) == keysym:
+                key = (keycode, False)
+            elif self._display.keycode_to_keysym(keycode, 1) == keysym:
+                key = (keycode, True)
+
+        self._chars[char] = key
+        return key
+
+    def flush(self):
+        if self._pending:
+            self._display.sync()
+            self._pending = False
+
+    def close(self):
+        self.flush()
+        self._display.close()
+
+
+class RecordingBackend(InputBackend):
+    """입력을 실제로 보내지 않고 기록만 하는 백엔드 (테스트/벤치마크용)"""
+
+    name = 'recording'
+
+    def __init__(self):
+        self.events = []
+        self.flush_count = 0
+
+    def click(self, x, y, button='left', clicks=1):
+        self.events.append(('click', x, y, button, clicks))
+
+    def press(self, key):
+        self.events.append(('press', key))
+
+    def hotkey(self, *keys):
+        self.events.append(('hotkey',) + tuple(keys))
+
+    def can_type(self, text):
+        return True
+
+    def type_text(self, text):
+        self.events.append(('type', text))
+
+    def flush(self):
+        self.flush_count += 1
+
+
+def create_input_backend(name='pyautogui'):
+    """설정 이름으로 입력 백엔드 생성 (사용할 수 없으면 pyautogui로 대체)"""
+    if name == 'xtest':
+        try:
+            return XTestBackend()
+        except Exception as e:
+            print(f"⚠️ XTest 입력을 사용할 수 없습니다: {e} - pyautogui 사용")
+            return PyAutoGUIBackend()
+
+    if name == 'recording':
+        return RecordingBackend()
+
+    if name != 'pyautogui':
+        print(f"⚠️ 알 수 없는 입력 방식: {name} - pyautogui 사용")
+    return PyAutoGUIBackend()
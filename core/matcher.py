@@ -0,0 +1,236 @@
+"""
+템플릿 매칭 엔진 (OpenCV 기반)
+"""
+import time
+import zlib
+import cv2
+import numpy as np
+from core.screen_capture import screen_capture
+
+
+# 이미지 클릭/대기 공통 기본 정확도
+DEFAULT_CONFIDENCE = 0.8
+
+# 피라미드 매칭: 축소 템플릿 최소 크기 (px) - 이보다 작으면 전체 검색
+PYRAMID_MIN_SIZE = 8
+# 피라미드 매칭: 원본 해상도에서 재검사할 후보 수
+PYRAMID_CANDIDATES = 3
+
+# 화면 변화 감지: 축소 배율 (px - 이 크기 블록의 평균으로 해시해서 모든 픽셀 변화가 반영됨)
+CHANGE_SAMPLE_STEP = 2
+
+
+class TemplateMatcher:
+    """캡처된 화면과 캐시된 템플릿을 비교하는 매칭 엔진"""
+
+    @staticmethod
+    def to_gray(frame):
+        """프레임을 그레이스케일로 변환 (GRAY/BGR/BGRA 지원)"""
+        if frame.ndim == 2:
+            return frame
+        if frame.shape[2] == 4:
+            return cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+    @staticmethod
+    def to_color(frame):
+        """프레임을 BGR 컬러로 변환"""
+        if frame.ndim == 2:
+            return cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        if frame.shape[2] == 4:
+            return cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        return frame
+
+    @staticmethod
+    def build_pyramid(template, scale):
+        """축소 템플릿 생성 후 템플릿 캐시에 보관
+
+        Returns:
+            {'gray', 'color', 'size'} 또는 너무 작아 사용할 수 없으면 None
+        """
+        pyramid = template.setdefault('pyramid', {})
+        if scale in pyramid:
+            return pyramid[scale]
+
+        w, h = template['size']
+        small_w, small_h = int(w * scale), int(h * scale)
+        if min(small_w, small_h) < PYRAMID_MIN_SIZE:
+            pyramid[scale] = None
+            return None
+
+        pyramid[scale] = {
+            'gray': cv2.resize(template['gray'], (small_w, small_h), interpolation=cv2.INTER_AREA),
+            'color': cv2.resize(template['color'], (small_w, small_h), interpolation=cv2.INTER_AREA),
+            'size': (small_w, small_h)
+        }
+        return pyramid[scale]
+
+    @staticmethod
+    def _match_exhaustive(haystack, needle):
+        """원본 해상도 전체 검색 -> (점수, (x, y))"""
+        res = cv2.matchTemplate(haystack, needle, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        return max_val, max_loc
+
+    @staticmethod
+    def _match_pyramid(haystack, needle, small_needle, scale):
+        """축소 해상도에서 후보를 찾고 원본 해상도에서 후보 주변만 재검사 -> (점수, (x, y))"""
+        small_haystack = cv2.resize(haystack, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        small_h, small_w = small_needle.shape[:2]
+        if small_haystack.shape[0] < small_h or small_haystack.shape[1] < small_w:
+            return TemplateMatcher._match_exhaustive(haystack, needle)
+
+        res = cv2.matchTemplate(small_haystack, small_needle, cv2.TM_CCOEFF_NORMED)
+
+        h, w = needle.shape[:2]
+        frame_h, frame_w = haystack.shape[:2]
+        pad = int(round(1 / scale)) + 2
+
+        best_val, best_loc = -1.0, (0, 0)
+        for _ in range(PYRAMID_CANDIDATES):
+            _, cand_val, _, cand_loc = cv2.minMaxLoc(res)
+            if cand_val <= -1.0:
+                break
+
+            # 같은 후보가 다시 뽑히지 않도록 주변 억제
+            sx, sy = cand_loc
+            res[max(sy - small_h // 2, 0):sy + small_h // 2 + 1,
+                max(sx - small_w // 2, 0):sx + small_w // 2 + 1] = -1.0
+
+            # 원본 해상도에서 후보 주변 재검사
+            x0 = max(int(sx / scale) - pad, 0)
+            y0 = max(int(sy / scale) - pad, 0)
+            x1 = min(int(sx / scale) + pad + w, frame_w)
+            y1 = min(int(sy / scale) + pad + h, frame_h)
+            if x1 - x0 < w or y1 - y0 < h:
+                continue
+
+            roi_res = cv2.matchTemplate(haystack[y0:y1, x0:x1], needle, cv2.TM_CCOEFF_NORMED)
+            _, roi_val, _, roi_loc = cv2.minMaxLoc(roi_res)
+            if roi_val > best_val:
+                best_val, best_loc = roi_val, (x0 + roi_loc[0], y0 + roi_loc[1])
+
+        return best_val, best_loc
+
+    @staticmethod
+    def match_template(frame, template, confidence=DEFAULT_CONFIDENCE, grayscale=True, origin=(0, 0),
+                       pyramid_scale=None):
+        """프레임에서 템플릿 찾기
+
+        Args:
+            frame: 캡처된 화면 (numpy 배열, GRAY/BGR/BGRA)
+            template: ImageManager.get_template() 결과
+            confidence: 매칭 정확도 기준 (0.0 ~ 1.0)
+            grayscale: True면 그레이스케일, False면 컬러 매칭
+            origin: 프레임 좌상단의 화면 좌표 (영역 캡처 시)
+            pyramid_scale: 피라미드 매칭 축소 비율 (예: 0.5, None이면 전체 검색)
+
+        Returns:
+            {'found', 'score', 'left', 'top', 'width', 'height', 'x', 'y', 'elapsed'}
+            (x, y는 화면 기준 중심 좌표)
+        """
+        start_time = time.perf_counter()
+        w, h = template['size']
+
+        result = {
+            'found': False,
+            'score': 0.0,
+            'left': None,
+            'top': None,
+            'width': w,
+            'height': h,
+            'x': None,
+            'y': None,
+            'elapsed': 0.0
+        }
+
+        # 템플릿이 프레임보다 크면 매칭 불가
+        if frame.shape[0] < h or frame.shape[1] < w:
+            result['elapsed'] = time.perf_counter() - start_time
+            return result
+
+        channel = 'gray' if grayscale else 'color'
+        if grayscale:
+            haystack = TemplateMatcher.to_gray(frame)
+        else:
+            haystack = TemplateMatcher.to_color(frame)
+        needle = template[channel]
+
+        small = None
+        if pyramid_scale and 0 < pyramid_scale < 1:
+            small = TemplateMatcher.build_pyramid(template, pyramid_scale)
+
+        if small is not None:
+            max_val, max_loc = TemplateMatcher._match_pyramid(haystack, needle, small[channel], pyramid_scale)
+        else:
+            max_val, max_loc = TemplateMatcher._match_exhaustive(haystack, needle)
+
+        left = origin[0] + max_loc[0]
+        top = origin[1] + max_loc[1]
+        result.update({
+            'found': max_val >= confidence,
+            'score': float(max_val),
+            'left': left,
+            'top': top,
+            'x': left + w // 2,
+            'y': top + h // 2,
+            'elapsed': time.perf_counter() - start_time
+        })
+        return result
+
+    @staticmethod
+    def crop(frame, origin, region):
+        """프레임에서 화면 좌표 영역 잘라내기 (복사 없음)
+
+        Returns:
+            (잘라낸 프레임, 새 origin) 또는 겹치지 않으면 None
+        """
+        x, y, w, h = region
+        frame_h, frame_w = frame.shape[:2]
+
+        x0 = max(x - origin[0], 0)
+        y0 = max(y - origin[1], 0)
+        x1 = min(x + w - origin[0], frame_w)
+        y1 = min(y + h - origin[1], frame_h)
+
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return frame[y0:y1, x0:x1], (origin[0] + x0, origin[1] + y0)
+
+    @staticmethod
+    def locate_in_frame(frame, origin, template, confidence=DEFAULT_CONFIDENCE, grayscale=True, region=None,
+                        pyramid_scale=None):
+        """이미 캡처된 프레임에서 템플릿 찾기 (region이 있으면 해당 영역만)"""
+        if region is not None:
+            cropped = TemplateMatcher.crop(frame, origin, region)
+            if cropped is None:
+                raise ValueError("검색 영역이 캡처 범위 밖에 있습니다.")
+            frame, origin = cropped
+
+        result = TemplateMatcher.match_template(frame, template, confidence, grayscale, origin, pyramid_scale)
+        result['capture_elapsed'] = 0.0
+        return result
+
+    @staticmethod
+    def frame_signature(frame, step=CHANGE_SAMPLE_STEP):
+        """화면 변화 감지용 프레임 해시 (step 크기 블록 평균으로 축소한 화면의 CRC32)
+
+        픽셀을 건너뛰며 샘플링하면 캐럿/얇은 테두리 같은 1~3px 변화를 놓칠 수 있어
+        INTER_AREA로 모든 픽셀을 평균한 축소 화면을 해시합니다.
+        """
+        height, width = frame.shape[:2]
+        size = (max(width // step, 1), max(height // step, 1))
+        sample = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return zlib.crc32(np.ascontiguousarray(sample))
+
+    @staticmethod
+    def locate_on_screen(template, confidence=DEFAULT_CONFIDENCE, grayscale=True, region=None,
+                         pyramid_scale=None):
+        """화면(또는 영역)을 캡처하여 템플릿 찾기 (캡처 시간 포함)"""
+        start_time = time.perf_counter()
+        frame, origin = screen_capture.grab(region)
+        capture_time = time.perf_counter() - start_time
+
+        result = TemplateMatcher.match_template(frame, template, confidence, grayscale, origin, pyramid_scale)
+        result['capture_elapsed'] = capture_time
+        return result
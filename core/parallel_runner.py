@@ -0,0 +1,231 @@
+"""
+엑셀 행 병렬 실행 코디네이터 (가상 화면별 워커 프로세스)
+"""
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+
+# 워커가 stdout으로 보내는 이벤트 줄 접두사 (그 외 줄은 일반 로그)
+EVENT_PREFIX = '@@pymacro '
+
+# Xvfb 기본 화면 크기
+XVFB_SCREEN = '1920x1080x24'
+XVFB_START_TIMEOUT = 5.0
+
+
+class ParallelRunner:
+    """엑셀 행 범위를 나눠 화면(DISPLAY)마다 명령줄 워커를 실행하고 결과를 모으는 클래스"""
+
+    def __init__(self, project_path, displays, start_row, end_row, worker_args=None,
+                 xvfb=False, xvfb_screen=XVFB_SCREEN, log_dir='logs'):
+        self.project_path = project_path
+        self.displays = displays
+        self.start_row = start_row
+        self.end_row = end_row
+        self.worker_args = worker_args or []
+        self.xvfb = xvfb
+        self.xvfb_screen = xvfb_screen
+        self.log_dir = log_dir
+
+        self.workers = []
+        self.row_results = {}  # 행 번호 -> 결과
+        self.stopped = False
+        self._lock = threading.Lock()
+        self._xvfb_processes = []
+
+        self.log_callback = None
+        self.progress_callback = None
+
+    def set_callbacks(self, log_cb=None, progress_cb=None):
+        """콜백 함수 설정"""
+        self.log_callback = log_cb
+        self.progress_callback = progress_cb
+
+    def log(self, message):
+        """로그 출력"""
+        log_msg = f"[{datetime.now().strftime('%H:%M:%S')}] {message}"
+        print(log_msg)
+        if self.log_callback:
+            self.log_callback(log_msg)
+
+    @staticmethod
+    def shard_rows(start_row, end_row, count):
+        """행 범위(1부터, 마지막 포함)를 연속 구간 count개로 나누기"""
+        total = end_row - start_row + 1
+        count = max(1, min(count, total))
+        size, extra = divmod(total, count)
+
+        shards = []
+        row = start_row
+        for i in range(count):
+            rows = size + (1 if i < extra else 0)
+            shards.append((row, row + rows - 1))
+            row += rows
+        return shards
+
+    def _start_xvfb(self, display):
+        """가상 화면 실행 후 준비될 때까지 대기"""
+        if not shutil.which('Xvfb'):
+            raise Exception("Xvfb를 찾을 수 없습니다.")
+
+        process = subprocess.Popen(
+            ['Xvfb', display, '-screen', '0', self.xvfb_screen, '-nolisten', 'tcp'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # 터미널 Ctrl+C가 가상 화면까지 종료하지 않도록 별도 프로세스 그룹
+        )
+        self._xvfb_processes.append(process)
+
+        socket_path = f"/tmp/.X11-unix/X{display.lstrip(':').split('.')[0]}"
+        deadline = time.time() + XVFB_START_TIMEOUT
+        while not os.path.exists(socket_path):
+            if process.poll() is not None or time.time() > deadline:
+                raise Exception(f"Xvfb {display} 시작 실패")
+            time.sleep(0.05)
+        self.log(f"🖥️ Xvfb {display} 시작 ({self.xvfb_screen})")
+
+    def _spawn(self, index, display, rows):
+        """워커 프로세스 실행"""
+        log_file = os.path.join(self.log_dir, f"worker_{index + 1}.log")
+        command = [
+            sys.executable, '-m', 'pymacro', 'run', self.project_path,
+            '--mode', 'excel_loop',
+            '--start-row', str(rows[0]),
+            '--end-row', str(rows[1]),
+            '--no-save',
+            '--no-checkpoint',
+            '--events',
+            '--log-file', log_file
+        ] + self.worker_args
+
+        env = dict(os.environ, DISPLAY=display, PYTHONUNBUFFERED='1')
+        process = subprocess.Popen(
+            command,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            # 별도 프로세스 그룹 - Ctrl+C는 조정 프로세스만 받고, 워커 중지는 stop()이 한 번만 보냄
+            start_new_session=True
+        )
+
+        worker = {
+            'index': index,
+            'display': display,
+            'rows': rows,
+            'process': process,
+            'log_file': log_file,
+            'done': 0,
+            'errors': 0,
+            'exit_code': None
+        }
+        worker['reader'] = threading.Thread(target=self._read_events, args=(worker,), daemon=True)
+        worker['reader'].start()
+        self.workers.append(worker)
+        self.log(f"🚀 워커 {index + 1} 시작: {display} 행 {rows[0]}~{rows[1]}")
+
+    def _read_events(self, worker):
+        """워커 stdout에서 행 결과 이벤트 수집"""
+        for line in worker['process'].stdout:
+            if not line.startswith(EVENT_PREFIX):
+                continue
+            try:
+                event = json.loads(line[len(EVENT_PREFIX):])
+            except ValueError:
+                continue
+            if event.get('event') != 'row':
+                continue
+
+            result = dict(event['result'], display=worker['display'])
+            with self._lock:
+                self.row_results[result['row']] = result
+                worker['done'] += 1
+                if result['status'] == 'error':
+                    worker['errors'] += 1
+                    self.log(f"❌ [{worker['display']}] 행 {result['row']}: {result['error']}")
+                done = len(self.row_results)
+
+            if self.progress_callback:
+                self.progress_callback(done, self.end_row - self.start_row + 1, f"행 {done}개 처리")
+
+    def stop(self):
+        """모든 워커에 중지 요청 (워커는 진행 중인 행을 정리하고 종료)"""
+        self.stopped = True
+        self.log("⏹️ 모든 워커 중지 요청")
+        for worker in self.workers:
+            if worker['process'].poll() is None:
+                worker['process'].send_signal(signal.SIGTERM)
+
+    def run(self):
+        """병렬 실행 후 보고서 반환"""
+        os.makedirs(self.log_dir, exist_ok=True)
+        shards = self.shard_rows(self.start_row, self.end_row, len(self.displays))
+        start_time = time.time()
+
+        self.log(f"📊 병렬 실행: 행 {self.start_row}~{self.end_row}, 워커 {len(shards)}개")
+        try:
+            for index, rows in enumerate(shards):
+                display = self.displays[index]
+                if self.xvfb:
+                    self._start_xvfb(display)
+                self._spawn(index, display, rows)
+
+            for worker in self.workers:
+                worker['exit_code'] = worker['process'].wait()
+                worker['reader'].join()
+                self.log(f"🏁 워커 {worker['index'] + 1} 종료 ({worker['display']}): "
+                         f"{worker['done']}행 처리, 오류 {worker['errors']}개, 종료 코드 {worker['exit_code']}")
+        finally:
+            for worker in self.workers:
+                if worker['process'].poll() is None:
+                    worker['process'].kill()
+            for process in self._xvfb_processes:
+                process.terminate()
+
+        return self.build_report(time.time() - start_time)
+
+    def build_report(self, elapsed):
+        """워커별/행별 결과 보고서"""
+        rows = []
+        for row in range(self.start_row, self.end_row + 1):
+            rows.append(self.row_results.get(row, {'row': row, 'status': 'missing', 'error': None}))
+
+        summary = {}
+        for result in rows:
+            summary[result['status']] = summary.get(result['status'], 0) + 1
+
+        return {
+            'project': self.project_path,
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'elapsed': round(elapsed, 1),
+            'stopped': self.stopped,
+            'summary': summary,
+            'workers': [
+                {
+                    'display': worker['display'],
+                    'rows': list(worker['rows']),
+                    'done': worker['done'],
+                    'errors': worker['errors'],
+                    'exit_code': worker['exit_code'],
+                    'log_file': worker['log_file']
+                }
+                for worker in self.workers
+            ],
+            'rows': rows
+        }
+
+    @staticmethod
+    def save_report(report, filepath):
+        """보고서 JSON 저장"""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,73 @@
+"""
+화면 대기 폴링 스케줄
+"""
+
+
+# 폴링 방식: 고정 간격 / 지수 백오프 / 처음 1초는 빠르게
+POLL_STRATEGIES = ('fixed', 'backoff', 'fast_first')
+
+DEFAULT_POLL_SETTINGS = {
+    'strategy': 'fixed',
+    'interval': 0.5,       # 기본 간격 (fixed, fast_first 이후)
+    'min_interval': 0.1,   # 최소 간격 (backoff 시작, fast_first 초반, 화면 변화 직후)
+    'max_interval': 2.0,   # backoff 최대 간격
+    'factor': 1.5,         # backoff 증가 배율
+    'fast_period': 1.0     # fast_first 빠른 구간 (초)
+}
+
+
+class PollSchedule:
+    """대기 폴링 간격 계산 클래스"""
+
+    def __init__(self, **settings):
+        config = dict(DEFAULT_POLL_SETTINGS)
+        config.update({k: v for k, v in settings.items() if k in DEFAULT_POLL_SETTINGS and v is not None})
+
+        if config['strategy'] not in POLL_STRATEGIES:
+            print(f"⚠️ 알 수 없는 폴링 방식: {config['strategy']} - fixed 사용")
+            config['strategy'] = 'fixed'
+
+        self.strategy = config['strategy']
+        self.interval = float(config['interval'])
+        self.min_interval = min(float(config['min_interval']), self.interval)
+        self.max_interval = max(float(config['max_interval']), self.interval)
+        self.factor = float(config['factor'])
+        self.fast_period = float(config['fast_period'])
+
+        self._current = self.min_interval
+
+    @classmethod
+    def from_settings(cls, params, execution_settings):
+        """프로젝트 설정(settings.execution.poll)에 액션 설정(params.poll)을 덮어써서 생성"""
+        settings = dict(execution_settings.get('poll', {}))
+        settings.update(params.get('poll', {}))
+        return cls(**settings)
+
+    def next_interval(self, elapsed):
+        """화면 변화가 없을 때 다음 폴링까지 대기 시간
+
+        Args:
+            elapsed: 대기 시작 후 경과 시간 (초)
+        """
+        if self.strategy == 'backoff':
+            interval = self._current
+            self._current = min(self._current * self.factor, self.max_interval)
+            return interval
+
+        if self.strategy == 'fast_first' and elapsed < self.fast_period:
+            return self.min_interval
+
+        return self.interval
+
+    def on_change(self):
+        """화면 변화 감지 직후 다음 폴링까지 대기 시간 (백오프 초기화)"""
+        self._current = self.min_interval
+        return self.min_interval
+
+    def describe(self):
+        """로그용 설명"""
+        if self.strategy == 'backoff':
+            return f"backoff {self.min_interval}~{self.max_interval}초 x{self.factor}"
+        if self.strategy == 'fast_first':
+            return f"fast_first {self.min_interval}초({self.fast_period}초간) → {self.interval}초"
+        return f"fixed {self.interval}초"
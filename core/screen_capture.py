@@ -0,0 +1,80 @@
+"""
+화면 캡처 서비스 (mss 기반, PIL 변환 없음)
+"""
+import threading
+import mss
+import numpy as np
+
+
+class ScreenCapture:
+    """스레드별 mss 인스턴스를 유지하는 화면 캡처 클래스"""
+
+    def __init__(self):
+        # mss 핸들은 생성한 스레드에서만 사용 가능하므로 스레드별로 보관
+        self._local = threading.local()
+
+    def _get_session(self):
+        """현재 스레드의 mss 인스턴스 (없으면 생성)"""
+        sct = getattr(self._local, 'sct', None)
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+        return sct
+
+    def screen_bounds(self):
+        """전체 화면 영역 (x, y, w, h) - 모든 모니터 포함"""
+        monitor = self._get_session().monitors[0]
+        return monitor['left'], monitor['top'], monitor['width'], monitor['height']
+
+    def clip_region(self, region):
+        """영역을 화면 범위로 자르기 (겹치지 않으면 None)"""
+        sx, sy, sw, sh = self.screen_bounds()
+        x, y, w, h = region
+
+        left = max(x, sx)
+        top = max(y, sy)
+        right = min(x + w, sx + sw)
+        bottom = min(y + h, sy + sh)
+
+        if right <= left or bottom <= top:
+            return None
+        return left, top, right - left, bottom - top
+
+    def grab(self, region=None):
+        """화면 캡처
+
+        Args:
+            region: (x, y, w, h) 캡처 영역 (None이면 전체 화면)
+
+        Returns:
+            (frame, (left, top)) - frame은 mss 버퍼를 그대로 참조하는
+            BGRA numpy 배열 (복사 없음), (left, top)은 프레임 좌상단의 화면 좌표
+        """
+        if region is None:
+            region = self.screen_bounds()
+        else:
+            region = self.clip_region(region)
+            if region is None:
+                raise ValueError("캡처 영역이 화면 밖에 있습니다.")
+
+        left, top, width, height = region
+        shot = self._get_session().grab({
+            'left': left,
+            'top': top,
+            'width': width,
+            'height': height
+        })
+
+        frame = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return frame, (left, top)
+
+    def close(self):
+        """현재 스레드의 mss 인스턴스 종료"""
+        sct = getattr(self._local, 'sct', None)
+        if sct is not None:
+            sct.close()
+            self._local.sct = None
+
+
+# 전역 캡처 인스턴스
+screen_capture = ScreenCapture()
@@ -0,0 +1,100 @@
+"""
+실행 속도 프로필 (액션 사이 기본 대기 시간 관리)
+"""
+import time
+
+
+# 실행 속도별 기본 대기 시간 배율
+SPEED_MULTIPLIERS = {
+    'slow': 1.5,
+    'normal': 1.0,
+    'fast': 0.5
+}
+
+# 액션별 기본 대기 시간 (초) - 액션 파라미터에 같은 이름이 있으면 그 값을 사용
+DEFAULT_DELAYS = {
+    'click_coord': {'pre_delay': 0.2, 'post_delay': 0.2},
+    'click_image': {'pre_delay': 0.2, 'post_delay': 0.2},
+    'type_text': {'clipboard_delay': 0.1, 'post_delay': 0.2},
+    'type_variable': {'clipboard_delay': 0.1, 'post_delay': 0.2},
+    'key_press': {'post_delay': 0.2},
+    'hotkey': {'post_delay': 0.2},
+    'paste': {'post_delay': 0.2},
+    'loop': {'restart_delay': 0.5},  # 엑셀 무한반복 회차 사이
+    'retry': {'backoff': 0.5, 'backoff_max': 8.0}  # 행 재시도 전 대기 (회차마다 배율만큼 증가)
+}
+
+# 재시도 대기 증가 배율 (settings.execution.retry_backoff_factor)
+RETRY_BACKOFF_FACTOR = 2.0
+
+
+class TimingProfile:
+    """속도 설정에 따라 기본 대기 시간을 계산하고, 실제로 잔 시간을 집계하는 클래스"""
+
+    def __init__(self, speed='normal', delays=None):
+        if speed not in SPEED_MULTIPLIERS:
+            print(f"⚠️ 알 수 없는 실행 속도: {speed} - normal 사용")
+            speed = 'normal'
+
+        self.speed = speed
+        self.multiplier = SPEED_MULTIPLIERS[speed]
+
+        # 프로젝트 단위 기본값 덮어쓰기 (settings.execution.delays)
+        self.delays = {action_type: dict(values) for action_type, values in DEFAULT_DELAYS.items()}
+        for action_type, values in (delays or {}).items():
+            self.delays.setdefault(action_type, {}).update(values)
+
+        # 대기 함수 (실행 엔진의 중지 가능한 대기로 교체됨, 일시정지된 시간을 반환)
+        self.sleep_func = time.sleep
+
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, execution_settings):
+        """프로젝트 실행 설정(settings.execution)으로 생성"""
+        return cls(execution_settings.get('speed', 'normal'), execution_settings.get('delays'))
+
+    def reset(self):
+        """대기 시간 집계 초기화"""
+        self.slept = 0.0
+        self.slept_by_name = {}
+
+    def delay(self, action_type, name, params=None):
+        """기본 대기 시간 계산 (초)
+
+        액션 파라미터 값 > 프로젝트 설정 > 기본값 순으로 기준값을 정하고 속도 배율을 곱합니다.
+        """
+        if params and params.get(name) is not None:
+            base = float(params[name])
+        else:
+            base = self.delays.get(action_type, {}).get(name, 0.0)
+        return max(base * self.multiplier, 0.0)
+
+    def wait(self, action_type, name, params=None):
+        """기본 대기 실행 및 집계"""
+        self._sleep(f"{action_type}.{name}", self.delay(action_type, name, params))
+
+    def backoff(self, attempt, factor=RETRY_BACKOFF_FACTOR):
+        """재시도 대기 시간 (attempt: 0부터, 회차마다 factor배 증가하고 backoff_max에서 멈춤)"""
+        seconds = self.delay('retry', 'backoff') * (max(float(factor), 1.0) ** attempt)
+        return min(seconds, self.delay('retry', 'backoff_max'))
+
+    def wait_backoff(self, attempt, factor=RETRY_BACKOFF_FACTOR):
+        """재시도 대기 실행 및 집계"""
+        self._sleep('retry.backoff', self.backoff(attempt, factor))
+
+    def _sleep(self, key, seconds):
+        """대기 후 이름별 집계"""
+        if seconds <= 0:
+            return
+
+        start_time = time.perf_counter()
+        paused = self.sleep_func(seconds) or 0.0  # 일시정지된 시간은 집계에서 제외
+        slept = time.perf_counter() - start_time - paused
+
+        self.slept += slept
+        self.slept_by_name[key] = self.slept_by_name.get(key, 0.0) + slept
+
+    def describe(self):
+        """로그용 설명"""
+        return f"{self.speed} (x{self.multiplier})"
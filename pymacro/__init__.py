@@ -0,0 +1,5 @@
+"""
+PyMacro 명령줄 실행기 (tkinter 없이 프로젝트 실행)
+
+사용법: python -m pymacro run project.json [옵션]
+"""
@@ -0,0 +1,284 @@
+"""
+명령줄 실행 진입점 - python -m pymacro run project.json
+
+종료 코드:
+    0   정상 완료
+    1   실행 중 오류 발생 (건너뛴 행 포함)
+    2   프로젝트 로드 실패 / 잘못된 옵션
+    130 사용자 중지 (Ctrl+C, SIGTERM)
+"""
+import argparse
+import json
+import os
+import signal
+import sys
+from datetime import datetime
+
+from core.config import config
+from core.project_manager import ProjectManager
+from core.coordinate_manager import CoordinateManager
+from core.excel_manager import ExcelManager
+from core.image_manager import ImageManager
+from core.flow_manager import FlowManager
+from core.executor import MacroExecutor, RETRY_FROM
+from core.polling import POLL_STRATEGIES
+from core.timing import SPEED_MULTIPLIERS
+from core.input_backend import INPUT_BACKENDS
+from core.clipboard import CLIPBOARD_CHANNELS
+from core.parallel_runner import ParallelRunner, EVENT_PREFIX, XVFB_SCREEN
+from core.checkpoint import RunCheckpoint
+from core.excel_manager import EXCEL_READ_MODES
+from core.failure_journal import FailureJournal
+from pymacro.signals import EXIT_OK, EXIT_ERRORS, EXIT_USAGE, EXIT_STOPPED, create_stop_handler
+
+
+EXECUTION_MODES = ('excel_loop', 'excel_failed', 'flow_repeat', 'infinite')
+ERROR_POLICIES = ('skip', 'stop', 'retry')
+
+# 병렬 실행 시 워커에 그대로 전달하는 옵션
+WORKER_OPTIONS = ('speed', 'on_error', 'retry_count', 'retry_from', 'poll',
+                  'input_backend', 'text_input', 'clipboard', 'excel_read_mode')
+
+
+def build_executor(project_data, filepath):
+    """프로젝트 데이터로 관리자들과 실행 엔진 생성 (실행 화면과 같은 구성)"""
+    coord_mgr = CoordinateManager()
+    coord_mgr.load_from_list(project_data.get('coordinates', []))
+
+    excel_mgr = ExcelManager()
+    excel_mgr.load_from_list(project_data.get('excel_sources', []))
+
+    image_mgr = ImageManager()
+    image_mgr.load_from_list(project_data.get('images', []))
+    image_mgr.preload_templates()
+
+    flow_mgr = FlowManager()
+    flow_mgr.load_from_list(project_data.get('flow_sequence', []))
+
+    return MacroExecutor(project_data, coord_mgr, excel_mgr, image_mgr, flow_mgr, filepath)
+
+
+def get_overrides(args):
+    """명령줄 옵션 -> 실행 설정 덮어쓰기 (프로젝트 파일에는 저장되지 않음)"""
+    overrides = {
+        'mode': args.mode,
+        'excel_start_row': args.start_row,
+        'excel_end_row': args.end_row,
+        'repeat_count': args.repeat,
+        'speed': args.speed,
+        'on_error': args.on_error,
+        'retry_count': args.retry_count,
+        'retry_from': args.retry_from,
+        'input_backend': args.input_backend,
+        'text_input': args.text_input,
+        'clipboard': args.clipboard,
+        'excel_read_mode': args.excel_read_mode
+    }
+    if args.poll:
+        overrides['poll'] = {'strategy': args.poll}
+    if args.excel_infinite_loop:
+        overrides['excel_infinite_loop'] = True
+    return {key: value for key, value in overrides.items() if value is not None}
+
+
+def create_parser():
+    """명령줄 옵션 정의"""
+    parser = argparse.ArgumentParser(prog='pymacro', description='PyMacro 프로젝트를 화면 없이 실행합니다.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help='프로젝트 실행')
+    run.add_argument('project', help='프로젝트 파일 (.json)')
+    run.add_argument('--mode', choices=EXECUTION_MODES, help='실행 모드')
+    run.add_argument('--start-row', type=int, help='엑셀 시작 행 (1부터)')
+    run.add_argument('--end-row', type=int, help='엑셀 마지막 행 (포함)')
+    run.add_argument('--repeat', type=int, help='플로우 반복 횟수 (flow_repeat 모드)')
+    run.add_argument('--excel-infinite-loop', action='store_true', help='엑셀 마지막 행 후 처음부터 반복')
+    run.add_argument('--speed', choices=list(SPEED_MULTIPLIERS), help='실행 속도')
+    run.add_argument('--on-error', choices=ERROR_POLICIES, help='행 오류 처리 방식')
+    run.add_argument('--retry-count', type=int, help='재시도 횟수 (on-error=retry)')
+    run.add_argument('--retry-from', choices=RETRY_FROM,
+                     help='재시도 시작 위치: row 처음 액션, action 실패한 액션, checkpoint 직전 재시도 지점')
+    run.add_argument('--poll', choices=POLL_STRATEGIES, help='이미지 대기 폴링 방식')
+    run.add_argument('--input-backend', choices=[name for name in INPUT_BACKENDS if name != 'recording'],
+                     help='마우스/키보드 입력 방식')
+    run.add_argument('--text-input', choices=('clipboard', 'direct'), help='텍스트 입력 방식')
+    run.add_argument('--clipboard', choices=CLIPBOARD_CHANNELS, help='클립보드 방식')
+    run.add_argument('--excel-read-mode', choices=EXCEL_READ_MODES,
+                     help='엑셀 읽기 방식: frame 전체 로드, stream 필요한 행만 순서대로, auto 큰 파일만 stream')
+    run.add_argument('--log-file', help='로그 파일 (stdout과 함께 기록)')
+    run.add_argument('--report', help='행별 결과 보고서 저장 경로 (.json)')
+    run.add_argument('--check', action='store_true', help='실행하지 않고 참조 오류만 확인')
+    run.add_argument('--no-save', action='store_true', help='위치 힌트/대기 기록을 저장하지 않고 실패 기록도 정리하지 않음')
+    run.add_argument('--resume', action='store_true', help='체크포인트가 있으면 이어서 실행 (excel_loop)')
+    run.add_argument('--no-checkpoint', action='store_true', help='체크포인트를 저장하지 않음')
+    run.add_argument('--events', action='store_true', help='행 결과를 stdout에 이벤트(JSON)로 출력 (병렬 워커용)')
+
+    parallel = run.add_argument_group('병렬 실행 (excel_loop)')
+    parallel.add_argument('--workers', type=int, default=1, help='워커 수 (화면마다 하나)')
+    parallel.add_argument('--displays', help='워커별 X 화면 목록 (예: :1,:2,:3 - 생략 시 :1부터)')
+    parallel.add_argument('--xvfb', action='store_true', help='워커마다 Xvfb 가상 화면 실행')
+    parallel.add_argument('--xvfb-screen', default=XVFB_SCREEN, help='Xvfb 화면 크기 (기본 1920x1080x24)')
+    return parser
+
+
+def save_report(report, filepath):
+    """결과 보고서 JSON 저장"""
+    ParallelRunner.save_report(report, filepath)
+    print(f"📄 결과 보고서: {filepath}")
+
+
+def run_parallel(args, project_data, project_path, report_path):
+    """행 범위를 화면별 워커로 나눠 실행"""
+    displays = args.displays.split(',') if args.displays else [f":{i + 1}" for i in range(args.workers)]
+    if args.displays and args.workers > 1 and len(displays) != args.workers:
+        print("❌ --workers 수와 --displays 개수가 다릅니다.", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.mode not in (None, 'excel_loop'):
+        print("❌ 병렬 실행은 excel_loop 모드만 지원합니다.", file=sys.stderr)
+        return EXIT_USAGE
+
+    sources = project_data.get('excel_sources', [])
+    if not sources:
+        print("❌ 병렬 실행에는 엑셀 데이터가 필요합니다.", file=sys.stderr)
+        return EXIT_USAGE
+
+    settings = project_data.get('settings', {}).get('execution', {})
+    start_row = args.start_row or settings.get('excel_start_row', 1)
+    end_row = args.end_row or settings.get('excel_end_row') or sources[0].get('row_count', 0)
+    if end_row < start_row:
+        print(f"❌ 처리할 행이 없습니다: {start_row}~{end_row}", file=sys.stderr)
+        return EXIT_USAGE
+
+    worker_args = []
+    for option in WORKER_OPTIONS:
+        value = getattr(args, option)
+        if value is not None:
+            worker_args += [f"--{option.replace('_', '-')}", str(value)]
+
+    log_dir = os.path.join(os.path.dirname(project_path), 'logs',
+                           f"parallel_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    runner = ParallelRunner(project_path, displays, start_row, end_row, worker_args,
+                            xvfb=args.xvfb, xvfb_screen=args.xvfb_screen, log_dir=log_dir)
+
+    signal.signal(signal.SIGINT, lambda signum, frame: runner.stop())
+    signal.signal(signal.SIGTERM, lambda signum, frame: runner.stop())
+
+    try:
+        report = runner.run()
+    except Exception as e:
+        print(f"❌ 병렬 실행 오류: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    save_report(report, report_path or os.path.join(log_dir, 'report.json'))
+    runner.log(f"📊 결과: {report['summary']} ({report['elapsed']}초)")
+
+    # 워커는 실패 행만 추가하고, 성공한 행 정리는 여기서 한 번에 (워커끼리 파일을 다시 쓰지 않도록)
+    if not args.no_save:
+        journal = FailureJournal(FailureJournal.get_path(project_path), RunCheckpoint.get_source(sources[0]))
+        journal.resolve([result['row'] for result in report['rows'] if result['status'] == 'ok'])
+
+    if runner.stopped:
+        return EXIT_STOPPED
+    failed = any(worker['exit_code'] != EXIT_OK for worker in report['workers'])
+    return EXIT_ERRORS if failed or report['summary'].get('missing') else EXIT_OK
+
+
+def run_project(args):
+    """프로젝트 실행 후 종료 코드 반환"""
+    # 작업 폴더가 바뀌기 전에 경로 확정
+    project_path = os.path.abspath(args.project)
+    log_path = os.path.abspath(args.log_file) if args.log_file else None
+    report_path = os.path.abspath(args.report) if args.report else None
+
+    # 엑셀/이미지 폴더는 앱 폴더 기준 (GUI 실행과 동일)
+    config.initialize()
+    os.chdir(config.app_path)
+    config.create_directories()
+
+    if not os.path.exists(project_path):
+        print(f"❌ 프로젝트 파일을 찾을 수 없습니다: {project_path}", file=sys.stderr)
+        return EXIT_USAGE
+
+    project_data = ProjectManager.load_project(project_path)
+    if project_data is None:
+        print(f"❌ 프로젝트를 불러올 수 없습니다: {project_path}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.workers > 1 or args.displays:
+        return run_parallel(args, project_data, project_path, report_path)
+
+    executor = build_executor(project_data, project_path)
+    executor.execution_overrides = get_overrides(args)
+    executor.save_state = not args.no_save
+    executor.checkpoint_enabled = not args.no_checkpoint
+
+    if args.resume:
+        checkpoint = RunCheckpoint.load(RunCheckpoint.get_path(project_path))
+        if checkpoint:
+            executor.resume_checkpoint = checkpoint
+        else:
+            print("ℹ️ 체크포인트가 없어 처음부터 실행합니다.")
+
+    if args.check:
+        errors = executor.compile_flow()
+        for error in errors:
+            print(f"❌ {error}")
+        if not errors:
+            print(f"✅ 액션 {len(executor.plan)}개 - 참조 오류 없음")
+        return EXIT_ERRORS if errors else EXIT_OK
+
+    log_file = open(log_path, 'a', encoding='utf-8') if log_path else None
+    if log_file:
+        log_file.write(f"\n===== {datetime.now().isoformat(timespec='seconds')} {project_path} =====\n")
+
+        def write_log(message):
+            log_file.write(message + '\n')
+            log_file.flush()
+
+        executor.log_callback = write_log
+
+    if args.events:
+        def emit_row(result):
+            print(EVENT_PREFIX + json.dumps({'event': 'row', 'result': result}, ensure_ascii=False), flush=True)
+
+        executor.row_callback = emit_row
+
+    handle_stop, stopped = create_stop_handler(executor)
+    signal.signal(signal.SIGINT, handle_stop)
+    signal.signal(signal.SIGTERM, handle_stop)
+
+    try:
+        executor.start()
+    finally:
+        if log_file:
+            log_file.close()
+
+    if report_path:
+        save_report({
+            'project': project_path,
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'stopped': bool(stopped),
+            'error_count': executor.error_count,
+            'rows': executor.row_results
+        }, report_path)
+
+    if stopped:
+        return EXIT_STOPPED
+    return EXIT_ERRORS if executor.error_count else EXIT_OK
+
+
+def main(argv=None):
+    """명령줄 진입점"""
+    parser = create_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        return run_project(args)
+
+    parser.print_help()
+    return EXIT_USAGE
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+종료 코드와 중지 시그널 처리 (표준 라이브러리만 사용 - 실행 엔진 없이 불러올 수 있음)
+"""
+import sys
+
+
+EXIT_OK = 0
+EXIT_ERRORS = 1
+EXIT_USAGE = 2
+EXIT_STOPPED = 130
+
+
+def create_stop_handler(executor):
+    """Ctrl+C / SIGTERM 핸들러 - 첫 번째는 정상 중지, 두 번째는 바로 종료 (종료 코드 130)
+
+    Returns:
+        (핸들러, 받은 시그널 목록)
+    """
+    stopped = []
+
+    def handle_stop(signum, frame):
+        if stopped:
+            sys.exit(EXIT_STOPPED)
+        stopped.append(signum)
+        executor.stop()
+
+    return handle_stop, stopped
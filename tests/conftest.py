@@ -0,0 +1,7 @@
+"""
+테스트 공통 설정 - 저장소 폴더를 import 경로에 추가
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,110 @@
+"""
+엑셀 반복 체크포인트 - 오류로 중지한 뒤 이어서 실행
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('openpyxl')
+pytest.importorskip('cv2')
+if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+    pytest.skip("pyautogui는 X 화면이 필요합니다.", allow_module_level=True)
+
+from core.checkpoint import RunCheckpoint
+from core.coordinate_manager import CoordinateManager
+from core.excel_cache import ExcelCache
+from core.excel_manager import ExcelManager
+from core.executor import MacroExecutor
+from core.flow_manager import FlowManager
+from core.image_manager import ImageManager
+from core.input_backend import RecordingBackend
+
+
+ROWS = 10
+
+
+class FailingBackend(RecordingBackend):
+    """지정한 텍스트를 입력할 때 오류를 내는 기록용 백엔드"""
+
+    def __init__(self, fail_texts=()):
+        super().__init__()
+        self.fail_texts = set(fail_texts)
+
+    def type_text(self, text):
+        if text in self.fail_texts:
+            raise Exception(f"입력 실패: {text}")
+        super().type_text(text)
+
+
+def build_executor(tmp_path, backend, on_error='stop'):
+    """CSV 한 컬럼을 타이핑하는 플로우의 실행 엔진"""
+    excel_mgr = ExcelManager()
+    excel_mgr.excel_folder = str(tmp_path)
+    excel_mgr.cache = ExcelCache(str(tmp_path / '.cache'))
+    excel_mgr.use_cache = False
+    excel_mgr.load_from_list([{
+        'id': 1, 'name': 'data', 'filepath': 'data.csv', 'sheet_name': 'data',
+        'columns': ['name'], 'row_count': ROWS
+    }])
+
+    flow_mgr = FlowManager()
+    flow_mgr.load_from_list([
+        {'id': 1, 'type': 'type_variable', 'params': {'var_type': 'excel', 'var_name': 'name'}}
+    ])
+
+    project_data = {'settings': {'execution': {
+        'mode': 'excel_loop',
+        'on_error': on_error,
+        'excel_read_mode': 'frame',
+        'text_input': 'direct',
+        'clipboard': 'pyperclip',
+        'failure_screenshot': False,
+        'checkpoint_interval': 1,
+        'delays': {'type_variable': {'post_delay': 0}}
+    }}}
+
+    executor = MacroExecutor(project_data, CoordinateManager(), excel_mgr, ImageManager(), flow_mgr,
+                             str(tmp_path / 'project.json'), input_backend=backend)
+    executor.save_state = False
+    return executor
+
+
+def typed(backend):
+    """백엔드에 입력된 텍스트 목록"""
+    return [event[1] for event in backend.events if event[0] == 'type']
+
+
+def test_stop_on_error_resumes_from_failed_row(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data.csv').write_text('name\n' + ''.join(f"v{i}\n" for i in range(1, ROWS + 1)), encoding='utf-8')
+
+    # 5행에서 오류 -> on_error=stop으로 중지
+    backend = FailingBackend(fail_texts={'v5'})
+    build_executor(tmp_path, backend).start()
+    assert typed(backend) == ['v1', 'v2', 'v3', 'v4']
+
+    checkpoint = RunCheckpoint.load(RunCheckpoint.get_path(str(tmp_path / 'project.json')))
+    assert checkpoint['last_completed_row'] == 4
+
+    # 이어서 실행하면 실패한 5행부터
+    backend = FailingBackend()
+    executor = build_executor(tmp_path, backend)
+    executor.resume_checkpoint = checkpoint
+    executor.start()
+    assert typed(backend) == [f"v{i}" for i in range(5, ROWS + 1)]
+
+
+def test_stop_on_first_row_saves_no_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'data.csv').write_text('name\n' + ''.join(f"v{i}\n" for i in range(1, ROWS + 1)), encoding='utf-8')
+
+    # 1행에서 오류 -> 완료한 행이 없으므로 체크포인트/저장 로그 없음
+    logs = []
+    executor = build_executor(tmp_path, FailingBackend(fail_texts={'v1'}))
+    executor.log_callback = logs.append
+    executor.start()
+
+    assert RunCheckpoint.load(RunCheckpoint.get_path(str(tmp_path / 'project.json'))) is None
+    assert not [message for message in logs if '체크포인트 저장' in message]
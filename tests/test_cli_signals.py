@@ -0,0 +1,41 @@
+"""
+명령줄 실행 - Ctrl+C / SIGTERM 처리
+"""
+import signal
+
+import pytest
+
+from pymacro.signals import EXIT_STOPPED, create_stop_handler
+
+
+class DummyExecutor:
+    """stop 호출 횟수만 세는 실행 엔진"""
+
+    def __init__(self):
+        self.stop_count = 0
+
+    def stop(self):
+        self.stop_count += 1
+
+
+def test_first_signal_stops_executor():
+    executor = DummyExecutor()
+    handle_stop, stopped = create_stop_handler(executor)
+
+    handle_stop(signal.SIGINT, None)
+
+    assert stopped == [signal.SIGINT]
+    assert executor.stop_count == 1
+
+
+def test_second_signal_exits_with_stopped_code():
+    executor = DummyExecutor()
+    handle_stop, stopped = create_stop_handler(executor)
+
+    handle_stop(signal.SIGINT, None)
+    with pytest.raises(SystemExit) as exc_info:
+        handle_stop(signal.SIGTERM, None)
+
+    assert exc_info.value.code == EXIT_STOPPED
+    assert executor.stop_count == 1
+    assert stopped == [signal.SIGINT]
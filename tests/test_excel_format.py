@@ -0,0 +1,29 @@
+"""
+엑셀 값 변환 - 컬럼 단위 변환과 값 단위 변환의 결과 일치
+"""
+from datetime import datetime
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from core.excel_format import format_series, format_value
+
+
+COLUMNS = [
+    pd.Series([1, 2, None, 3.5, 7.0], dtype=object),
+    pd.Series(['007', 7, None], dtype=object),
+    pd.Series([1.5, None, 2 ** 60], dtype=object),
+    pd.Series([datetime(2024, 1, 31), datetime(2024, 1, 31, 13, 5), None], dtype=object),
+]
+
+
+@pytest.mark.parametrize('fmt', [None, 'text', 'int', 'decimal:2', 'date:%Y.%m.%d'])
+@pytest.mark.parametrize('series', COLUMNS)
+def test_series_matches_values(series, fmt):
+    assert list(format_series(series, fmt)) == [format_value(value, fmt) for value in series]
+
+
+def test_datetime_column_uses_per_value_date_rule():
+    series = pd.Series([datetime(2024, 1, 31), datetime(2024, 1, 31, 13, 5), None], dtype='datetime64[ns]')
+    assert list(format_series(series)) == ['2024-01-31', '2024-01-31 13:05:00', '']
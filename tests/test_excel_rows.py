@@ -0,0 +1,128 @@
+"""
+엑셀/CSV 행 읽기 - 전체 로드와 스트리밍의 행 번호/값 일치
+"""
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('pandas')
+openpyxl = pytest.importorskip('openpyxl')
+
+from openpyxl.styles import Font
+
+from core.excel_cache import ExcelCache
+from core.excel_manager import ExcelManager
+
+
+# 중간에 빈 줄이 있는 CSV (데이터 행 인덱스 1이 빈 행)
+CSV_WITH_BLANK_LINE = 'id,name\n1,x\n\n3,z\n4,w\n'
+
+
+def create_manager(tmp_path, text=CSV_WITH_BLANK_LINE, columns=('id', 'name')):
+    """임시 폴더의 CSV 하나를 소스로 가진 엑셀 관리자 (캐시 없음)"""
+    (tmp_path / 'data.csv').write_text(text, encoding='utf-8')
+    return open_manager(tmp_path, 'data.csv', 'data', columns)
+
+
+def open_manager(tmp_path, filename, sheet_name, columns):
+    """임시 폴더의 파일 하나를 소스로 가진 엑셀 관리자 (캐시 없음)"""
+    excel_mgr = ExcelManager()
+    excel_mgr.excel_folder = str(tmp_path)
+    excel_mgr.cache = ExcelCache(str(tmp_path / '.cache'))
+    excel_mgr.use_cache = False
+    excel_mgr.load_from_list([{
+        'id': 1, 'name': 'data', 'filepath': filename, 'sheet_name': sheet_name,
+        'columns': list(columns), 'row_count': 4
+    }])
+    return excel_mgr
+
+
+def create_workbook(tmp_path):
+    """빈 행과 서식만 있는 끝 행이 있는 엑셀 파일"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = 'Sheet1'
+    sheet.append(['id', 'name', 'memo', 'unused'])
+    sheet.append([1, 'x', 'a', 'u'])
+    sheet.append([])
+    sheet.append([3, 'z', 'c', 'u'])
+    sheet.append([4, 'w', None, 'u'])
+    sheet.cell(row=8, column=2).font = Font(bold=True)
+    workbook.save(tmp_path / 'data.xlsx')
+
+
+def test_csv_stream_matches_frame_with_blank_line(tmp_path):
+    excel_mgr = create_manager(tmp_path)
+    first_row, frame = excel_mgr.load_records(1)
+    stream = [row for _, row in excel_mgr.iter_rows(1)]
+
+    assert first_row == 0
+    assert stream == frame
+    assert frame[1] == {'id': '', 'name': ''}
+    assert frame[2] == {'id': '3', 'name': 'z'}
+    assert [index for index, _ in excel_mgr.iter_rows(1, 2, 4)] == [2, 3]
+
+
+def test_csv_range_read_matches_full_read_with_blank_line(tmp_path):
+    full = create_manager(tmp_path).load_records(1)[1]
+    assert len(full) == 4
+
+    for start_row in range(len(full) + 1):
+        for end_row in range(start_row, len(full) + 1):
+            # 메모리에 남은 전체 로드 결과를 쓰지 않도록 범위마다 새 관리자
+            first_row, records = create_manager(tmp_path).load_records(1, start_row, end_row)
+            assert first_row == start_row
+            assert records == full[start_row:end_row]
+
+
+def test_csv_frame_keeps_text_as_written(tmp_path):
+    # auto 모드는 파일 크기로 전체 로드/스트리밍을 고르므로 두 방식의 값이 같아야 함
+    excel_mgr = create_manager(tmp_path, 'zip,amount\n01234,1.50\n,NA\n', columns=('zip', 'amount'))
+    frame = excel_mgr.load_records(1)[1]
+    stream = [row for _, row in excel_mgr.iter_rows(1)]
+
+    assert frame == [{'zip': '01234', 'amount': '1.50'}, {'zip': '', 'amount': 'NA'}]
+    assert stream == frame
+
+
+def test_xlsx_range_read_matches_full_read(tmp_path):
+    create_workbook(tmp_path)
+    columns = ('name', 'id')
+    full = open_manager(tmp_path, 'data.xlsx', 'Sheet1', columns).load_records(1)[1]
+
+    assert full == [{'name': 'x', 'id': '1'}, {'name': '', 'id': ''},
+                    {'name': 'z', 'id': '3'}, {'name': 'w', 'id': '4'}]
+    assert [row for _, row in open_manager(tmp_path, 'data.xlsx', 'Sheet1', columns).iter_rows(1, 0, 4)] == full
+
+    for start_row in range(len(full) + 1):
+        for end_row in range(start_row, len(full) + 1):
+            first_row, records = open_manager(tmp_path, 'data.xlsx', 'Sheet1', columns).load_records(
+                1, start_row, end_row)
+            assert first_row == start_row
+            assert records == full[start_row:end_row]
+
+    # 서식만 남은 끝 행은 범위에 포함해도 제외
+    assert open_manager(tmp_path, 'data.xlsx', 'Sheet1', columns).load_records(1, 2, 10) == (2, full[2:])
+
+
+def test_xlsx_frame_matches_stream(tmp_path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = 'Sheet1'
+    sheet.append(['code', 'joined', 'amount'])
+    sheet.append(['007', datetime(2024, 1, 31), 1.5])
+    sheet.append([12, datetime(2024, 2, 1, 13, 5), 3])
+    sheet.append([None, None, 2.0])
+    workbook.save(tmp_path / 'data.xlsx')
+
+    excel_mgr = open_manager(tmp_path, 'data.xlsx', 'Sheet1', ('code', 'joined', 'amount'))
+    excel_mgr.excel_sources[0]['column_formats'] = {'code': 'text'}
+    frame = excel_mgr.load_records(1)[1]
+    stream = [row for _, row in excel_mgr.iter_rows(1)]
+
+    assert frame == [
+        {'code': '007', 'joined': '2024-01-31', 'amount': '1.5'},
+        {'code': '12', 'joined': '2024-02-01 13:05:00', 'amount': '3'},
+        {'code': '', 'joined': '', 'amount': '2'}
+    ]
+    assert stream == frame
@@ -0,0 +1,34 @@
+"""
+실패 행 기록 - 엑셀 소스별 구분
+"""
+import json
+
+from core.failure_journal import FailureJournal
+
+
+SOURCE = {'filepath': 'data.xlsx', 'sheet_name': 'Sheet1'}
+OTHER_SHEET = {'filepath': 'data.xlsx', 'sheet_name': 'Sheet2'}
+
+
+def test_rows_of_other_sources_are_ignored(tmp_path):
+    path = str(tmp_path / 'project.failures.jsonl')
+    FailureJournal(path, SOURCE).add(3, '오류')
+    FailureJournal(path, OTHER_SHEET).add(7, '오류')
+    # 소스 정보가 없는 이전 형식 기록
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps({'row': 9, 'error': '오류'}) + '\n')
+
+    journal = FailureJournal(path, SOURCE)
+    assert journal.get_rows() == [3]
+    assert journal.count_other_sources() == 2
+    assert FailureJournal(path, OTHER_SHEET).get_rows() == [7]
+
+
+def test_resolve_keeps_other_sources(tmp_path):
+    path = str(tmp_path / 'project.failures.jsonl')
+    FailureJournal(path, SOURCE).add(7, '오류')
+    FailureJournal(path, OTHER_SHEET).add(7, '오류')
+
+    assert FailureJournal(path, SOURCE).resolve([7]) == 1
+    assert FailureJournal(path, SOURCE).get_rows() == []
+    assert FailureJournal(path, OTHER_SHEET).get_rows() == [7]
@@ -0,0 +1,25 @@
+"""
+화면 변화 감지 - 프레임 해시
+"""
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('cv2')
+pytest.importorskip('mss')
+
+from core.matcher import TemplateMatcher
+
+
+@pytest.mark.parametrize('x, y', [(0, 0), (1, 1), (3, 2), (101, 57)])
+def test_single_pixel_change_changes_signature(x, y):
+    frame = np.full((120, 160, 4), 240, np.uint8)
+    before = TemplateMatcher.frame_signature(frame)
+
+    frame[y, x] = (0, 0, 0, 255)
+
+    assert TemplateMatcher.frame_signature(frame) != before
+
+
+def test_same_frame_same_signature():
+    frame = np.random.default_rng(1).integers(0, 256, (90, 130, 4), dtype=np.uint8)
+    assert TemplateMatcher.frame_signature(frame) == TemplateMatcher.frame_signature(frame.copy())
@@ -0,0 +1,27 @@
+"""
+X11 XTest 입력 - pyautogui 키 이름 변환
+"""
+import os
+import sys
+
+import pytest
+
+if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+    pytest.skip("pyautogui는 X 화면이 필요합니다.", allow_module_level=True)
+
+pyautogui = pytest.importorskip('pyautogui')
+pytest.importorskip('Xlib')
+
+from core.input_backend import XTestBackend, XTEST_UNSUPPORTED_KEYS
+
+
+def test_pyautogui_keys_have_keysyms():
+    missing = [key for key in pyautogui.KEYBOARD_KEYS
+               if key not in XTEST_UNSUPPORTED_KEYS and not XTestBackend.key_keysym(key)]
+    assert missing == []
+
+
+@pytest.mark.parametrize('key', ['pause', 'print', 'prtsc', 'pgup', 'pgdn', 'numlock', 'scrolllock',
+                                 'hangul', 'hanja', 'num0', 'num9'])
+def test_editor_keys_have_keysyms(key):
+    assert XTestBackend.key_keysym(key)
@@ -4,7 +4,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime
-from utils.ui_helpers import set_dialog_icon, center_window_on_parent, center_window_on_screen
+from utils.ui_helpers import set_dialog_icon, center_window_on_parent, center_window_on_screen, select_screen_region
 
 class NewProjectDialog(tk.Toplevel):
     """새 프로젝트 생성 다이얼로그"""
@@ -493,11 +493,73 @@ class ActionSelectDialog(tk.Toplevel):
         
         self.wait_window(dialog)
 
+    def _create_region_selector(self, dialog):
+        """검색 영역 선택 위젯 생성 (이미지 액션용)
+        
+        Returns:
+            영역 관련 파라미터 dict를 반환하는 함수
+        """
+        region = [None]
+        
+        region_label = tk.Label(
+            dialog,
+            text="검색 영역: 이미지 기본값",
+            font=("맑은 고딕", 9),
+            fg='gray'
+        )
+        region_label.pack(anchor='w', padx=20)
+        
+        def on_select_region():
+            selected = select_screen_region(dialog)
+            if selected:
+                region[0] = list(selected)
+                x, y, w, h = selected
+                region_label.config(text=f"검색 영역: ({x}, {y}) {w}x{h}", fg='#27ae60')
+        
+        def on_clear_region():
+            region[0] = None
+            region_label.config(text="검색 영역: 이미지 기본값", fg='gray')
+        
+        btn_frame = tk.Frame(dialog)
+        btn_frame.pack(fill='x', padx=20, pady=(5, 0))
+        
+        tk.Button(
+            btn_frame,
+            text="🔲 영역 지정",
+            font=("맑은 고딕", 9),
+            command=on_select_region
+        ).pack(side='left')
+        
+        tk.Button(
+            btn_frame,
+            text="초기화",
+            font=("맑은 고딕", 9),
+            command=on_clear_region
+        ).pack(side='left', padx=5)
+        
+        fallback_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(
+            dialog,
+            text="영역에서 못 찾으면 전체 화면 검색",
+            variable=fallback_var,
+            font=("맑은 고딕", 9)
+        ).pack(anchor='w', padx=20)
+        
+        def get_params():
+            if not region[0]:
+                return {}
+            return {
+                'search_region': region[0],
+                'region_fallback': fallback_var.get()
+            }
+        
+        return get_params
+
 
     def __init__(self, parent, coord_mgr, excel_mgr, image_mgr):
         super().__init__(parent)
         self.title("액션 추가")
-        self.geometry("300x480")
+        self.geometry("300x520")
         self.resizable(False, False)
         
         self.coord_mgr = coord_mgr
@@ -640,6 +702,22 @@ class ActionSelectDialog(tk.Toplevel):
             width=12,
             command=lambda: self.select_action('wait_image')
         ).grid(row=0, column=1, padx=5, pady=5)
+        
+        tk.Button(
+            btn_frame,
+            text="여러 이미지 대기",
+            font=("맑은 고딕", 9),
+            width=12,
+            command=lambda: self.select_action('wait_images')
+        ).grid(row=1, column=0, padx=5, pady=5)
+        
+        tk.Button(
+            btn_frame,
+            text="재시도 지점",
+            font=("맑은 고딕", 9),
+            width=12,
+            command=lambda: self.select_action('retry_point')
+        ).grid(row=1, column=1, padx=5, pady=5)
 
 
         # 기타
@@ -682,8 +760,12 @@ class ActionSelectDialog(tk.Toplevel):
             params = self.config_delay()
         elif action_type == 'wait_image':
             params = self.config_wait_image()
+        elif action_type == 'wait_images':
+            params = self.config_wait_images()
         elif action_type == 'screenshot':
             params = self.config_screenshot()
+        elif action_type == 'retry_point':
+            params = {}  # 설정 없음
         if params is not None:
             self.result = {
                 'type': action_type,
@@ -746,9 +828,8 @@ class ActionSelectDialog(tk.Toplevel):
             result[0] = {
                 'coord_id': coord_id,
                 'click_type': 'left' if click_type == 'double' else click_type,
-                'click_count': click_count,
-                'pre_delay': 0.2,
-                'post_delay': 0.2
+                'click_count': click_count
+                # 지연은 저장하지 않음 - 프로젝트 지연 설정/기본값 사용
             }
             dialog.destroy()
         
@@ -789,7 +870,7 @@ class ActionSelectDialog(tk.Toplevel):
         
         dialog = tk.Toplevel(self)
         dialog.title("이미지 클릭 설정")
-        dialog.geometry("300x150")
+        dialog.geometry("300x270")
         dialog.transient(self)
         dialog.grab_set()
         dialog.attributes('-topmost', True)
@@ -815,6 +896,8 @@ class ActionSelectDialog(tk.Toplevel):
         image_combo.current(0)
         image_combo.pack(fill='x', padx=20, pady=(0, 15))
         
+        get_region_params = self._create_region_selector(dialog)
+        
         def on_ok():
             selected_idx = image_combo.current()
             image_id = self.image_mgr.images[selected_idx]['id']
@@ -822,6 +905,7 @@ class ActionSelectDialog(tk.Toplevel):
             result[0] = {
                 'image_id': image_id
             }
+            result[0].update(get_region_params())
             dialog.destroy()
         
         tk.Button(
@@ -1112,7 +1196,7 @@ class ActionSelectDialog(tk.Toplevel):
         
         dialog = tk.Toplevel(self)
         dialog.title("이미지 대기 설정")
-        dialog.geometry("300x230")
+        dialog.geometry("300x340")
         dialog.transient(self)
         dialog.grab_set()
         dialog.attributes('-topmost', True)
@@ -1148,6 +1232,8 @@ class ActionSelectDialog(tk.Toplevel):
         timeout_entry.insert(0, "10")
         timeout_entry.pack(fill='x', padx=20, pady=(0, 15))
         
+        get_region_params = self._create_region_selector(dialog)
+        
         def on_ok():
             selected_idx = image_combo.current()
             image_id = self.image_mgr.images[selected_idx]['id']
@@ -1157,6 +1243,7 @@ class ActionSelectDialog(tk.Toplevel):
                 'image_id': image_id,
                 'timeout': timeout
             }
+            result[0].update(get_region_params())
             dialog.destroy()
         
         tk.Button(
@@ -1187,6 +1274,99 @@ class ActionSelectDialog(tk.Toplevel):
         self.wait_window(dialog)
         return result[0]
 
+    def config_wait_images(self):
+        """여러 이미지 대기 설정"""
+        if not self.image_mgr.images:
+            self._show_error_dialog("등록된 이미지가 없습니다.")
+            return None
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("여러 이미지 대기 설정")
+        dialog.geometry("300x400")
+        dialog.transient(self)
+        dialog.grab_set()
+        dialog.attributes('-topmost', True)
+        set_dialog_icon(dialog)
+        
+        result = [None]
+        
+        tk.Label(
+            dialog,
+            text="이미지 선택 (여러 개):",
+            font=("맑은 고딕", 10, "bold")
+        ).pack(anchor='w', padx=20, pady=(20, 5))
+        
+        listbox = tk.Listbox(dialog, font=("맑은 고딕", 10), selectmode='multiple', height=6, exportselection=False)
+        for img in self.image_mgr.images:
+            listbox.insert(tk.END, f"{img['id']}. {img['name']}")
+        listbox.pack(fill='x', padx=20, pady=(0, 10))
+        
+        tk.Label(
+            dialog,
+            text="대기 조건:",
+            font=("맑은 고딕", 10, "bold")
+        ).pack(anchor='w', padx=20, pady=(5, 5))
+        
+        mode_var = tk.StringVar(value='any')
+        tk.Radiobutton(dialog, text="하나라도 나타나면", variable=mode_var, value='any').pack(anchor='w', padx=40)
+        tk.Radiobutton(dialog, text="모두 나타나면", variable=mode_var, value='all').pack(anchor='w', padx=40)
+        
+        tk.Label(
+            dialog,
+            text="최대 대기 시간 (초):",
+            font=("맑은 고딕", 10, "bold")
+        ).pack(anchor='w', padx=20, pady=(10, 5))
+        
+        timeout_entry = tk.Entry(dialog, font=("맑은 고딕", 10))
+        timeout_entry.insert(0, "10")
+        timeout_entry.pack(fill='x', padx=20, pady=(0, 15))
+        
+        def on_ok():
+            selection = listbox.curselection()
+            if not selection:
+                messagebox.showwarning("경고", "이미지를 하나 이상 선택하세요.", parent=dialog)
+                return
+            try:
+                timeout = float(timeout_entry.get())
+            except ValueError:
+                messagebox.showwarning("경고", "올바른 숫자를 입력하세요.", parent=dialog)
+                return
+            
+            result[0] = {
+                'image_ids': [self.image_mgr.images[idx]['id'] for idx in selection],
+                'mode': mode_var.get(),
+                'timeout': timeout
+            }
+            dialog.destroy()
+        
+        tk.Button(
+            dialog,
+            text="확인",
+            command=on_ok,
+            bg='#3498db',
+            fg='white',
+            padx=20,
+            pady=5
+        ).pack(pady=10)
+        
+        # 중앙 배치 및 포커스
+        dialog.update_idletasks()
+        width = dialog.winfo_width()
+        height = dialog.winfo_height()
+        parent_x = self.winfo_x()
+        parent_y = self.winfo_y()
+        parent_width = self.winfo_width()
+        parent_height = self.winfo_height()
+        x = parent_x + (parent_width - width) // 2
+        y = parent_y + (parent_height - height) // 2
+        dialog.geometry(f'{width}x{height}+{x}+{y}')
+        
+        dialog.lift()
+        dialog.focus_force()
+        
+        self.wait_window(dialog)
+        return result[0]
+
         
     def config_screenshot(self):
         """스크린샷 설정"""
@@ -4,7 +4,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 from datetime import datetime
-from utils.ui_helpers import set_dialog_icon, center_window_on_parent
+from utils.ui_helpers import set_dialog_icon, center_window_on_parent, select_screen_region
 
 from core.project_manager import ProjectManager
 from core.coordinate_manager import CoordinateManager
@@ -401,9 +401,10 @@ class ProjectEditor(tk.Frame):
             anchor='w'
         ).pack(anchor='w', fill='x')
         
+        region_text = " | 영역" if image.get('search_region') else ""
         tk.Label(
             info_frame,
-            text=f"정확도: {int(image['confidence']*100)}%",
+            text=f"정확도: {int(image['confidence']*100)}%{region_text}",
             font=("맑은 고딕", 8),
             fg='gray',
             bg='white',
@@ -420,6 +421,14 @@ class ProjectEditor(tk.Frame):
             width=3,
             command=lambda: self.delete_image(image['id'])
         ).pack(padx=(0,4))
+        
+        tk.Button(
+            btn_frame,
+            text="🔲",
+            font=("맑은 고딕", 7),
+            width=3,
+            command=lambda: self.set_image_region(image['id'])
+        ).pack(padx=(0,4), pady=(2,0))
     
     def refresh_flow_list(self):
         """플로우 목록 새로고침"""
@@ -707,7 +716,7 @@ class ProjectEditor(tk.Frame):
         """엑셀 추가 다이얼로그"""
         filepath = filedialog.askopenfilename(
             title="엑셀 파일 선택",
-            filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")]
+            filetypes=[("Excel files", "*.xlsx *.xls *.csv"), ("All files", "*.*")]
         )
         
         if not filepath:
@@ -1008,6 +1017,32 @@ class ProjectEditor(tk.Frame):
         else:
             messagebox.showerror("오류", "이미지를 추가할 수 없습니다.")
 
+    def set_image_region(self, image_id):
+        """이미지 기본 검색 영역 지정/해제"""
+        image = self.image_mgr.get_image(image_id)
+        if not image:
+            return
+        
+        if image.get('search_region'):
+            answer = messagebox.askyesnocancel(
+                "검색 영역",
+                "검색 영역이 지정되어 있습니다.\n\n예: 다시 지정\n아니오: 영역 해제 (전체 화면 검색)"
+            )
+            if answer is None:
+                return
+            if answer is False:
+                self.image_mgr.update_image(image_id, search_region=None, region_fallback=False)
+                self.refresh_image_list()
+                return
+        
+        region = select_screen_region(self.parent)
+        if not region:
+            return
+        
+        fallback = messagebox.askyesno("검색 영역", "영역에서 못 찾으면 전체 화면에서 다시 찾을까요?")
+        self.image_mgr.update_image(image_id, search_region=list(region), region_fallback=fallback)
+        self.refresh_image_list()
+    
     def delete_image(self, image_id):
         """이미지 삭제"""
         if messagebox.askyesno("확인", "이 이미지를 삭제하시겠습니까?"):
@@ -1086,6 +1121,8 @@ class ProjectEditor(tk.Frame):
             # 제어 동작 - 빨간색
             'delay': '#e74c3c',
             'wait_image': '#e74c3c',
+            'wait_images': '#e74c3c',
+            'retry_point': '#e74c3c',
 
             # 기타 - 노란색
             'screenshot': '#f39c12',
@@ -1109,6 +1146,8 @@ class ProjectEditor(tk.Frame):
             # 제어 동작
             'delay': '⏱️ 제어',
             'wait_image': '⏱️ 제어',
+            'wait_images': '⏱️ 제어',
+            'retry_point': '⏱️ 제어',
 
             # 기타
             'screenshot': '💾 기타',
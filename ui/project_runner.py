@@ -12,6 +12,11 @@ from core.excel_manager import ExcelManager
 from core.image_manager import ImageManager
 from core.flow_manager import FlowManager
 from core.executor import MacroExecutor
+from core.polling import POLL_STRATEGIES
+from core.timing import SPEED_MULTIPLIERS
+from core.input_backend import INPUT_BACKENDS
+from core.checkpoint import RunCheckpoint
+from core.failure_journal import FailureJournal
 
 class ProjectRunner(tk.Frame):
     def __init__(self, parent, app, project_data, filepath):
@@ -30,6 +35,7 @@ class ProjectRunner(tk.Frame):
         
         self.image_mgr = ImageManager()
         self.image_mgr.load_from_list(project_data.get('images', []))
+        self.image_mgr.preload_templates()
         
         self.flow_mgr = FlowManager()
         self.flow_mgr.load_from_list(project_data.get('flow_sequence', []))
@@ -382,10 +388,37 @@ class ProjectRunner(tk.Frame):
             return
         
         settings = self.project_data.get('settings', {}).get('execution', {})
-        if settings.get('mode') == 'excel_loop' and not self.excel_mgr.excel_sources:
+        if settings.get('mode') in ('excel_loop', 'excel_failed') and not self.excel_mgr.excel_sources:
             messagebox.showerror("오류", "엑셀 행 반복 모드는 엑셀 데이터가 필요합니다.")
             return
         
+        if settings.get('mode') == 'excel_failed':
+            source = RunCheckpoint.get_source(self.excel_mgr.excel_sources[0])
+            failed_rows = FailureJournal(FailureJournal.get_path(self.filepath), source).get_rows() if self.filepath else []
+            if not failed_rows:
+                messagebox.showinfo("알림", "다시 실행할 실패 행이 없습니다.")
+                return
+        
+        # 이전 실행 체크포인트가 있으면 이어서 실행할지 확인
+        self.executor.resume_checkpoint = None
+        if settings.get('mode') == 'excel_loop' and self.filepath:
+            checkpoint_path = RunCheckpoint.get_path(self.filepath)
+            checkpoint = RunCheckpoint.load(checkpoint_path)
+            if checkpoint and checkpoint.get('last_completed_row'):
+                answer = messagebox.askyesnocancel(
+                    "이어서 실행",
+                    f"이전 실행이 {checkpoint['last_completed_row']}행까지 완료된 상태로 중단되었습니다.\n"
+                    f"(저장 시각: {checkpoint.get('updated_at')}, 실패 행 {len(checkpoint.get('failed_rows', []))}개)\n\n"
+                    f"예: 체크포인트에서 이어서 실행\n"
+                    f"아니요: 처음부터 다시 실행"
+                )
+                if answer is None:
+                    return
+                if answer:
+                    self.executor.resume_checkpoint = checkpoint
+                else:
+                    RunCheckpoint.clear(checkpoint_path)
+        
         # 버튼 상태 변경
         self.start_btn.config(state='disabled')
         self.pause_btn.config(state='normal')
@@ -473,7 +506,7 @@ class ProjectRunner(tk.Frame):
         """설정 창"""
         dialog = tk.Toplevel(self.parent)
         dialog.title("실행 설정")
-        dialog.geometry("450x700")
+        dialog.geometry("450x930")
         dialog.transient(self.parent)
         dialog.grab_set()
         dialog.attributes('-topmost', True)
@@ -749,6 +782,7 @@ class ProjectRunner(tk.Frame):
         modes = [
             ('flow_repeat', '플로우 반복 실행'),
             ('excel_loop', '엑셀 행 반복'),
+            ('excel_failed', '엑셀 실패 행만 다시 실행'),
             ('infinite', '무한 반복 (중지할 때까지)')
         ]
         
@@ -806,6 +840,108 @@ class ProjectRunner(tk.Frame):
             bg='#F0F0F0'
         ).pack(anchor='w', padx=30, pady=(0, 10))
 
+        # 이미지 대기 폴링 방식
+        poll_frame = tk.LabelFrame(
+            dialog,
+            text="⏱️ 이미지 대기 폴링",
+            font=("맑은 고딕", 11, "bold"),
+            bg='#F0F0F0',
+            fg='#2c3e50',
+            padx=20,
+            pady=10,
+            relief='solid',
+            borderwidth=1
+        )
+        poll_frame.pack(fill='x', padx=20, pady=10)
+
+        poll_labels = {
+            'fixed': '고정 간격',
+            'backoff': '점점 느리게 (지수 백오프)',
+            'fast_first': '처음 1초 빠르게, 이후 느리게'
+        }
+        current_poll = self.project_data.get('settings', {}).get('execution', {}).get('poll', {})
+        poll_combo = ttk.Combobox(
+            poll_frame,
+            values=[poll_labels[strategy] for strategy in POLL_STRATEGIES],
+            font=("맑은 고딕", 9),
+            state='readonly'
+        )
+        current_strategy = current_poll.get('strategy', 'fixed')
+        poll_combo.current(POLL_STRATEGIES.index(current_strategy) if current_strategy in POLL_STRATEGIES
+                           else POLL_STRATEGIES.index('fixed'))
+        poll_combo.pack(fill='x', padx=10)
+
+        # 실행 속도 (액션 사이 기본 대기 시간 배율)
+        speed_frame = tk.Frame(dialog, bg='#F0F0F0')
+        speed_frame.pack(fill='x', padx=30, pady=(0, 10))
+
+        tk.Label(
+            speed_frame,
+            text="🏃 실행 속도:",
+            font=("맑은 고딕", 9, "bold"),
+            bg='#F0F0F0',
+            fg='#2c3e50'
+        ).pack(side='left')
+
+        speed_labels = {
+            'slow': '느리게 (대기 x1.5)',
+            'normal': '보통',
+            'fast': '빠르게 (대기 x0.5)'
+        }
+        speeds = list(SPEED_MULTIPLIERS)
+        current_speed = self.project_data.get('settings', {}).get('execution', {}).get('speed', 'normal')
+        speed_combo = ttk.Combobox(
+            speed_frame,
+            values=[speed_labels[speed] for speed in speeds],
+            font=("맑은 고딕", 9),
+            state='readonly',
+            width=20
+        )
+        speed_combo.current(speeds.index(current_speed) if current_speed in speeds else speeds.index('normal'))
+        speed_combo.pack(side='left', padx=10)
+
+        # 입력 방식 (xtest는 Linux X11 전용)
+        input_frame = tk.Frame(dialog, bg='#F0F0F0')
+        input_frame.pack(fill='x', padx=30, pady=(0, 10))
+
+        tk.Label(
+            input_frame,
+            text="🖱️ 입력 방식:",
+            font=("맑은 고딕", 9, "bold"),
+            bg='#F0F0F0',
+            fg='#2c3e50'
+        ).pack(side='left')
+
+        input_labels = {
+            'pyautogui': 'pyautogui (기본)',
+            'xtest': 'XTest 직접 입력 (Linux)'
+        }
+        input_backends = [name for name in INPUT_BACKENDS if name in input_labels]
+        current_input = self.project_data.get('settings', {}).get('execution', {}).get('input_backend', 'pyautogui')
+        input_combo = ttk.Combobox(
+            input_frame,
+            values=[input_labels[name] for name in input_backends],
+            font=("맑은 고딕", 9),
+            state='readonly',
+            width=20
+        )
+        input_combo.current(input_backends.index(current_input) if current_input in input_backends else 0)
+        input_combo.pack(side='left', padx=10)
+
+        # 텍스트 입력 방식
+        direct_typing_var = tk.BooleanVar(
+            value=self.project_data.get('settings', {}).get('execution', {}).get('text_input') == 'direct'
+        )
+        tk.Checkbutton(
+            dialog,
+            text="⌨️ 클립보드 대신 직접 타이핑 (XTest 입력 권장)",
+            variable=direct_typing_var,
+            font=("맑은 고딕", 9),
+            bg='#F0F0F0',
+            fg='#2c3e50',
+            selectcolor='white'
+        ).pack(anchor='w', padx=30, pady=(0, 10))
+
         def save_settings():
             # 단축키 저장
             if 'settings' not in self.project_data:
@@ -823,6 +959,12 @@ class ProjectRunner(tk.Frame):
             self.project_data['settings']['execution']['mode'] = mode_var.get()
             self.project_data['settings']['execution']['excel_infinite_loop'] = excel_infinite_var.get()
             
+            poll_settings = self.project_data['settings']['execution'].setdefault('poll', {})
+            poll_settings['strategy'] = POLL_STRATEGIES[poll_combo.current()]
+            self.project_data['settings']['execution']['speed'] = speeds[speed_combo.current()]
+            self.project_data['settings']['execution']['input_backend'] = input_backends[input_combo.current()]
+            self.project_data['settings']['execution']['text_input'] = 'direct' if direct_typing_var.get() else 'clipboard'
+            
             try:
                 repeat_count = int(repeat_entry.get())
                 self.project_data['settings']['execution']['repeat_count'] = repeat_count
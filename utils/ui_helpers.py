@@ -42,4 +42,24 @@ def center_window_on_screen(window):
     height = window.winfo_height()
     x = (window.winfo_screenwidth() // 2) - (width // 2)
     y = (window.winfo_screenheight() // 2) - (height // 2)
-    window.geometry(f'{width}x{height}+{x}+{y}')
\ No newline at end of file
+    window.geometry(f'{width}x{height}+{x}+{y}')
+
+def select_screen_region(dialog):
+    """화면 영역 드래그 선택 (선택 중에는 창을 숨김)
+
+    Returns:
+        (x, y, w, h) 또는 취소 시 None
+    """
+    from core.coordinate_manager import CoordinateManager
+
+    root = dialog.winfo_toplevel()._root()
+    dialog.withdraw()
+    try:
+        region = CoordinateManager.capture_region_with_overlay()
+    finally:
+        # 오버레이가 메인 창을 숨기므로 복원
+        root.deiconify()
+        dialog.deiconify()
+        dialog.lift()
+        dialog.focus_force()
+    return region